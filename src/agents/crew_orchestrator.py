@@ -13,7 +13,7 @@ from src.config import config
 from src.utils.logger import LoggerFactory, LoggingMixin
 from src.exceptions import (
     CrewAIExecutionError, CrewAITaskError, CrewAITimeoutError,
-    ProcessingError, ValidationError, TimeoutError
+    ProcessingError, ValidationError, RecoTimeoutError
 )
 
 from .market_data_agent import MarketDataAgent
@@ -264,7 +264,7 @@ class FinancialCrewOrchestrator(LoggingMixin):
                     self.log_warning(f"CrewAI execution timeout: {e}")
                     break
                     
-                except TimeoutError as e:
+                except RecoTimeoutError as e:
                     retry_count += 1
                     last_error = e
                     self.log_warning(f"Execution timeout: {e}")
@@ -63,6 +63,10 @@ class CrewAIConfig:
     MAX_RETRIES: int = 1
     MAX_ITERATIONS: int = 1
     TIMEOUT_SECONDS: int = 300
+    CREW_TIMEOUT_SECONDS: float = 30.0
+    CREW_QUEUE_TIMEOUT_SECONDS: float = 300.0
+    CIRCUIT_FAILURE_THRESHOLD: int = 5
+    CIRCUIT_RECOVERY_SECONDS: float = 60.0
     VERBOSE: bool = False
     MEMORY_ENABLED: bool = False
     PROCESS_TYPE: str = "sequential"
@@ -106,6 +110,7 @@ class ConversationConfig:
     MAX_MESSAGE_LENGTH: int = 1000
     MEMORY_RETENTION_HOURS: int = 24
     CONTEXT_WINDOW_SIZE: int = 10
+    HISTORY_WINDOW_TURNS: int = 6
     MAX_USER_PROFILES: int = 1000
 
 
@@ -5,6 +5,9 @@ This module provides specific exception types for different error scenarios
 to improve error handling and debugging.
 """
 
+import warnings
+from typing import Any
+
 
 class FinancialRecommendationError(Exception):
     """Base exception for financial recommendation system"""
@@ -51,6 +54,25 @@ class NetworkError(FinancialRecommendationError):
     pass
 
 
-class TimeoutError(FinancialRecommendationError):
+class RecoTimeoutError(FinancialRecommendationError):
     """Exception for timeout errors"""
-    pass 
\ No newline at end of file
+    pass
+
+
+# Former name that shadowed the TimeoutError builtin. It resolves lazily so it
+# never enters this module's namespace or star-imports.
+_RENAMED = {
+    "TimeoutError": "RecoTimeoutError"
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _RENAMED:
+        warnings.warn(
+            f"src.core.exceptions.{name} is deprecated; use {_RENAMED[name]}",
+            DeprecationWarning,
+            stacklevel=2
+        )
+        return globals()[_RENAMED[name]]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+ 
\ No newline at end of file
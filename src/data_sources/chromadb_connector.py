@@ -167,6 +167,21 @@ class ChromaDBConnector(BaseDataConnector):
             self._logger.error(f"Error executing query: {e}")
             return []
     
+    async def embed(self, text: str) -> List[float]:
+        """
+        Generate an embedding for the given text.
+        
+        Args:
+            text: Text to embed
+            
+        Returns:
+            List[float]: Embedding vector
+        """
+        if self._embedding_model is None:
+            raise RuntimeError("Embedding model not loaded; connect to ChromaDB first")
+        
+        return self._embedding_model.encode(text).tolist()
+    
     async def _search_products_structured(self, query: str, filters: Dict[str, Any], 
                                         limit: int, offset: int) -> List[Dict[str, Any]]:
         """
@@ -7,8 +7,11 @@ and query coordination.
 """
 
 import asyncio
+import concurrent.futures
 import logging
-from typing import Dict, Any, List, Optional, Union
+import os
+import types
+from typing import Dict, Any, List, Mapping, Optional, Union
 from datetime import datetime
 from enum import Enum
 
@@ -17,6 +20,31 @@ from .postgresql_connector import PostgreSQLConnector
 from .chromadb_connector import ChromaDBConnector
 from .neo4j_connector import Neo4jConnector
 from src.data.models import FinancialProduct, UserProfile, GraphNode, GraphRelationship
+from src.utils.semantic_cache import SemanticCache
+
+
+# Batches smaller than this are validated inline; process start-up and
+# pickling would cost more than the validation itself
+_PARALLEL_VALIDATION_THRESHOLD = 256
+
+# Query type served by each data source
+_SOURCE_QUERY_TYPES = {
+    DataSourceType.POSTGRESQL: QueryType.STRUCTURED,
+    DataSourceType.CHROMADB: QueryType.VECTOR,
+    DataSourceType.NEO4J: QueryType.GRAPH
+}
+
+# Default per-source weights for weighted fusion (read-only, shared by all managers)
+_FUSION_WEIGHTS: Mapping[DataSourceType, float] = types.MappingProxyType({
+    DataSourceType.POSTGRESQL: 0.4,  # Structured data
+    DataSourceType.CHROMADB: 0.4,    # Vector similarity
+    DataSourceType.NEO4J: 0.2        # Graph relationships
+})
+
+
+def _validate_product(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate a raw product payload (module-level so it can be pickled)"""
+    return FinancialProduct(**raw).model_dump()
 
 
 class FusionStrategy(str, Enum):
@@ -35,20 +63,44 @@ class DataManager:
     to structured, vector, and graph data with intelligent fusion.
     """
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self,
+                 config: Dict[str, Any],
+                 fusion_weights: Optional[Mapping[DataSourceType, float]] = None):
         """
         Initialize the data manager.
         
         Args:
             config: Configuration dictionary with data source settings
+            fusion_weights: Optional per-source weights overriding the weighted fusion defaults
         """
         self.config = config
         self._logger = logging.getLogger(__name__)
         
+        self._fusion_weights: Mapping[DataSourceType, float] = (
+            types.MappingProxyType(dict(fusion_weights)) if fusion_weights is not None else _FUSION_WEIGHTS
+        )
+        
         # Store connectors by source type
         self._connectors: Dict[DataSourceType, BaseDataConnector] = {}
         self._running = False
         
+        # Process pool for CPU-bound payload validation during bulk writes
+        self._validation_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        
+        # In-flight searches keyed like the search cache (single-flight)
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        
+        # Optional semantic cache for paraphrased search queries
+        self._semantic_cache: Optional[SemanticCache] = None
+        semantic_cache_config = self.config.get("semantic_cache", {})
+        if semantic_cache_config.get("enabled", False):
+            self._semantic_cache = SemanticCache(
+                max_entries=semantic_cache_config.get("max_entries", 1024),
+                max_hamming=semantic_cache_config.get("max_hamming", 8),
+                similarity_threshold=semantic_cache_config.get("similarity_threshold", 0.95),
+                ttl_seconds=semantic_cache_config.get("ttl_seconds")
+            )
+        
         # Initialize connectors based on configuration
         self._initialize_connectors()
     
@@ -57,7 +109,8 @@ class DataManager:
         try:
             # PostgreSQL connector
             if "postgresql" in self.config:
-                postgres_config = self.config["postgresql"]
+                postgres_config = {**PostgreSQLConnector.POOL_DEFAULTS, **self.config["postgresql"]}
+                self._check_pool_config(DataSourceType.POSTGRESQL, postgres_config)
                 self._connectors[DataSourceType.POSTGRESQL] = PostgreSQLConnector(postgres_config)
                 self._logger.info("PostgreSQL connector initialized")
             
@@ -69,7 +122,8 @@ class DataManager:
             
             # Neo4j connector
             if "neo4j" in self.config:
-                neo4j_config = self.config["neo4j"]
+                neo4j_config = {**Neo4jConnector.POOL_DEFAULTS, **self.config["neo4j"]}
+                self._check_pool_config(DataSourceType.NEO4J, neo4j_config)
                 self._connectors[DataSourceType.NEO4J] = Neo4jConnector(neo4j_config)
                 self._logger.info("Neo4j connector initialized")
             
@@ -79,6 +133,41 @@ class DataManager:
             self._logger.error(f"Error initializing connectors: {e}")
             raise
     
+    def _check_pool_config(self, source_type: DataSourceType, config: Dict[str, Any]) -> bool:
+        """
+        Check that a connector's pool settings can sustain concurrent queries.
+        
+        Args:
+            source_type: Data source being checked
+            config: Effective connector configuration
+            
+        Returns:
+            bool: True if the pool meets the recommended minimums
+        """
+        if source_type == DataSourceType.POSTGRESQL:
+            minimums = {
+                "min_size": PostgreSQLConnector.POOL_DEFAULTS["min_size"],
+                "max_size": PostgreSQLConnector.POOL_DEFAULTS["max_size"]
+            }
+        elif source_type == DataSourceType.NEO4J:
+            minimums = dict(Neo4jConnector.POOL_DEFAULTS)
+        else:
+            return True
+        
+        sufficient = True
+        for key, minimum in minimums.items():
+            value = config.get(key)
+            if value is None or value < minimum:
+                self._logger.warning(
+                    f"{source_type.value} pool setting {key}={value} is below "
+                    f"the recommended minimum of {minimum} for concurrent queries"
+                )
+                sufficient = False
+        
+        pool_settings = {key: config.get(key) for key in minimums}
+        self._logger.info(f"{source_type.value} effective pool settings: {pool_settings}")
+        return sufficient
+    
     async def start(self):
         """Start all data source connectors"""
         try:
@@ -89,6 +178,7 @@ class DataManager:
                 try:
                     await connector.connect()
                     self._logger.info(f"Connected to {source_type.value}")
+                    self._check_pool_config(source_type, connector.config)
                 except Exception as e:
                     self._logger.error(f"Failed to connect to {source_type.value}: {e}")
             
@@ -115,6 +205,10 @@ class DataManager:
                 except Exception as e:
                     self._logger.error(f"Error disconnecting from {source_type.value}: {e}")
             
+            if self._validation_pool is not None:
+                self._validation_pool.shutdown(wait=False)
+                self._validation_pool = None
+            
             self._running = False
             self._logger.info("Data manager stopped successfully")
             
@@ -133,6 +227,8 @@ class DataManager:
             if DataSourceType.NEO4J in self._connectors:
                 neo4j_connector = self._connectors[DataSourceType.NEO4J]
                 await neo4j_connector.create_graph_schema()
+                # Idempotent; only string timestamps left by earlier versions match
+                await neo4j_connector.migrate_product_timestamps()
             
             self._logger.info("Database schemas created successfully")
             
@@ -161,33 +257,93 @@ class DataManager:
         Returns:
             List[FinancialProduct]: Combined product results
         """
-        try:
-            if query_types is None:
-                query_types = [QueryType.STRUCTURED, QueryType.VECTOR, QueryType.GRAPH]
-            
-            # Collect results from each data source
-            all_results = {}
+        if query_types is None:
+            query_types = [QueryType.STRUCTURED, QueryType.VECTOR, QueryType.GRAPH]
+        
+        cache_scope = self._search_cache_scope(filters, query_types, fusion_strategy, limit, offset)
+        inflight_key = (query, cache_scope)
+        
+        # Single-flight: identical concurrent searches share one backend fan-out.
+        # No await happens between the lookup and the insert, so this is race-free.
+        # Every caller awaits the shared search through a shield, so a caller that
+        # is cancelled (e.g. a client disconnect) does not cancel the others.
+        search = self._inflight.get(inflight_key)
+        if search is None:
+            search = asyncio.ensure_future(self._search_products(
+                query, filters, query_types, fusion_strategy, limit, offset, cache_scope
+            ))
+            self._inflight[inflight_key] = search
+            search.add_done_callback(lambda task: self._finish_search(inflight_key, task))
+        
+        return list(await asyncio.shield(search))
+    
+    def _finish_search(self, inflight_key: tuple, search: asyncio.Future):
+        """Retire a finished shared search"""
+        self._inflight.pop(inflight_key, None)
+        if not search.cancelled():
+            # Mark the error as retrieved in case every caller has gone away
+            search.exception()
+    
+    async def _search_products(self,
+                               query: Optional[str],
+                               filters: Optional[Dict[str, Any]],
+                               query_types: List[QueryType],
+                               fusion_strategy: FusionStrategy,
+                               limit: int,
+                               offset: int,
+                               cache_scope: tuple) -> List[FinancialProduct]:
+        """
+        Run a product search against the data sources and fuse the results.
+        
+        Args:
+            query: Search query
+            filters: Search filters
+            query_types: Types of queries to perform
+            fusion_strategy: Strategy for combining results
+            limit: Maximum number of results
+            offset: Result offset
+            cache_scope: Exact-match part of the search cache key
             
-            for source_type, connector in self._connectors.items():
-                try:
-                    if source_type == DataSourceType.POSTGRESQL and QueryType.STRUCTURED in query_types:
-                        results = await connector.search_products(query, filters, limit, offset)
-                        all_results[source_type] = results
-                    
-                    elif source_type == DataSourceType.CHROMADB and QueryType.VECTOR in query_types:
-                        results = await connector.search_products(query, filters, limit, offset)
-                        all_results[source_type] = results
-                    
-                    elif source_type == DataSourceType.NEO4J and QueryType.GRAPH in query_types:
-                        results = await connector.search_products(query, filters, limit, offset)
-                        all_results[source_type] = results
-                        
-                except Exception as e:
-                    self._logger.error(f"Error searching {source_type.value}: {e}")
-                    continue
+        Returns:
+            List[FinancialProduct]: Combined product results
+        """
+        try:
+            # Serve paraphrases of earlier queries from the semantic cache
+            query_embedding = None
+            if self._semantic_cache is not None and query:
+                query_embedding = await self._embed_query(query)
+                if query_embedding is not None:
+                    cached = await self._semantic_cache.get(query_embedding, cache_scope)
+                    if cached is not None:
+                        return list(cached)
+            
+            active_sources = [
+                source_type for source_type in self._connectors
+                if _SOURCE_QUERY_TYPES.get(source_type) in query_types
+            ]
+            
+            if len(active_sources) == 1:
+                # Single backend: every fusion strategy reduces to the connector's own ordering
+                results = await self._search_source(active_sources[0], query, filters, limit, offset)
+                fused_results = results[:limit]
+            else:
+                # Collect results from each data source
+                all_results = {}
+                
+                for source_type in active_sources:
+                    try:
+                        all_results[source_type] = await self._search_source(
+                            source_type, query, filters, limit, offset
+                        )
+                    except Exception as e:
+                        self._logger.error(f"Error searching {source_type.value}: {e}")
+                        continue
+                
+                # Fuse results based on strategy
+                fused_results = await self._fuse_results(all_results, fusion_strategy, limit)
             
-            # Fuse results based on strategy
-            fused_results = await self._fuse_results(all_results, fusion_strategy, limit)
+            if query_embedding is not None and fused_results:
+                await self._semantic_cache.set(query_embedding, tuple(fused_results), cache_scope)
             
             return fused_results
             
@@ -195,6 +351,47 @@ class DataManager:
             self._logger.error(f"Error in product search: {e}")
             return []
     
+    async def _search_source(self,
+                             source_type: DataSourceType,
+                             query: Optional[str],
+                             filters: Optional[Dict[str, Any]],
+                             limit: int,
+                             offset: int) -> List[FinancialProduct]:
+        """Run a product search against a single data source"""
+        connector = self._connectors[source_type]
+        return await connector.search_products(query, filters, limit, offset)
+    
+    async def _embed_query(self, query: str) -> Optional[List[float]]:
+        """
+        Embed a search query with the ChromaDB connector's model.
+        
+        Args:
+            query: Search query
+            
+        Returns:
+            Optional[List[float]]: Query embedding, or None if unavailable
+        """
+        connector = self._connectors.get(DataSourceType.CHROMADB)
+        if connector is None:
+            return None
+        
+        try:
+            return await connector.embed(query)
+        except Exception as e:
+            self._logger.debug(f"Skipping semantic cache, query embedding failed: {e}")
+            return None
+    
+    @staticmethod
+    def _search_cache_scope(filters: Optional[Dict[str, Any]],
+                            query_types: List[QueryType],
+                            fusion_strategy: FusionStrategy,
+                            limit: int,
+                            offset: int) -> tuple:
+        """Build the exact-match part of a search cache key"""
+        filters_key = tuple(sorted((key, str(value)) for key, value in (filters or {}).items()))
+        query_types_key = tuple(sorted(query_type.value for query_type in query_types))
+        return (filters_key, query_types_key, fusion_strategy.value, limit, offset)
+    
     async def _fuse_results(self, 
                            all_results: Dict[DataSourceType, List[FinancialProduct]],
                            strategy: FusionStrategy,
@@ -254,12 +451,7 @@ class DataManager:
     async def _fuse_weighted(self, all_results: Dict[DataSourceType, List[FinancialProduct]], 
                            limit: int) -> List[FinancialProduct]:
         """Fuse results using weighted strategy"""
-        # Define weights for different sources
-        weights = {
-            DataSourceType.POSTGRESQL: 0.4,  # Structured data
-            DataSourceType.CHROMADB: 0.4,    # Vector similarity
-            DataSourceType.NEO4J: 0.2        # Graph relationships
-        }
+        weights = self._fusion_weights
         
         # Create weighted list
         weighted_results = []
@@ -272,21 +464,40 @@ class DataManager:
         weighted_results.sort(key=lambda x: x[1], reverse=True)
         return [product for product, _ in weighted_results[:limit]]
     
-    async def _fuse_concatenation(self, all_results: Dict[DataSourceType, List[FinancialProduct]], 
-                                limit: int) -> List[FinancialProduct]:
-        """Fuse results using concatenation strategy"""
-        fused = []
-        seen_ids = set()
+    @staticmethod
+    def _intern_product_ids(all_results: Dict[DataSourceType, List[FinancialProduct]]) -> tuple:
+        """
+        Map product ids to dense integers for set and dict keys during fusion.
+        
+        Ids are assigned in first-seen order across sources, so the returned
+        product list doubles as the de-duplicated concatenation of all results.
+        
+        Args:
+            all_results: Results from each data source
+            
+        Returns:
+            tuple: (interned ids per source, first-seen product for each id)
+        """
+        interner: Dict[str, int] = {}
+        first_seen: List[FinancialProduct] = []
+        interned: Dict[DataSourceType, List[int]] = {}
         
-        for results in all_results.values():
+        for source_type, results in all_results.items():
+            source_ids = []
             for product in results:
-                if product.product_id not in seen_ids:
-                    fused.append(product)
-                    seen_ids.add(product.product_id)
-                    if len(fused) >= limit:
-                        return fused
+                pid = interner.setdefault(product.product_id, len(interner))
+                if pid == len(first_seen):
+                    first_seen.append(product)
+                source_ids.append(pid)
+            interned[source_type] = source_ids
         
-        return fused
+        return interned, first_seen
+    
+    async def _fuse_concatenation(self, all_results: Dict[DataSourceType, List[FinancialProduct]], 
+                                limit: int) -> List[FinancialProduct]:
+        """Fuse results using concatenation strategy"""
+        _, first_seen = self._intern_product_ids(all_results)
+        return first_seen[:limit]
     
     async def _fuse_intersection(self, all_results: Dict[DataSourceType, List[FinancialProduct]], 
                                limit: int) -> List[FinancialProduct]:
@@ -294,29 +505,19 @@ class DataManager:
         if not all_results:
             return []
         
-        # Find products that appear in all sources
-        product_counts = {}
-        for results in all_results.values():
-            for product in results:
-                product_counts[product.product_id] = product_counts.get(product.product_id, 0) + 1
+        interned, first_seen = self._intern_product_ids(all_results)
         
-        # Get products that appear in all sources
-        num_sources = len(all_results)
-        intersection_products = [
-            product_id for product_id, count in product_counts.items()
-            if count == num_sources
-        ]
+        # Find products that appear in all sources
+        common_ids = None
+        for source_ids in interned.values():
+            common_ids = set(source_ids) if common_ids is None else common_ids.intersection(source_ids)
         
-        # Return intersection products
+        # Keep first-seen order and return the original product instances
         fused = []
-        for product_id in intersection_products[:limit]:
-            # Find the product in any source
-            for results in all_results.values():
-                for product in results:
-                    if product.product_id == product_id:
-                        fused.append(product)
-                        break
-                if product_id in [p.product_id for p in fused]:
+        for pid, product in enumerate(first_seen):
+            if pid in common_ids:
+                fused.append(product)
+                if len(fused) >= limit:
                     break
         
         return fused
@@ -482,8 +683,74 @@ class DataManager:
                 connector = self._connectors[DataSourceType.NEO4J]
                 await connector.add_product_node(product)
             
+            if self._semantic_cache is not None:
+                await self._semantic_cache.clear()
+            
             self._logger.info(f"Added product {product.product_id} to all data sources")
             
         except Exception as e:
             self._logger.error(f"Error adding product to data sources: {e}")
-            raise 
\ No newline at end of file
+            raise
+    
+    async def _validate_products(self, raw_products: List[Dict[str, Any]]) -> List[FinancialProduct]:
+        """
+        Validate raw product payloads, in a process pool for large batches.
+        
+        Args:
+            raw_products: Raw product dictionaries
+            
+        Returns:
+            List[FinancialProduct]: Validated products
+        """
+        if len(raw_products) < _PARALLEL_VALIDATION_THRESHOLD:
+            return [FinancialProduct(**raw) for raw in raw_products]
+        
+        if self._validation_pool is None:
+            self._validation_pool = concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count())
+        
+        loop = asyncio.get_running_loop()
+        validated = await asyncio.gather(*[
+            loop.run_in_executor(self._validation_pool, _validate_product, raw)
+            for raw in raw_products
+        ])
+        
+        # Payloads were validated in the workers, so rebuild without re-validating
+        return [FinancialProduct.model_construct(**data) for data in validated]
+    
+    async def add_products_to_all_sources(self, raw_products: List[Dict[str, Any]]) -> List[FinancialProduct]:
+        """
+        Validate and add a batch of products to all data sources.
+        
+        Args:
+            raw_products: Raw product dictionaries (e.g. parsed from JSON/CSV)
+            
+        Returns:
+            List[FinancialProduct]: Products that were added
+        """
+        try:
+            products = await self._validate_products(raw_products)
+            
+            # Add to PostgreSQL
+            if DataSourceType.POSTGRESQL in self._connectors:
+                # PostgreSQL will handle this through regular database operations
+                self._logger.info(f"{len(products)} products will be added to PostgreSQL via database operations")
+            
+            # Add to ChromaDB
+            if DataSourceType.CHROMADB in self._connectors:
+                connector = self._connectors[DataSourceType.CHROMADB]
+                await connector.add_products_batch(products)
+            
+            # Add to Neo4j
+            if DataSourceType.NEO4J in self._connectors:
+                connector = self._connectors[DataSourceType.NEO4J]
+                await connector.add_product_nodes(products)
+            
+            if self._semantic_cache is not None:
+                await self._semantic_cache.clear()
+            
+            self._logger.info(f"Added {len(products)} products to all data sources")
+            return products
+            
+        except Exception as e:
+            self._logger.error(f"Error adding products to data sources: {e}")
+            raise
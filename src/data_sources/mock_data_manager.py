@@ -6,14 +6,313 @@ without requiring real database connections.
 """
 
 import asyncio
+import bisect
+import functools
+import itertools
 import logging
-from typing import Dict, Any, List, Optional
+import time
+import types
+from collections import defaultdict, namedtuple
+from typing import Dict, Any, Callable, List, Mapping, Optional, Set, Tuple
 from datetime import datetime, timezone
 from enum import Enum
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 from src.data.models import FinancialProduct, UserProfile, GraphNode, GraphRelationship, ProductType, RiskLevel, InvestmentExperience, RelationshipType
 
 
+# Literal product specs; models are only built from these when first needed
+_PRODUCT_SPECS: Tuple[Dict[str, Any], ...] = (
+    # Mutual Funds
+    {
+        "product_id": "MF_001",
+        "name": "Yuanta Growth Fund",
+        "type": ProductType.MUTUAL_FUND,
+        "risk_level": RiskLevel.HIGH,
+        "description": "A growth-oriented mutual fund focusing on technology and innovation companies",
+        "issuer": "Yuanta Securities",
+        "inception_date": datetime(2020, 1, 15, tzinfo=timezone.utc),
+        "expected_return": "12-18%",
+        "volatility": 0.25,
+        "sharpe_ratio": 1.2,
+        "minimum_investment": 5000.0,
+        "expense_ratio": 0.015,
+        "dividend_yield": 0.02,
+        "regulatory_status": "approved",
+        "compliance_requirements": ["SEC", "FINRA"],
+        "tags": ["growth", "technology", "innovation"],
+        "categories": ["equity", "growth"],
+        "embedding_id": "emb_mf_001"
+    },
+    {
+        "product_id": "MF_002",
+        "name": "Yuanta Balanced Fund",
+        "type": ProductType.MUTUAL_FUND,
+        "risk_level": RiskLevel.MEDIUM,
+        "description": "A balanced fund with 60% equities and 40% fixed income",
+        "issuer": "Yuanta Securities",
+        "inception_date": datetime(2019, 6, 10, tzinfo=timezone.utc),
+        "expected_return": "8-12%",
+        "volatility": 0.15,
+        "sharpe_ratio": 0.95,
+        "minimum_investment": 3000.0,
+        "expense_ratio": 0.012,
+        "dividend_yield": 0.035,
+        "regulatory_status": "approved",
+        "compliance_requirements": ["SEC", "FINRA"],
+        "tags": ["balanced", "diversified", "income"],
+        "categories": ["mixed", "balanced"],
+        "embedding_id": "emb_mf_002"
+    },
+    {
+        "product_id": "MF_003",
+        "name": "Yuanta Conservative Fund",
+        "type": ProductType.MUTUAL_FUND,
+        "risk_level": RiskLevel.LOW,
+        "description": "A conservative fund focused on capital preservation and income",
+        "issuer": "Yuanta Securities",
+        "inception_date": datetime(2018, 3, 20, tzinfo=timezone.utc),
+        "expected_return": "4-6%",
+        "volatility": 0.08,
+        "sharpe_ratio": 0.75,
+        "minimum_investment": 2000.0,
+        "expense_ratio": 0.008,
+        "dividend_yield": 0.045,
+        "regulatory_status": "approved",
+        "compliance_requirements": ["SEC", "FINRA"],
+        "tags": ["conservative", "income", "preservation"],
+        "categories": ["fixed_income", "conservative"],
+        "embedding_id": "emb_mf_003"
+    },
+    
+    # ETFs
+    {
+        "product_id": "ETF_001",
+        "name": "Yuanta S&P 500 ETF",
+        "type": ProductType.ETF,
+        "risk_level": RiskLevel.MEDIUM,
+        "description": "An ETF tracking the S&P 500 index for broad market exposure",
+        "issuer": "Yuanta Securities",
+        "inception_date": datetime(2021, 2, 15, tzinfo=timezone.utc),
+        "expected_return": "10-12%",
+        "volatility": 0.18,
+        "sharpe_ratio": 0.85,
+        "minimum_investment": 100.0,
+        "expense_ratio": 0.005,
+        "dividend_yield": 0.018,
+        "regulatory_status": "approved",
+        "compliance_requirements": ["SEC", "FINRA"],
+        "tags": ["index", "large_cap", "diversified"],
+        "categories": ["equity", "index"],
+        "embedding_id": "emb_etf_001"
+    },
+    {
+        "product_id": "ETF_002",
+        "name": "Yuanta Bond ETF",
+        "type": ProductType.ETF,
+        "risk_level": RiskLevel.LOW,
+        "description": "An ETF focused on investment-grade corporate bonds",
+        "issuer": "Yuanta Securities",
+        "inception_date": datetime(2020, 9, 8, tzinfo=timezone.utc),
+        "expected_return": "3-5%",
+        "volatility": 0.06,
+        "sharpe_ratio": 0.65,
+        "minimum_investment": 100.0,
+        "expense_ratio": 0.003,
+        "dividend_yield": 0.032,
+        "regulatory_status": "approved",
+        "compliance_requirements": ["SEC", "FINRA"],
+        "tags": ["bonds", "income", "conservative"],
+        "categories": ["fixed_income", "bonds"],
+        "embedding_id": "emb_etf_002"
+    },
+    
+    # Bonds
+    {
+        "product_id": "BOND_001",
+        "name": "Yuanta Corporate Bond Fund",
+        "type": ProductType.BOND,
+        "risk_level": RiskLevel.LOW,
+        "description": "A fund investing in high-quality corporate bonds",
+        "issuer": "Yuanta Securities",
+        "inception_date": datetime(2017, 11, 12, tzinfo=timezone.utc),
+        "expected_return": "4-6%",
+        "volatility": 0.05,
+        "sharpe_ratio": 0.70,
+        "minimum_investment": 1000.0,
+        "expense_ratio": 0.007,
+        "dividend_yield": 0.040,
+        "regulatory_status": "approved",
+        "compliance_requirements": ["SEC", "FINRA"],
+        "tags": ["corporate_bonds", "income", "stable"],
+        "categories": ["fixed_income", "bonds"],
+        "embedding_id": "emb_bond_001"
+    },
+    
+    # International
+    {
+        "product_id": "INT_001",
+        "name": "Yuanta International Growth Fund",
+        "type": ProductType.MUTUAL_FUND,
+        "risk_level": RiskLevel.HIGH,
+        "description": "A fund investing in international growth companies",
+        "issuer": "Yuanta Securities",
+        "inception_date": datetime(2021, 5, 20, tzinfo=timezone.utc),
+        "expected_return": "15-20%",
+        "volatility": 0.28,
+        "sharpe_ratio": 1.1,
+        "minimum_investment": 5000.0,
+        "expense_ratio": 0.018,
+        "dividend_yield": 0.015,
+        "regulatory_status": "approved",
+        "compliance_requirements": ["SEC", "FINRA"],
+        "tags": ["international", "growth", "emerging_markets"],
+        "categories": ["equity", "international"],
+        "embedding_id": "emb_int_001"
+    },
+    
+    # Retirement
+    {
+        "product_id": "RET_001",
+        "name": "Yuanta Target Retirement 2040",
+        "type": ProductType.MUTUAL_FUND,
+        "risk_level": RiskLevel.MEDIUM,
+        "description": "A target-date fund for investors planning to retire around 2040",
+        "issuer": "Yuanta Securities",
+        "inception_date": datetime(2019, 8, 15, tzinfo=timezone.utc),
+        "expected_return": "7-10%",
+        "volatility": 0.14,
+        "sharpe_ratio": 0.80,
+        "minimum_investment": 1000.0,
+        "expense_ratio": 0.010,
+        "dividend_yield": 0.025,
+        "regulatory_status": "approved",
+        "compliance_requirements": ["SEC", "FINRA"],
+        "tags": ["retirement", "target_date", "diversified"],
+        "categories": ["mixed", "retirement"],
+        "embedding_id": "emb_ret_001"
+    }
+)
+
+# Catalogs at least this large are searched in a worker thread so a scan
+# cannot stall the event loop; smaller ones are cheaper to search inline
+_OFFLOAD_THRESHOLD = 1024
+
+# Health check timestamps are reused for this long to avoid a clock read and
+# ISO formatting on every poll
+_TIMESTAMP_REFRESH_SECONDS = 0.1
+
+
+# Filters whose values are normalized to enum members before searching
+_ENUM_FILTERS = {
+    "risk_level": RiskLevel,
+    "type": ProductType
+}
+
+
+def _coerce_enum(enum_type: type, value: Any) -> Any:
+    """Convert a filter value to its enum member, leaving unknown values unchanged"""
+    if isinstance(value, enum_type):
+        return value
+    try:
+        return enum_type(value)
+    except ValueError:
+        return value
+
+
+# Lightweight mirror of a graph relationship used by the lookup indexes
+_RelRow = namedtuple("_RelRow", "source target type_ ref")
+
+
+# Source for each relationship filter term; only these fixed strings are ever compiled
+_RELATIONSHIP_PREDICATE_TERMS = {
+    "source_node_id": "row.source == f['source_node_id']",
+    "target_node_id": "row.target == f['target_node_id']",
+    "relationship_type": "row.type_ is f['relationship_type']"
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_relationship_predicate(filter_keys: frozenset) -> Callable[[_RelRow, Dict[str, Any]], bool]:
+    """
+    Compile a single predicate checking all active relationship filters.
+    
+    Args:
+        filter_keys: Names of the active relationship filters
+        
+    Returns:
+        Callable[[_RelRow, Dict[str, Any]], bool]: Predicate taking a row and the filter values
+    """
+    terms = " and ".join(_RELATIONSHIP_PREDICATE_TERMS[key] for key in sorted(filter_keys))
+    return eval(compile(f"lambda row, f: {terms}", "<relationship-filter>", "eval"))
+
+
+def _trigrams(text: str) -> Set[str]:
+    """Get the distinct three-character substrings of a string"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _group_by(items: Tuple[Any, ...], key: Callable[[Any], Any]) -> Dict[Any, List[Any]]:
+    """Group items by key, keeping their original order within each group"""
+    groups = defaultdict(list)
+    for item in items:
+        groups[key(item)].append(item)
+    return dict(groups)
+
+
+# Compact integer codes for the enum columns of the product table
+_RISK_CODES = {member: code for code, member in enumerate(RiskLevel)}
+_TYPE_CODES = {member: code for code, member in enumerate(ProductType)}
+
+# Code passed to the mask kernel when a filter is not active
+_NO_FILTER = -1
+
+
+def _filter_mask_kernel(risk_codes: np.ndarray,
+                        type_codes: np.ndarray,
+                        min_investments: np.ndarray,
+                        positions: np.ndarray,
+                        risk_code: int,
+                        type_code: int,
+                        low: float,
+                        high: float,
+                        out: np.ndarray):
+    """Evaluate all structured filters for the given positions in a single pass"""
+    for k in range(positions.shape[0]):
+        i = positions[k]
+        out[k] = ((risk_code == _NO_FILTER or risk_codes[i] == risk_code) and
+                  (type_code == _NO_FILTER or type_codes[i] == type_code) and
+                  low <= min_investments[i] <= high)
+
+
+def _filter_mask_numpy(risk_codes: np.ndarray,
+                       type_codes: np.ndarray,
+                       min_investments: np.ndarray,
+                       positions: np.ndarray,
+                       risk_code: int,
+                       type_code: int,
+                       low: float,
+                       high: float) -> np.ndarray:
+    """Evaluate the same predicates as _filter_mask_kernel with numpy array expressions"""
+    position_min_investments = min_investments[positions]
+    mask = (position_min_investments >= low) & (position_min_investments <= high)
+    if risk_code != _NO_FILTER:
+        mask &= risk_codes[positions] == risk_code
+    if type_code != _NO_FILTER:
+        mask &= type_codes[positions] == type_code
+    return mask
+
+
+if njit is not None:
+    _filter_mask_kernel = njit(cache=True)(_filter_mask_kernel)
+
+
 class FusionStrategy(str, Enum):
     """Data fusion strategies"""
     ROUND_ROBIN = "round_robin"
@@ -22,6 +321,296 @@ class FusionStrategy(str, Enum):
     INTERSECTION = "intersection"
 
 
+@functools.lru_cache(maxsize=1)
+def _load_products() -> Tuple[FinancialProduct, ...]:
+    """Create the shared mock financial products"""
+    return tuple(FinancialProduct(**spec) for spec in _PRODUCT_SPECS)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_user_profiles() -> Mapping[str, UserProfile]:
+    """Create the shared mock user profiles"""
+    return types.MappingProxyType({
+        "user_001": UserProfile(
+            user_id="user_001",
+            name="John Doe",
+            email="john.doe@example.com",
+            age=35,
+            income_level="high",
+            investment_experience=InvestmentExperience.INTERMEDIATE,
+            risk_tolerance=RiskLevel.HIGH,
+            investment_goals=["wealth_building", "growth"],
+            time_horizon="long_term",
+            preferred_product_types=[ProductType.MUTUAL_FUND, ProductType.ETF],
+            preferred_sectors=["technology", "healthcare"],
+            geographic_preferences=["US", "international"],
+            budget_range={"min": 10000.0, "max": 100000.0},
+            current_portfolio_value=50000.0,
+            monthly_investment_capacity=2000.0
+        ),
+        "user_002": UserProfile(
+            user_id="user_002",
+            name="Jane Smith",
+            email="jane.smith@example.com",
+            age=55,
+            income_level="medium",
+            investment_experience=InvestmentExperience.BEGINNER,
+            risk_tolerance=RiskLevel.LOW,
+            investment_goals=["income", "preservation"],
+            time_horizon="medium_term",
+            preferred_product_types=[ProductType.BOND, ProductType.ETF],
+            preferred_sectors=["utilities", "consumer_staples"],
+            geographic_preferences=["US"],
+            budget_range={"min": 5000.0, "max": 50000.0},
+            current_portfolio_value=25000.0,
+            monthly_investment_capacity=1000.0
+        ),
+        "user_003": UserProfile(
+            user_id="user_003",
+            name="Mike Johnson",
+            email="mike.johnson@example.com",
+            age=45,
+            income_level="medium",
+            investment_experience=InvestmentExperience.INTERMEDIATE,
+            risk_tolerance=RiskLevel.MEDIUM,
+            investment_goals=["retirement", "balanced"],
+            time_horizon="long_term",
+            preferred_product_types=[ProductType.MUTUAL_FUND, ProductType.ETF],
+            preferred_sectors=["diversified"],
+            geographic_preferences=["US", "developed_markets"],
+            budget_range={"min": 2000.0, "max": 25000.0},
+            current_portfolio_value=15000.0,
+            monthly_investment_capacity=800.0
+        )
+    })
+
+
+@functools.lru_cache(maxsize=1)
+def _load_graph_nodes() -> Tuple[GraphNode, ...]:
+    """Create the shared mock graph nodes"""
+    return (
+        GraphNode(
+            node_id="node_001",
+            node_type="product",
+            properties={
+                "name": "Yuanta Growth Fund",
+                "type": "mutual_fund",
+                "risk_level": "high"
+            },
+            labels=["product", "fund"]
+        ),
+        GraphNode(
+            node_id="node_002",
+            node_type="sector",
+            properties={
+                "name": "Technology",
+                "description": "Technology sector investments"
+            },
+            labels=["sector", "technology"]
+        ),
+        GraphNode(
+            node_id="node_003",
+            node_type="risk_profile",
+            properties={
+                "name": "High Risk",
+                "description": "High risk tolerance profile"
+            },
+            labels=["risk_profile", "high_risk"]
+        )
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _load_graph_relationships() -> Tuple[GraphRelationship, ...]:
+    """Create the shared mock graph relationships"""
+    return (
+        GraphRelationship(
+            relationship_id="rel_001",
+            source_node_id="node_001",
+            target_node_id="node_002",
+            relationship_type=RelationshipType.PART_OF,
+            properties={
+                "weight": 0.8,
+                "confidence": 0.9
+            },
+            confidence=0.9
+        ),
+        GraphRelationship(
+            relationship_id="rel_002",
+            source_node_id="node_001",
+            target_node_id="node_003",
+            relationship_type=RelationshipType.SUPPORTS,
+            properties={
+                "weight": 0.9,
+                "confidence": 0.95
+            },
+            confidence=0.95
+        )
+    )
+
+
+class _ProductIndex:
+    """Search indexes over one version of the product catalog; never modified once built"""
+    
+    def __init__(self, products: Tuple[FinancialProduct, ...], version: int):
+        """
+        Build inverted, range and text search indexes over the product catalog.
+        
+        Args:
+            products: Product catalog
+            version: Catalog version the indexes describe
+        """
+        self.products = products
+        self.version = version
+        
+        # Catalog positions grouped by risk level and product type
+        self.by_risk: Dict[RiskLevel, List[int]] = defaultdict(list)
+        self.by_type: Dict[ProductType, List[int]] = defaultdict(list)
+        for position, product in enumerate(products):
+            self.by_risk[product.risk_level].append(position)
+            self.by_type[product.type].append(position)
+        
+        # Catalog positions ordered by minimum investment, with parallel thresholds for bisect
+        self.min_inv_order = sorted(range(len(products)), key=lambda i: products[i].minimum_investment)
+        self.min_inv_values = [products[i].minimum_investment for i in self.min_inv_order]
+        
+        # Struct-of-arrays copy of the filterable fields for vectorized predicates
+        self.columns: Dict[str, np.ndarray] = {
+            "risk_level": np.array([_RISK_CODES[product.risk_level] for product in products], dtype=np.int8),
+            "type": np.array([_TYPE_CODES[product.type] for product in products], dtype=np.int8),
+            "minimum_investment": np.array([product.minimum_investment for product in products], dtype=np.float64)
+        }
+        
+        # Pre-lowered name, description and tags per product for text search; fields are
+        # newline-separated so a query cannot match across a field boundary
+        self.search_blobs: List[str] = [
+            "\n".join([product.name, product.description, *product.tags]).lower()
+            for product in products
+        ]
+        
+        # Exact tag and trigram postings over the search text, so text search only
+        # verifies products that contain every trigram of the query
+        self.tag_index: Dict[str, Set[int]] = defaultdict(set)
+        self.trigram_index: Dict[str, Set[int]] = defaultdict(set)
+        for position, product in enumerate(products):
+            for tag in product.tags:
+                self.tag_index[tag.lower()].add(position)
+            for trigram in _trigrams(self.search_blobs[position]):
+                self.trigram_index[trigram].add(position)
+        
+        # Text matches are reused across filters and pages. The cache belongs to
+        # this version's index, so a search finishing after a product is added
+        # can only store into the cache of the index it searched
+        self.text_matches = functools.lru_cache(maxsize=256)(self._text_matches)
+    
+    def candidate_positions(self, filters: Dict[str, Any]) -> Optional[List[int]]:
+        """
+        Get catalog positions from the most selective indexed filter.
+        
+        Args:
+            filters: Search filters
+        
+        Returns:
+            Optional[List[int]]: Candidate positions in catalog order, or None if no filter is indexed
+        """
+        candidates = []
+        
+        if "risk_level" in filters:
+            candidates.append(self.by_risk.get(filters["risk_level"], []))
+        
+        if "type" in filters:
+            candidates.append(self.by_type.get(filters["type"], []))
+        
+        best = min(candidates, key=len) if candidates else None
+        
+        if "min_investment" in filters or "max_investment" in filters:
+            low = 0
+            high = len(self.min_inv_values)
+            if "min_investment" in filters:
+                low = bisect.bisect_left(self.min_inv_values, filters["min_investment"])
+            if "max_investment" in filters:
+                high = bisect.bisect_right(self.min_inv_values, filters["max_investment"])
+            
+            # The window size is known from the bisect alone, so the window is only
+            # materialized and put back in catalog order when it is the most selective
+            if best is None or high - low < len(best):
+                best = sorted(self.min_inv_order[low:high])
+        
+        return best
+    
+    def filter_mask(self, positions: np.ndarray, filters: Dict[str, Any]) -> np.ndarray:
+        """
+        Evaluate the structured filters over the product columns.
+        
+        Args:
+            positions: Catalog positions to check
+            filters: Search filters
+        
+        Returns:
+            np.ndarray: Boolean mask over positions
+        """
+        risk_code = _NO_FILTER
+        if "risk_level" in filters:
+            risk_code = _RISK_CODES.get(filters["risk_level"])
+        
+        type_code = _NO_FILTER
+        if "type" in filters:
+            type_code = _TYPE_CODES.get(filters["type"])
+        
+        # Values that are not known enum members match nothing
+        if risk_code is None or type_code is None:
+            return np.zeros(len(positions), dtype=bool)
+        
+        low = float(filters.get("min_investment", -np.inf))
+        high = float(filters.get("max_investment", np.inf))
+        
+        columns = self.columns
+        if njit is not None:
+            mask = np.empty(len(positions), dtype=bool)
+            _filter_mask_kernel(
+                columns["risk_level"], columns["type"], columns["minimum_investment"],
+                positions, risk_code, type_code, low, high, mask
+            )
+            return mask
+        
+        # Without numba (an optional dependency), use numpy array expressions
+        return _filter_mask_numpy(
+            columns["risk_level"], columns["type"], columns["minimum_investment"],
+            positions, risk_code, type_code, low, high
+        )
+    
+    def _text_matches(self, query_lower: str) -> frozenset:
+        """
+        Get the catalog positions whose name, description or tags contain the query.
+        
+        Args:
+            query_lower: Lowercased text search query
+        
+        Returns:
+            frozenset: Matching catalog positions
+        """
+        search_blobs = self.search_blobs
+        
+        # Products with an exactly matching tag need no substring check
+        tag_matches = self.tag_index.get(query_lower, set())
+        
+        query_trigrams = _trigrams(query_lower)
+        if query_trigrams:
+            postings = sorted(
+                (self.trigram_index.get(trigram, set()) for trigram in query_trigrams),
+                key=len
+            )
+            candidates = postings[0].intersection(*postings[1:])
+        else:
+            # Queries shorter than a trigram are checked against every product
+            candidates = range(len(search_blobs))
+        
+        return frozenset(tag_matches).union(
+            i for i in candidates
+            if i not in tag_matches and query_lower in search_blobs[i]
+        )
+
+
 class MockDataManager:
     """
     Mock data manager for testing and development.
@@ -40,309 +629,75 @@ class MockDataManager:
         self._logger = logging.getLogger(__name__)
         self._running = False
         
-        # Initialize mock data
-        self._mock_products = self._create_mock_products()
-        self._mock_user_profiles = self._create_mock_user_profiles()
-        self._mock_graph_nodes = self._create_mock_graph_nodes()
-        self._mock_graph_relationships = self._create_mock_graph_relationships()
-    
-    def _create_mock_products(self) -> List[FinancialProduct]:
-        """Create mock financial products"""
-        now = datetime.now(timezone.utc)
-        
-        return [
-            # Mutual Funds
-            FinancialProduct(
-                product_id="MF_001",
-                name="Yuanta Growth Fund",
-                type=ProductType.MUTUAL_FUND,
-                risk_level=RiskLevel.HIGH,
-                description="A growth-oriented mutual fund focusing on technology and innovation companies",
-                issuer="Yuanta Securities",
-                inception_date=datetime(2020, 1, 15, tzinfo=timezone.utc),
-                expected_return="12-18%",
-                volatility=0.25,
-                sharpe_ratio=1.2,
-                minimum_investment=5000.0,
-                expense_ratio=0.015,
-                dividend_yield=0.02,
-                regulatory_status="approved",
-                compliance_requirements=["SEC", "FINRA"],
-                tags=["growth", "technology", "innovation"],
-                categories=["equity", "growth"],
-                embedding_id="emb_mf_001"
-            ),
-            FinancialProduct(
-                product_id="MF_002",
-                name="Yuanta Balanced Fund",
-                type=ProductType.MUTUAL_FUND,
-                risk_level=RiskLevel.MEDIUM,
-                description="A balanced fund with 60% equities and 40% fixed income",
-                issuer="Yuanta Securities",
-                inception_date=datetime(2019, 6, 10, tzinfo=timezone.utc),
-                expected_return="8-12%",
-                volatility=0.15,
-                sharpe_ratio=0.95,
-                minimum_investment=3000.0,
-                expense_ratio=0.012,
-                dividend_yield=0.035,
-                regulatory_status="approved",
-                compliance_requirements=["SEC", "FINRA"],
-                tags=["balanced", "diversified", "income"],
-                categories=["mixed", "balanced"],
-                embedding_id="emb_mf_002"
-            ),
-            FinancialProduct(
-                product_id="MF_003",
-                name="Yuanta Conservative Fund",
-                type=ProductType.MUTUAL_FUND,
-                risk_level=RiskLevel.LOW,
-                description="A conservative fund focused on capital preservation and income",
-                issuer="Yuanta Securities",
-                inception_date=datetime(2018, 3, 20, tzinfo=timezone.utc),
-                expected_return="4-6%",
-                volatility=0.08,
-                sharpe_ratio=0.75,
-                minimum_investment=2000.0,
-                expense_ratio=0.008,
-                dividend_yield=0.045,
-                regulatory_status="approved",
-                compliance_requirements=["SEC", "FINRA"],
-                tags=["conservative", "income", "preservation"],
-                categories=["fixed_income", "conservative"],
-                embedding_id="emb_mf_003"
-            ),
-            
-            # ETFs
-            FinancialProduct(
-                product_id="ETF_001",
-                name="Yuanta S&P 500 ETF",
-                type=ProductType.ETF,
-                risk_level=RiskLevel.MEDIUM,
-                description="An ETF tracking the S&P 500 index for broad market exposure",
-                issuer="Yuanta Securities",
-                inception_date=datetime(2021, 2, 15, tzinfo=timezone.utc),
-                expected_return="10-12%",
-                volatility=0.18,
-                sharpe_ratio=0.85,
-                minimum_investment=100.0,
-                expense_ratio=0.005,
-                dividend_yield=0.018,
-                regulatory_status="approved",
-                compliance_requirements=["SEC", "FINRA"],
-                tags=["index", "large_cap", "diversified"],
-                categories=["equity", "index"],
-                embedding_id="emb_etf_001"
-            ),
-            FinancialProduct(
-                product_id="ETF_002",
-                name="Yuanta Bond ETF",
-                type=ProductType.ETF,
-                risk_level=RiskLevel.LOW,
-                description="An ETF focused on investment-grade corporate bonds",
-                issuer="Yuanta Securities",
-                inception_date=datetime(2020, 9, 8, tzinfo=timezone.utc),
-                expected_return="3-5%",
-                volatility=0.06,
-                sharpe_ratio=0.65,
-                minimum_investment=100.0,
-                expense_ratio=0.003,
-                dividend_yield=0.032,
-                regulatory_status="approved",
-                compliance_requirements=["SEC", "FINRA"],
-                tags=["bonds", "income", "conservative"],
-                categories=["fixed_income", "bonds"],
-                embedding_id="emb_etf_002"
-            ),
-            
-            # Bonds
-            FinancialProduct(
-                product_id="BOND_001",
-                name="Yuanta Corporate Bond Fund",
-                type=ProductType.BOND,
-                risk_level=RiskLevel.LOW,
-                description="A fund investing in high-quality corporate bonds",
-                issuer="Yuanta Securities",
-                inception_date=datetime(2017, 11, 12, tzinfo=timezone.utc),
-                expected_return="4-6%",
-                volatility=0.05,
-                sharpe_ratio=0.70,
-                minimum_investment=1000.0,
-                expense_ratio=0.007,
-                dividend_yield=0.040,
-                regulatory_status="approved",
-                compliance_requirements=["SEC", "FINRA"],
-                tags=["corporate_bonds", "income", "stable"],
-                categories=["fixed_income", "bonds"],
-                embedding_id="emb_bond_001"
-            ),
-            
-            # International
-            FinancialProduct(
-                product_id="INT_001",
-                name="Yuanta International Growth Fund",
-                type=ProductType.MUTUAL_FUND,
-                risk_level=RiskLevel.HIGH,
-                description="A fund investing in international growth companies",
-                issuer="Yuanta Securities",
-                inception_date=datetime(2021, 5, 20, tzinfo=timezone.utc),
-                expected_return="15-20%",
-                volatility=0.28,
-                sharpe_ratio=1.1,
-                minimum_investment=5000.0,
-                expense_ratio=0.018,
-                dividend_yield=0.015,
-                regulatory_status="approved",
-                compliance_requirements=["SEC", "FINRA"],
-                tags=["international", "growth", "emerging_markets"],
-                categories=["equity", "international"],
-                embedding_id="emb_int_001"
-            ),
-            
-            # Retirement
-            FinancialProduct(
-                product_id="RET_001",
-                name="Yuanta Target Retirement 2040",
-                type=ProductType.MUTUAL_FUND,
-                risk_level=RiskLevel.MEDIUM,
-                description="A target-date fund for investors planning to retire around 2040",
-                issuer="Yuanta Securities",
-                inception_date=datetime(2019, 8, 15, tzinfo=timezone.utc),
-                expected_return="7-10%",
-                volatility=0.14,
-                sharpe_ratio=0.80,
-                minimum_investment=1000.0,
-                expense_ratio=0.010,
-                dividend_yield=0.025,
-                regulatory_status="approved",
-                compliance_requirements=["SEC", "FINRA"],
-                tags=["retirement", "target_date", "diversified"],
-                categories=["mixed", "retirement"],
-                embedding_id="emb_ret_001"
-            )
-        ]
-    
-    def _create_mock_user_profiles(self) -> Dict[str, UserProfile]:
-        """Create mock user profiles"""
-        now = datetime.now(timezone.utc)
+        # (monotonic time, ISO timestamp) last reported by health_check
+        self._health_timestamp: Optional[Tuple[float, str]] = None
         
-        return {
-            "user_001": UserProfile(
-                user_id="user_001",
-                name="John Doe",
-                email="john.doe@example.com",
-                age=35,
-                income_level="high",
-                investment_experience=InvestmentExperience.INTERMEDIATE,
-                risk_tolerance=RiskLevel.HIGH,
-                investment_goals=["wealth_building", "growth"],
-                time_horizon="long_term",
-                preferred_product_types=[ProductType.MUTUAL_FUND, ProductType.ETF],
-                preferred_sectors=["technology", "healthcare"],
-                geographic_preferences=["US", "international"],
-                budget_range={"min": 10000.0, "max": 100000.0},
-                current_portfolio_value=50000.0,
-                monthly_investment_capacity=2000.0
-            ),
-            "user_002": UserProfile(
-                user_id="user_002",
-                name="Jane Smith",
-                email="jane.smith@example.com",
-                age=55,
-                income_level="medium",
-                investment_experience=InvestmentExperience.BEGINNER,
-                risk_tolerance=RiskLevel.LOW,
-                investment_goals=["income", "preservation"],
-                time_horizon="medium_term",
-                preferred_product_types=[ProductType.BOND, ProductType.ETF],
-                preferred_sectors=["utilities", "consumer_staples"],
-                geographic_preferences=["US"],
-                budget_range={"min": 5000.0, "max": 50000.0},
-                current_portfolio_value=25000.0,
-                monthly_investment_capacity=1000.0
-            ),
-            "user_003": UserProfile(
-                user_id="user_003",
-                name="Mike Johnson",
-                email="mike.johnson@example.com",
-                age=45,
-                income_level="medium",
-                investment_experience=InvestmentExperience.INTERMEDIATE,
-                risk_tolerance=RiskLevel.MEDIUM,
-                investment_goals=["retirement", "balanced"],
-                time_horizon="long_term",
-                preferred_product_types=[ProductType.MUTUAL_FUND, ProductType.ETF],
-                preferred_sectors=["diversified"],
-                geographic_preferences=["US", "developed_markets"],
-                budget_range={"min": 2000.0, "max": 25000.0},
-                current_portfolio_value=15000.0,
-                monthly_investment_capacity=800.0
-            )
-        }
+        # Health check fields that only change with the mock data, built on first poll
+        self._health_template: Optional[Dict[str, Any]] = None
+        
+        # Mock data is built on first access. The catalog version is bumped whenever a
+        # product is added; derived indexes are rebuilt lazily when it moves on
+        self._version = 0
+        self._product_index: Optional[_ProductIndex] = None
+        
+        # Memoized search results keyed on (catalog version, query, canonical filters,
+        # limit, offset); cleared whenever the catalog changes
+        self._cached_search = functools.lru_cache(maxsize=256)(self._search_products_sync)
     
-    def _create_mock_graph_nodes(self) -> List[GraphNode]:
-        """Create mock graph nodes"""
-        now = datetime.now(timezone.utc)
-        
-        return [
-            GraphNode(
-                node_id="node_001",
-                node_type="product",
-                properties={
-                    "name": "Yuanta Growth Fund",
-                    "type": "mutual_fund",
-                    "risk_level": "high"
-                },
-                labels=["product", "fund"]
-            ),
-            GraphNode(
-                node_id="node_002",
-                node_type="sector",
-                properties={
-                    "name": "Technology",
-                    "description": "Technology sector investments"
-                },
-                labels=["sector", "technology"]
-            ),
-            GraphNode(
-                node_id="node_003",
-                node_type="risk_profile",
-                properties={
-                    "name": "High Risk",
-                    "description": "High risk tolerance profile"
-                },
-                labels=["risk_profile", "high_risk"]
-            )
-        ]
+    @functools.cached_property
+    def _mock_products(self) -> Tuple[FinancialProduct, ...]:
+        """Mock financial products, built on first access (adding a product rebinds a new tuple)"""
+        return _load_products()
     
-    def _create_mock_graph_relationships(self) -> List[GraphRelationship]:
-        """Create mock graph relationships"""
-        now = datetime.now(timezone.utc)
-        
-        return [
-            GraphRelationship(
-                relationship_id="rel_001",
-                source_node_id="node_001",
-                target_node_id="node_002",
-                relationship_type=RelationshipType.PART_OF,
-                properties={
-                    "weight": 0.8,
-                    "confidence": 0.9
-                },
-                confidence=0.9
-            ),
-            GraphRelationship(
-                relationship_id="rel_002",
-                source_node_id="node_001",
-                target_node_id="node_003",
-                relationship_type=RelationshipType.SUPPORTS,
-                properties={
-                    "weight": 0.9,
-                    "confidence": 0.95
-                },
-                confidence=0.95
-            )
-        ]
+    @functools.cached_property
+    def _mock_user_profiles(self) -> Dict[str, UserProfile]:
+        """Mock user profiles, built on first access (copied, since profiles can be saved)"""
+        return dict(_load_user_profiles())
+    
+    @functools.cached_property
+    def _mock_graph_nodes(self) -> Tuple[GraphNode, ...]:
+        """Mock graph nodes, built on first access (read-only, shared)"""
+        return _load_graph_nodes()
+    
+    @functools.cached_property
+    def _mock_graph_relationships(self) -> Tuple[GraphRelationship, ...]:
+        """Mock graph relationships, built on first access (read-only, shared)"""
+        return _load_graph_relationships()
+    
+    @functools.cached_property
+    def _nodes_by_type(self) -> Dict[str, List[GraphNode]]:
+        """Mock graph nodes grouped by node type"""
+        return _group_by(self._mock_graph_nodes, lambda n: n.node_type)
+    
+    @functools.cached_property
+    def _rel_rows(self) -> Tuple[_RelRow, ...]:
+        """Plain tuple rows mirroring the mock graph relationships for filtering"""
+        return tuple(
+            _RelRow(r.source_node_id, r.target_node_id, r.relationship_type, r)
+            for r in self._mock_graph_relationships
+        )
+    
+    @functools.cached_property
+    def _rels_by_source(self) -> Dict[str, List[_RelRow]]:
+        """Relationship rows grouped by source node"""
+        return _group_by(self._rel_rows, lambda row: row.source)
+    
+    @functools.cached_property
+    def _rels_by_target(self) -> Dict[str, List[_RelRow]]:
+        """Relationship rows grouped by target node"""
+        return _group_by(self._rel_rows, lambda row: row.target)
+    
+    @functools.cached_property
+    def _rels_by_type(self) -> Dict[RelationshipType, List[_RelRow]]:
+        """Relationship rows grouped by relationship type"""
+        return _group_by(self._rel_rows, lambda row: row.type_)
+    
+    def _ensure_product_indexes(self) -> _ProductIndex:
+        """Get the product indexes, rebuilding them if the catalog changed since they were built"""
+        index = self._product_index
+        if index is None or index.version != self._version:
+            index = self._product_index = _ProductIndex(self._mock_products, self._version)
+        return index
     
     async def start(self):
         """Start the mock data manager"""
@@ -364,40 +719,91 @@ class MockDataManager:
         offset: int = 0
     ) -> List[FinancialProduct]:
         """Search for financial products"""
-        results = self._mock_products.copy()
+        if not filters and not query:
+            # Unfiltered pages are a plain slice of the catalog
+            return list(self._mock_products[offset:offset + limit])
         
-        # Apply filters if provided
         if filters:
-            if "risk_level" in filters:
-                results = [p for p in results if p.risk_level == filters["risk_level"]]
-            
-            if "type" in filters:
-                results = [p for p in results if p.type == filters["type"]]
-            
-            if "min_investment" in filters:
-                results = [p for p in results if p.minimum_investment >= filters["min_investment"]]
+            # Normalize enum filters once so lookups and cache keys use the enum singletons
+            filters = {
+                key: _coerce_enum(_ENUM_FILTERS[key], value) if key in _ENUM_FILTERS else value
+                for key, value in filters.items()
+            }
+        
+        filters_key = tuple(sorted((filters or {}).items()))
+        
+        try:
+            hash(filters_key)
+        except TypeError:
+            # Unhashable filter values cannot be memoized
+            search = self._search_products_sync
+        else:
+            search = self._cached_search
+        
+        # Indexes are only built here, on the event loop, so worker threads only read them
+        self._ensure_product_indexes()
+        
+        if len(self._mock_products) < _OFFLOAD_THRESHOLD:
+            return list(search(self._version, query, filters_key, limit, offset))
+        
+        return list(await asyncio.to_thread(search, self._version, query, filters_key, limit, offset))
+    
+    def _search_products_sync(
+        self,
+        catalog_version: int,
+        query: Optional[str],
+        filters_key: Tuple[Tuple[str, Any], ...],
+        limit: int,
+        offset: int
+    ) -> Tuple[FinancialProduct, ...]:
+        """
+        Filter, search and paginate the product catalog.
+        
+        Args:
+            catalog_version: Catalog version the result is cached under, so a search
+                finishing after a product is added cannot repopulate the cache
+            query: Text search query
+            filters_key: Search filters as sorted (key, value) pairs
+            limit: Maximum number of results
+            offset: Result offset
             
-            if "max_investment" in filters:
-                results = [p for p in results if p.minimum_investment <= filters["max_investment"]]
+        Returns:
+            Tuple[FinancialProduct, ...]: Matching products
+        """
+        # One index snapshot serves the whole search; it is replaced, never
+        # modified, when a product is added
+        index = self._product_index
         
-        # Apply text search if query provided
-        if query:
-            query_lower = query.lower()
-            results = [
-                p for p in results
-                if (query_lower in p.name.lower() or
-                    query_lower in p.description.lower() or
-                    any(query_lower in tag.lower() for tag in p.tags))
-            ]
+        filters = dict(filters_key)
+        products = index.products
+        positions = range(len(products))
         
-        # Apply pagination
-        results = results[offset:offset + limit]
+        # Apply filters if provided
+        if filters:
+            # Narrow to the most selective index, then check every filter in one vectorized pass
+            candidates = index.candidate_positions(filters)
+            positions = np.asarray(positions if candidates is None else candidates, dtype=np.intp)
+            positions = positions[index.filter_mask(positions, filters)].tolist()
+        
+        # Apply text search if query provided, intersecting its matches with the filtered positions
+        if query:
+            matches = index.text_matches(query.lower())
+            positions = sorted(matches.intersection(positions) if filters else matches)
         
-        return results
+        # Apply pagination, materializing only the requested page
+        return tuple(products[i] for i in itertools.islice(positions, offset, offset + limit))
     
     async def get_user_profile(self, user_id: str) -> Optional[UserProfile]:
         """Get user profile by ID"""
-        return self._mock_user_profiles.get(user_id)
+        return self.get_user_profile_sync(user_id)
+    
+    def get_user_profile_sync(self, user_id: str) -> Optional[UserProfile]:
+        """Get user profile by ID without scheduling a coroutine"""
+        profiles = self._mock_user_profiles
+        try:
+            return profiles[user_id]
+        except KeyError:
+            return None
     
     async def save_user_profile(self, profile: UserProfile) -> bool:
         """Save user profile"""
@@ -411,12 +817,10 @@ class MockDataManager:
         limit: int = 100
     ) -> List[GraphNode]:
         """Get graph nodes"""
-        results = self._mock_graph_nodes.copy()
-        
         if node_type:
-            results = [n for n in results if n.node_type == node_type]
+            return self._nodes_by_type.get(node_type, [])[:limit]
         
-        return results[:limit]
+        return list(self._mock_graph_nodes[:limit])
     
     async def get_graph_relationships(
         self,
@@ -426,31 +830,64 @@ class MockDataManager:
         limit: int = 100
     ) -> List[GraphRelationship]:
         """Get graph relationships"""
-        results = self._mock_graph_relationships.copy()
+        if relationship_type:
+            relationship_type = _coerce_enum(RelationshipType, relationship_type)
         
-        if source_node_id:
-            results = [r for r in results if r.source_node_id == source_node_id]
+        active_filters = {
+            key: value for key, value in (
+                ("source_node_id", source_node_id),
+                ("target_node_id", target_node_id),
+                ("relationship_type", relationship_type)
+            )
+            if value
+        }
         
+        # Start from the smallest index bucket matching the provided filters
+        buckets = []
+        if source_node_id:
+            buckets.append(self._rels_by_source.get(source_node_id, []))
         if target_node_id:
-            results = [r for r in results if r.target_node_id == target_node_id]
-        
+            buckets.append(self._rels_by_target.get(target_node_id, []))
         if relationship_type:
-            results = [r for r in results if r.relationship_type == relationship_type]
+            buckets.append(self._rels_by_type.get(relationship_type, []))
+        
+        rows = iter(min(buckets, key=len) if buckets else self._rel_rows)
+        
+        # Check every active filter with one compiled predicate per row
+        if active_filters:
+            predicate = _compile_relationship_predicate(frozenset(active_filters))
+            rows = (row for row in rows if predicate(row, active_filters))
         
-        return results[:limit]
+        return [row.ref for row in itertools.islice(rows, limit)]
     
     async def health_check(self) -> Dict[str, Any]:
         """Check health of mock data manager"""
+        return self.health_check_sync()
+    
+    def health_check_sync(self) -> Dict[str, Any]:
+        """Check health of mock data manager without scheduling a coroutine"""
+        if self._health_template is None:
+            self._health_template = {
+                "status": "healthy",
+                "products_count": len(self._mock_products),
+                "nodes_count": len(self._mock_graph_nodes),
+                "relationships_count": len(self._mock_graph_relationships)
+            }
+        
         return {
-            "status": "healthy",
+            **self._health_template,
             "running": self._running,
-            "products_count": len(self._mock_products),
             "users_count": len(self._mock_user_profiles),
-            "nodes_count": len(self._mock_graph_nodes),
-            "relationships_count": len(self._mock_graph_relationships),
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": self._cached_iso_timestamp()
         }
     
+    def _cached_iso_timestamp(self) -> str:
+        """Get the current UTC time as ISO text, refreshed at most every 100 ms"""
+        now = time.monotonic()
+        if self._health_timestamp is None or now - self._health_timestamp[0] > _TIMESTAMP_REFRESH_SECONDS:
+            self._health_timestamp = (now, datetime.now(timezone.utc).isoformat())
+        return self._health_timestamp[1]
+    
     def get_available_sources(self) -> List[str]:
         """Get available data sources"""
         return ["mock_data"]
@@ -462,5 +899,13 @@ class MockDataManager:
     
     async def add_product_to_all_sources(self, product: FinancialProduct):
         """Add a product to mock data"""
-        self._mock_products.append(product)
+        self.add_product_to_all_sources_sync(product)
+    
+    def add_product_to_all_sources_sync(self, product: FinancialProduct):
+        """Add a product to mock data without scheduling a coroutine"""
+        self._mock_products = self._mock_products + (product,)
+        self._version += 1
+        self._cached_search.cache_clear()
+        if self._health_template is not None:
+            self._health_template["products_count"] = len(self._mock_products)
         self._logger.info(f"Added product {product.product_id} to mock data") 
\ No newline at end of file
@@ -6,17 +6,206 @@ functionality and relationship-based queries.
 """
 
 import asyncio
+import functools
+import itertools
 import logging
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+import re
+import time
+from collections import OrderedDict
+from typing import Dict, Any, AsyncIterator, FrozenSet, Hashable, List, Optional, Set, Tuple
+from datetime import datetime, timezone
 
-from neo4j import AsyncGraphDatabase
-from neo4j.exceptions import ServiceUnavailable
+from neo4j import READ_ACCESS, WRITE_ACCESS, AsyncGraphDatabase, AsyncSession, Record, RoutingControl
+from neo4j.exceptions import ServiceUnavailable, SessionExpired, TransientError
 
 from .base_connector import BaseDataConnector, DataSourceType
 from src.data.models import FinancialProduct, UserProfile, GraphNode, GraphRelationship
 
 
+# Search predicates in a fixed order, keyed by the parameter each one binds.
+# The text query is matched through the product_text fulltext index instead.
+_SEARCH_PREDICATES = (
+    ("query", None),
+    ("risk_level", "p.risk_level = $risk_level"),
+    ("product_type", "p.type = $product_type"),
+    ("after_name", "p.name > $after_name")
+)
+
+# Characters with special meaning in Lucene query syntax
+_LUCENE_SPECIAL_CHARS = re.compile(r'([+\-!(){}\[\]^"~*?:\\/&|])')
+# Bare words Lucene reads as boolean operators; only the uppercase forms are operators
+_LUCENE_OPERATOR_WORDS = re.compile(r"\b(AND|OR|NOT)\b")
+
+
+def _escape_lucene(text: str) -> str:
+    """Escape Lucene query syntax so user text is matched literally"""
+    text = _LUCENE_OPERATOR_WORDS.sub(lambda m: m.group(1).lower(), text)
+    return _LUCENE_SPECIAL_CHARS.sub(r"\\\1", text)
+
+
+def _search_match(shape: FrozenSet[str]) -> str:
+    """Build the clause that binds p, seeking the fulltext index for text queries"""
+    if "query" in shape:
+        return "CALL db.index.fulltext.queryNodes('product_text', $query) YIELD node AS p"
+    return "MATCH (p:Product)"
+
+
+def _search_where(shape: FrozenSet[str]) -> str:
+    """Build the WHERE clause for a set of active property predicates"""
+    conditions = [predicate for key, predicate in _SEARCH_PREDICATES if predicate and key in shape]
+    return f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+
+# Product properties returned by searches, in projection order
+_PRODUCT_FIELDS = (
+    "product_id", "name", "type", "risk_level", "description", "issuer",
+    "expected_return", "volatility", "sharpe_ratio", "minimum_investment",
+    "expense_ratio", "dividend_yield", "regulatory_status",
+    "compliance_requirements", "tags", "categories", "embedding_id",
+    "created_at", "updated_at"
+)
+
+# Relations expanded by graph searches, in projection order after the product
+# fields: (graph_data key, result column, pattern, collected value)
+_GRAPH_RELATIONS = (
+    ("similar_products", "similar_ids", "(p)-[:SIMILAR_TO]->(similar:Product)", "similar.product_id"),
+    ("categories", "category_names", "(p)-[:BELONGS_TO]->(category:Category)", "category.name"),
+    ("issuers", "issuer_names", "(p)-[:ISSUED_BY]->(issuer:Issuer)", "issuer.name")
+)
+
+_GRAPH_DATA_FIELDS = frozenset(key for key, _, _, _ in _GRAPH_RELATIONS)
+
+# Properties that default to an empty list when missing
+_LIST_PRODUCT_FIELDS = frozenset({"compliance_requirements", "tags", "categories"})
+
+# Properties stored as native DateTime values
+_TEMPORAL_PRODUCT_FIELDS = ("created_at", "updated_at")
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Make a datetime UTC-aware; naive values (datetime.utcnow) are taken as UTC"""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _project_product_field(field: str) -> str:
+    """Project one product property; temporals come back as ISO strings"""
+    if field in _LIST_PRODUCT_FIELDS:
+        return f"COALESCE(p.{field}, []) AS `{field}`"
+    if field in _TEMPORAL_PRODUCT_FIELDS:
+        return f"toString(p.{field}) AS `{field}`"
+    return f"p.{field} AS `{field}`"
+
+
+# Flat RETURN projection matching _PRODUCT_FIELDS
+_PRODUCT_PROJECTION = ", ".join(_project_product_field(field) for field in _PRODUCT_FIELDS)
+
+# Merges a batch sent as parallel per-property lists indexed by position
+_MERGE_PRODUCTS_QUERY = f"""
+    UNWIND range(0, size($product_id) - 1) AS i
+    MERGE (p:Product {{product_id: $product_id[i]}})
+    SET {", ".join(f"p.{field} = ${field}[i]" for field in _PRODUCT_FIELDS if field != "product_id")}
+"""
+
+# Converts timestamps written as ISO strings by earlier versions into native
+# DateTime values; toString(x) = x only holds for strings
+_TEMPORAL_MIGRATION_STATEMENTS = [
+    f"""
+        MATCH (p:Product)
+        WHERE toString(p.{field}) = p.{field}
+        SET p.{field} = datetime(p.{field})
+    """
+    for field in _TEMPORAL_PRODUCT_FIELDS
+]
+
+# Every combination of active search predicates
+_SEARCH_SHAPES = [
+    frozenset(keys)
+    for size in range(len(_SEARCH_PREDICATES) + 1)
+    for keys in itertools.combinations([key for key, _ in _SEARCH_PREDICATES], size)
+]
+
+# Prebuilt search queries per predicate combination, so each filter shape always
+# sends identical query text and reuses Neo4j's cached plan
+_STRUCTURED_SEARCH_QUERIES: Dict[FrozenSet[str], str] = {
+    shape: f"""
+        {_search_match(shape)}
+        {_search_where(shape)}
+        RETURN {_PRODUCT_PROJECTION}
+        ORDER BY `name`
+        SKIP $offset
+        LIMIT $limit
+    """
+    for shape in _SEARCH_SHAPES
+}
+
+
+def _graph_search_query(shape: FrozenSet[str], relations: FrozenSet[str]) -> str:
+    """Build a graph search that expands only the requested relations"""
+    expanded = [relation for relation in _GRAPH_RELATIONS if relation[0] in relations]
+    subqueries = "".join(
+        f"""
+        CALL {{
+            WITH p
+            MATCH {pattern}
+            RETURN collect(DISTINCT {value}) AS {column}
+        }}"""
+        for _, column, pattern, value in expanded
+    )
+    columns = "".join(f", {column}" for _, column, _, _ in expanded)
+    return f"""
+        {_search_match(shape)}
+        {_search_where(shape)}
+        WITH p
+        ORDER BY p.name
+        SKIP $offset
+        LIMIT $limit{subqueries}
+        RETURN {_PRODUCT_PROJECTION}{columns}
+        ORDER BY `name`
+    """
+
+
+# Every combination of requested relations
+_RELATION_SETS = [
+    frozenset(keys)
+    for size in range(len(_GRAPH_RELATIONS) + 1)
+    for keys in itertools.combinations(sorted(_GRAPH_DATA_FIELDS), size)
+]
+
+# Prebuilt graph searches per predicate shape and relation set
+_GRAPH_SEARCH_QUERIES: Dict[Tuple[FrozenSet[str], FrozenSet[str]], str] = {
+    (shape, relations): _graph_search_query(shape, relations)
+    for shape in _SEARCH_SHAPES
+    for relations in _RELATION_SETS
+}
+
+
+# Errors worth retrying: the cluster or connection recovers on its own
+_RETRYABLE_ERRORS = (TransientError, SessionExpired, ServiceUnavailable)
+
+# Node labels and filter keys accepted by graph node lookups; extend them
+# through the allowed_node_labels and allowed_node_filter_keys config keys
+_ALLOWED_LABELS = frozenset({"Node", "Product", "Category", "Issuer", "Sector", "RiskProfile"})
+_ALLOWED_FILTER_KEYS = frozenset({
+    "node_id", "node_type", "name", "type", "risk_level", "product_id", "issuer"
+})
+
+
+@functools.lru_cache(maxsize=256)
+def _graph_nodes_query(label: str, keys: Tuple[str, ...]) -> str:
+    """Build graph node lookup text once per validated label and sorted key set"""
+    where = " AND ".join(f"n.`{key}` = ${key}" for key in keys)
+    return f"""
+        MATCH (n:`{label}`)
+        {f"WHERE {where}" if where else ""}
+        RETURN n
+        LIMIT $limit
+    """
+
+
 class Neo4jConnector(BaseDataConnector):
     """
     Neo4j connector implementation.
@@ -25,6 +214,11 @@ class Neo4jConnector(BaseDataConnector):
     graph-based query capabilities for financial products and relationships.
     """
     
+    # Driver pool sizing used when the configuration leaves it out
+    POOL_DEFAULTS: Dict[str, Any] = {
+        "max_connection_pool_size": 100
+    }
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the Neo4j connector.
@@ -34,6 +228,21 @@ class Neo4jConnector(BaseDataConnector):
         """
         super().__init__(DataSourceType.NEO4J, config)
         self._driver = None
+        self._warmup_task: Optional[asyncio.Task] = None
+        # Pinned so sessions skip the home-database lookup
+        self._database = self.get_config("database", "neo4j")
+        self._query_semaphore = asyncio.Semaphore(self.get_config("max_concurrent_queries", 16))
+        # (monotonic time, result) of the last healthy probe
+        self._health_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._health_ttl = self.get_config("health_ttl_seconds", 5)
+        # Search results keyed on query text and parameters; the generation is
+        # bumped by every write so in-flight reads cannot store stale pages
+        self._result_cache: "OrderedDict[Hashable, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._result_cache_size = self.get_config("result_cache_size", 1024)
+        self._result_cache_ttl = self.get_config("result_cache_ttl_seconds", 30)
+        self._generation = 0
+        self._allowed_labels = _ALLOWED_LABELS | frozenset(self.get_config("allowed_node_labels", ()))
+        self._allowed_filter_keys = _ALLOWED_FILTER_KEYS | frozenset(self.get_config("allowed_node_filter_keys", ()))
         
     @property
     def source_name(self) -> str:
@@ -49,10 +258,17 @@ class Neo4jConnector(BaseDataConnector):
             password = self.get_config("password", "password")
             
             # Create driver
-            self._driver = AsyncGraphDatabase.driver(uri, auth=(username, password))
+            self._driver = AsyncGraphDatabase.driver(
+                uri,
+                auth=(username, password),
+                max_connection_pool_size=self.get_config(
+                    "max_connection_pool_size", self.POOL_DEFAULTS["max_connection_pool_size"]
+                ),
+                connection_acquisition_timeout=self.get_config("connection_acquisition_timeout", 30.0)
+            )
             
             # Test connection
-            async with self._driver.session() as session:
+            async with self._driver.session(database=self._database) as session:
                 result = await session.run("RETURN 1 as test")
                 record = await result.single()
                 if not record or record["test"] != 1:
@@ -61,6 +277,10 @@ class Neo4jConnector(BaseDataConnector):
             self._connected = True
             self._logger.info(f"Connected to Neo4j database: {uri}")
             
+            # Prime the page cache in the background so connect() returns now
+            if self.get_config("warmup", True):
+                self._warmup_task = asyncio.create_task(self._warm_up())
+            
         except Exception as e:
             self._logger.error(f"Failed to connect to Neo4j: {e}")
             raise
@@ -68,20 +288,59 @@ class Neo4jConnector(BaseDataConnector):
     async def disconnect(self):
         """Disconnect from Neo4j database"""
         try:
+            if self._warmup_task and not self._warmup_task.done():
+                self._warmup_task.cancel()
+            self._warmup_task = None
+            
             if self._driver:
                 await self._driver.close()
                 self._driver = None
             
+            self._health_cache = None
             self._connected = False
             self._logger.info("Disconnected from Neo4j database")
             
         except Exception as e:
             self._logger.error(f"Error disconnecting from Neo4j: {e}")
     
+    async def _warm_up(self):
+        """Touch the hot labels so the first real queries do not hit a cold page cache"""
+        for label in ("Product", "Category", "Issuer"):
+            await self.execute_query(f"MATCH (n:{label}) RETURN count(n) AS n")
+        
+        # APOC can also load index and property pages when it is installed
+        if self.get_config("warmup_apoc", False):
+            await self.execute_query("CALL apoc.warmup.run(true, true, true)")
+        
+        self._logger.info("Neo4j warm-up queries completed")
+    
+    def _session(self, write: bool = False) -> AsyncSession:
+        """
+        Open a session routed for reads or writes.
+        
+        Sessions share the bookmark manager used by driver.execute_query, so
+        a read routed to a replica still observes every earlier write made
+        through this connector.
+        
+        Args:
+            write: Route to a writer instead of a reader
+            
+        Returns:
+            AsyncSession: Driver session
+        """
+        return self._driver.session(
+            database=self._database,
+            default_access_mode=WRITE_ACCESS if write else READ_ACCESS,
+            bookmark_manager=self._driver.execute_query_bookmark_manager
+        )
+    
     async def health_check(self) -> Dict[str, Any]:
         """
         Perform a health check on the Neo4j connector.
         
+        A healthy result is reused for health_ttl_seconds so frequent probes
+        do not each cost a round-trip; failures are never cached.
+        
         Returns:
             Dict[str, Any]: Health check results
         """
@@ -93,18 +352,24 @@ class Neo4jConnector(BaseDataConnector):
                     "error": "Not connected to database"
                 }
             
+            now = time.monotonic()
+            if self._health_cache and now - self._health_cache[0] < self._health_ttl:
+                return dict(self._health_cache[1])
+            
             # Test connection with a simple query
-            async with self._driver.session() as session:
+            async with self._session() as session:
                 result = await session.run("RETURN 1 as test")
                 record = await result.single()
                 
                 if record and record["test"] == 1:
-                    return {
+                    health = {
                         "status": "healthy",
                         "source": self.source_name,
                         "connected": True,
                         "timestamp": datetime.now().isoformat()
                     }
+                    self._health_cache = (now, health)
+                    return dict(health)
                 else:
                     return {
                         "status": "unhealthy",
@@ -119,13 +384,22 @@ class Neo4jConnector(BaseDataConnector):
                 "error": str(e)
             }
     
-    async def execute_query(self, query: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    async def execute_query(self, query: str, params: Optional[Dict[str, Any]] = None,
+                            write: bool = False) -> List[Dict[str, Any]]:
         """
         Execute a Cypher query on Neo4j.
         
+        At most max_concurrent_queries queries (default 16) run at once, so
+        fanned-out callers cannot exhaust the connection pool.
+        
+        Uses the driver's pooled one-shot API rather than opening a session
+        per call; it runs in a managed transaction, so transient errors are
+        retried by the driver before anything is reported here.
+        
         Args:
             query: Cypher query string
             params: Query parameters
+            write: Route the query to a writer instead of a reader
             
         Returns:
             List[Dict[str, Any]]: Query results
@@ -133,16 +407,144 @@ class Neo4jConnector(BaseDataConnector):
         try:
             await self.ensure_connected()
             
-            async with self._driver.session() as session:
-                result = await session.run(query, params or {})
-                records = await result.data()
-                
-                return records
-                
+            async with self._query_semaphore:
+                records, _, _ = await self._driver.execute_query(
+                    query,
+                    params or {},
+                    routing_=RoutingControl.WRITE if write else RoutingControl.READ,
+                    database_=self._database
+                )
+            
+            return [record.data() for record in records]
+            
         except Exception as e:
             self._logger.error(f"Error executing query: {e}")
             return []
     
+    async def stream_query(self, query: str,
+                           params: Optional[Dict[str, Any]] = None) -> AsyncIterator[Record]:
+        """
+        Stream the records of a read query one at a time.
+        
+        Unlike execute_query, records are not buffered into a list first, so
+        callers can transform large results in a single pass. Transient
+        failures are retried with exponential backoff until the first record
+        has been yielded; after that, and for other errors, they are raised
+        to the caller.
+        
+        Args:
+            query: Cypher query string
+            params: Query parameters
+            
+        Yields:
+            Record: Query records as they arrive
+        """
+        await self.ensure_connected()
+        
+        max_retries = self.get_config("max_retries", 3)
+        backoff = self.get_config("retry_backoff_seconds", 0.1)
+        
+        for attempt in range(max_retries + 1):
+            yielded = False
+            try:
+                async with self._query_semaphore, \
+                        self._session() as session:
+                    result = await session.run(query, params or {})
+                    async for record in result:
+                        yielded = True
+                        yield record
+                return
+                
+            except _RETRYABLE_ERRORS as e:
+                if yielded or attempt == max_retries:
+                    raise
+                
+                delay = backoff * 2 ** attempt
+                self._logger.warning(f"Transient Neo4j error, retrying in {delay:.2f}s: {e}")
+                await asyncio.sleep(delay)
+    
+    def _search_params(self, query: str, filters: Dict[str, Any],
+                       limit: int, offset: int) -> Tuple[FrozenSet[str], Dict[str, Any]]:
+        """
+        Collect search parameters and the shape of the active predicates.
+        
+        A filters["after_name"] cursor (the name of the last product on the
+        previous page) switches to keyset pagination and ignores offset.
+        
+        Args:
+            query: Search query
+            filters: Search filters
+            limit: Maximum number of results
+            offset: Result offset
+            
+        Returns:
+            Tuple[FrozenSet[str], Dict[str, Any]]: Predicate shape and query parameters
+        """
+        params = {"offset": offset, "limit": limit}
+        
+        if query:
+            params["query"] = _escape_lucene(query)
+        
+        if filters:
+            if "risk_level" in filters:
+                params["risk_level"] = filters["risk_level"]
+            
+            if "product_type" in filters:
+                params["product_type"] = filters["product_type"]
+            
+            # Keyset pagination: resume after the last name of the previous page
+            if filters.get("after_name") is not None:
+                params["after_name"] = filters["after_name"]
+                params["offset"] = 0
+        
+        if params["offset"] > limit * 10:
+            self._logger.warning(
+                f"Deep Neo4j pagination with offset {offset}; pass filters['after_name'] "
+                f"to page by keyset instead"
+            )
+        
+        shape = frozenset(key for key, _ in _SEARCH_PREDICATES if key in params)
+        return shape, params
+    
+    @staticmethod
+    def _result_cache_key(cypher_query: str, params: Dict[str, Any]) -> Optional[Hashable]:
+        """Build a result cache key, or None if a parameter is unhashable"""
+        key = (cypher_query, tuple(sorted(params.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+    
+    def _cached_results(self, key: Optional[Hashable]) -> Optional[List[Dict[str, Any]]]:
+        """Return a copy of fresh cached results for a key"""
+        entry = self._result_cache.get(key) if key is not None else None
+        if entry is None:
+            return None
+        
+        stored_at, results = entry
+        if time.monotonic() - stored_at > self._result_cache_ttl:
+            del self._result_cache[key]
+            return None
+        
+        self._result_cache.move_to_end(key)
+        return list(results)
+    
+    def _store_results(self, key: Optional[Hashable], generation: int, results: List[Dict[str, Any]]):
+        """Cache results unless a write happened since the read started"""
+        if key is None or generation != self._generation:
+            return
+        
+        self._result_cache[key] = (time.monotonic(), list(results))
+        self._result_cache.move_to_end(key)
+        while len(self._result_cache) > self._result_cache_size:
+            self._result_cache.popitem(last=False)
+    
+    def invalidate_result_cache(self):
+        """Drop cached search results after the graph has changed"""
+        self._generation += 1
+        self._result_cache.clear()
+    
     async def _search_products_structured(self, query: str, filters: Dict[str, Any], 
                                         limit: int, offset: int) -> List[Dict[str, Any]]:
         """
@@ -158,74 +560,67 @@ class Neo4jConnector(BaseDataConnector):
             List[Dict[str, Any]]: Product results
         """
         try:
-            # Build Cypher query
-            cypher_query = """
-                MATCH (p:Product)
-                WHERE 1=1
-            """
-            
-            params = {}
-            
-            # Add search conditions
-            if query:
-                cypher_query += " AND (p.name CONTAINS $query OR p.description CONTAINS $query)"
-                params["query"] = query
-            
-            # Add filters
-            if filters:
-                if "risk_level" in filters:
-                    cypher_query += " AND p.risk_level = $risk_level"
-                    params["risk_level"] = filters["risk_level"]
-                
-                if "product_type" in filters:
-                    cypher_query += " AND p.type = $product_type"
-                    params["product_type"] = filters["product_type"]
+            shape, params = self._search_params(query, filters, limit, offset)
+            cypher_query = _STRUCTURED_SEARCH_QUERIES[shape]
             
-            # Add return and pagination
-            cypher_query += """
-                RETURN p
-                ORDER BY p.name
-                SKIP $offset
-                LIMIT $limit
-            """
-            params["offset"] = offset
-            params["limit"] = limit
-            
-            results = await self.execute_query(cypher_query, params)
+            cache_key = self._result_cache_key(cypher_query, params)
+            cached = self._cached_results(cache_key)
+            if cached is not None:
+                return cached
+            generation = self._generation
             
-            # Convert to product format
+            # Convert to product format as records arrive
             products = []
-            for record in results:
-                product_node = record["p"]
-                product_data = {
-                    "product_id": product_node.get("product_id"),
-                    "name": product_node.get("name"),
-                    "type": product_node.get("type"),
-                    "risk_level": product_node.get("risk_level"),
-                    "description": product_node.get("description"),
-                    "issuer": product_node.get("issuer"),
-                    "expected_return": product_node.get("expected_return"),
-                    "volatility": product_node.get("volatility"),
-                    "sharpe_ratio": product_node.get("sharpe_ratio"),
-                    "minimum_investment": product_node.get("minimum_investment"),
-                    "expense_ratio": product_node.get("expense_ratio"),
-                    "dividend_yield": product_node.get("dividend_yield"),
-                    "regulatory_status": product_node.get("regulatory_status"),
-                    "compliance_requirements": product_node.get("compliance_requirements", []),
-                    "tags": product_node.get("tags", []),
-                    "categories": product_node.get("categories", []),
-                    "embedding_id": product_node.get("embedding_id"),
-                    "created_at": product_node.get("created_at"),
-                    "updated_at": product_node.get("updated_at")
-                }
-                products.append(product_data)
+            async for record in self.stream_query(cypher_query, params):
+                products.append(dict(zip(_PRODUCT_FIELDS, record.values())))
             
+            self._store_results(cache_key, generation, products)
             return products
             
         except Exception as e:
             self._logger.error(f"Error in structured product search: {e}")
             return []
     
+    async def iter_products(self, query: Optional[str] = None, filters: Optional[Dict[str, Any]] = None,
+                            page_size: int = 100) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over all matching products page by page.
+        
+        The next page is requested as soon as the current one arrives, so
+        Neo4j works on it while the caller consumes the current rows.
+        
+        Args:
+            query: Search query
+            filters: Search filters
+            page_size: Number of products fetched per round-trip
+            
+        Yields:
+            Dict[str, Any]: Product results
+        """
+        offset = 0
+        next_page = asyncio.create_task(
+            self._search_products_structured(query, filters, page_size, offset)
+        )
+        
+        try:
+            while next_page is not None:
+                page = await next_page
+                offset += page_size
+                
+                # A short page is the last one
+                next_page = None
+                if len(page) == page_size:
+                    next_page = asyncio.create_task(
+                        self._search_products_structured(query, filters, page_size, offset)
+                    )
+                
+                for product in page:
+                    yield product
+                    
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+    
     async def _search_products_vector(self, query: str, filters: Dict[str, Any], 
                                     limit: int, offset: int) -> List[Dict[str, Any]]:
         """
@@ -249,7 +644,8 @@ class Neo4jConnector(BaseDataConnector):
         return await self._search_products_structured(query, filters, limit, offset)
     
     async def _search_products_graph(self, query: str, filters: Dict[str, Any], 
-                                   limit: int, offset: int) -> List[Dict[str, Any]]:
+                                   limit: int, offset: int,
+                                   relations: Optional[Set[str]] = None) -> List[Dict[str, Any]]:
         """
         Search products using graph queries.
         
@@ -258,88 +654,38 @@ class Neo4jConnector(BaseDataConnector):
             filters: Search filters
             limit: Maximum number of results
             offset: Result offset
+            relations: graph_data fields to expand (similar_products,
+                categories, issuers); all of them when None
             
         Returns:
             List[Dict[str, Any]]: Product results
         """
         try:
-            # Build graph query based on relationships
-            cypher_query = """
-                MATCH (p:Product)
-                OPTIONAL MATCH (p)-[:SIMILAR_TO]->(similar:Product)
-                OPTIONAL MATCH (p)-[:BELONGS_TO]->(category:Category)
-                OPTIONAL MATCH (p)-[:ISSUED_BY]->(issuer:Issuer)
-                WHERE 1=1
-            """
-            
-            params = {}
-            
-            # Add search conditions
-            if query:
-                cypher_query += " AND (p.name CONTAINS $query OR p.description CONTAINS $query)"
-                params["query"] = query
-            
-            # Add filters
-            if filters:
-                if "risk_level" in filters:
-                    cypher_query += " AND p.risk_level = $risk_level"
-                    params["risk_level"] = filters["risk_level"]
-                
-                if "product_type" in filters:
-                    cypher_query += " AND p.type = $product_type"
-                    params["product_type"] = filters["product_type"]
+            relations = _GRAPH_DATA_FIELDS if relations is None else frozenset(relations)
+            unknown = relations - _GRAPH_DATA_FIELDS
+            if unknown:
+                raise ValueError(f"Unsupported graph relations: {sorted(unknown)}")
             
-            # Add return with relationships
-            cypher_query += """
-                RETURN p, 
-                       collect(DISTINCT similar) as similar_products,
-                       collect(DISTINCT category) as categories,
-                       collect(DISTINCT issuer) as issuers
-                ORDER BY p.name
-                SKIP $offset
-                LIMIT $limit
-            """
-            params["offset"] = offset
-            params["limit"] = limit
+            shape, params = self._search_params(query, filters, limit, offset)
+            cypher_query = _GRAPH_SEARCH_QUERIES[(shape, relations)]
             
-            results = await self.execute_query(cypher_query, params)
+            cache_key = self._result_cache_key(cypher_query, params)
+            cached = self._cached_results(cache_key)
+            if cached is not None:
+                return cached
+            generation = self._generation
             
-            # Convert to product format with relationship data
+            # Convert to product format with relationship data as records arrive
             products = []
-            for record in results:
-                product_node = record["p"]
-                similar_products = record.get("similar_products", [])
-                categories = record.get("categories", [])
-                issuers = record.get("issuers", [])
-                
-                product_data = {
-                    "product_id": product_node.get("product_id"),
-                    "name": product_node.get("name"),
-                    "type": product_node.get("type"),
-                    "risk_level": product_node.get("risk_level"),
-                    "description": product_node.get("description"),
-                    "issuer": product_node.get("issuer"),
-                    "expected_return": product_node.get("expected_return"),
-                    "volatility": product_node.get("volatility"),
-                    "sharpe_ratio": product_node.get("sharpe_ratio"),
-                    "minimum_investment": product_node.get("minimum_investment"),
-                    "expense_ratio": product_node.get("expense_ratio"),
-                    "dividend_yield": product_node.get("dividend_yield"),
-                    "regulatory_status": product_node.get("regulatory_status"),
-                    "compliance_requirements": product_node.get("compliance_requirements", []),
-                    "tags": product_node.get("tags", []),
-                    "categories": product_node.get("categories", []),
-                    "embedding_id": product_node.get("embedding_id"),
-                    "created_at": product_node.get("created_at"),
-                    "updated_at": product_node.get("updated_at"),
-                    "graph_data": {
-                        "similar_products": [p.get("product_id") for p in similar_products if p.get("product_id")],
-                        "categories": [c.get("name") for c in categories if c.get("name")],
-                        "issuers": [i.get("name") for i in issuers if i.get("name")]
-                    }
-                }
+            split = len(_PRODUCT_FIELDS)
+            graph_keys = [key for key, _, _, _ in _GRAPH_RELATIONS if key in relations]
+            async for record in self.stream_query(cypher_query, params):
+                row = record.values()
+                product_data = dict(zip(_PRODUCT_FIELDS, row[:split]))
+                product_data["graph_data"] = dict(zip(graph_keys, row[split:]))
                 products.append(product_data)
             
+            self._store_results(cache_key, generation, products)
             return products
             
         except Exception as e:
@@ -368,27 +714,22 @@ class Neo4jConnector(BaseDataConnector):
             
         Returns:
             List[Dict[str, Any]]: Graph node results
+            
+        Raises:
+            ValueError: If the label or a filter key is not whitelisted
         """
+        label = node_type if node_type else "Node"
+        if label not in self._allowed_labels:
+            raise ValueError(f"Unsupported node label: {label}")
+        
+        params = dict(filters) if filters else {}
+        unknown_keys = params.keys() - self._allowed_filter_keys
+        if unknown_keys:
+            raise ValueError(f"Unsupported node filter keys: {sorted(unknown_keys)}")
+        
         try:
-            # Build Cypher query for nodes
-            cypher_query = f"""
-                MATCH (n:{node_type if node_type else 'Node'})
-                WHERE 1=1
-            """
-            
-            params = {}
-            
-            # Add filters
-            if filters:
-                for key, value in filters.items():
-                    cypher_query += f" AND n.{key} = ${key}"
-                    params[key] = value
-            
-            # Add return and limit
-            cypher_query += f"""
-                RETURN n
-                LIMIT $limit
-            """
+            # Identical label and key sets always produce identical query text
+            cypher_query = _graph_nodes_query(label, tuple(sorted(params)))
             params["limit"] = limit
             
             results = await self.execute_query(cypher_query, params)
@@ -444,44 +785,31 @@ class Neo4jConnector(BaseDataConnector):
                 params["target_node_id"] = target_node_id
             
             if relationship_type:
-                cypher_query += f" AND type(r) = $relationship_type"
-                params["relationship_type"] = relationship_type
+                # Cypher relationship types are upper case (SIMILAR_TO)
+                cypher_query += " AND type(r) = $relationship_type"
+                params["relationship_type"] = relationship_type.upper()
             
-            # Add return and limit
+            # Add return and limit; project primitives so no Node or
+            # Relationship objects have to be built per row
             cypher_query += """
-                RETURN source, r, target
+                RETURN COALESCE(r.relationship_id, elementId(r)) AS relationship_id,
+                       source.node_id AS source_node_id,
+                       target.node_id AS target_node_id,
+                       toLower(type(r)) AS relationship_type,
+                       properties(r) AS properties
                 LIMIT $limit
             """
             params["limit"] = limit
             
-            results = await self.execute_query(cypher_query, params)
-            
-            # Convert to relationship format
-            relationships = []
-            for record in results:
-                source = record["source"]
-                rel = record["r"]
-                target = record["target"]
-                
-                relationship_data = {
-                    "relationship_id": rel.get("relationship_id"),
-                    "source_node_id": source.get("node_id"),
-                    "target_node_id": target.get("node_id"),
-                    "relationship_type": type(rel).__name__,
-                    "properties": dict(rel),
-                    "source_properties": dict(source),
-                    "target_properties": dict(target)
-                }
-                relationships.append(relationship_data)
-            
-            return relationships
+            # Records already match the relationship format
+            return await self.execute_query(cypher_query, params)
             
         except Exception as e:
             self._logger.error(f"Error getting graph relationships: {e}")
             return []
     
     async def create_graph_schema(self):
-        """Create graph schema and constraints"""
+        """Create graph schema, constraints and search indexes"""
         try:
             # Create constraints
             constraints = [
@@ -490,8 +818,25 @@ class Neo4jConnector(BaseDataConnector):
                 "CREATE CONSTRAINT issuer_name IF NOT EXISTS FOR (i:Issuer) REQUIRE i.name IS UNIQUE"
             ]
             
-            for constraint in constraints:
-                await self.execute_query(constraint)
+            # Indexes backing the search filters and text queries
+            indexes = [
+                "CREATE INDEX product_name IF NOT EXISTS FOR (p:Product) ON (p.name)",
+                "CREATE INDEX product_risk_level IF NOT EXISTS FOR (p:Product) ON (p.risk_level)",
+                "CREATE INDEX product_type IF NOT EXISTS FOR (p:Product) ON (p.type)",
+                "CREATE INDEX product_type_risk IF NOT EXISTS FOR (p:Product) ON (p.type, p.risk_level)",
+                "CREATE FULLTEXT INDEX product_text IF NOT EXISTS FOR (p:Product) ON EACH [p.name, p.description]"
+            ]
+            
+            # Deployment-specific DDL appended from config
+            statements = constraints + indexes + list(self.get_config("schema_statements", []))
+            
+            # Apply every statement in one managed transaction: a single commit
+            # instead of one implicit transaction per statement
+            await self.ensure_connected()
+            async with self._query_semaphore, \
+                    self._session(write=True) as session:
+                await session.execute_write(self._run_statements, statements)
+            self.invalidate_result_cache()
             
             self._logger.info("Neo4j graph schema created successfully")
             
@@ -499,61 +844,90 @@ class Neo4jConnector(BaseDataConnector):
             self._logger.error(f"Error creating graph schema: {e}")
             raise
     
-    async def add_product_node(self, product: FinancialProduct):
+    async def migrate_product_timestamps(self):
+        """Convert string product timestamps written by earlier versions to DateTime"""
+        try:
+            await self.ensure_connected()
+            async with self._query_semaphore, \
+                    self._session(write=True) as session:
+                await session.execute_write(self._run_statements, _TEMPORAL_MIGRATION_STATEMENTS)
+            self.invalidate_result_cache()
+            
+            self._logger.info("Migrated Neo4j product timestamps to DateTime")
+            
+        except Exception as e:
+            self._logger.error(f"Error migrating product timestamps: {e}")
+            raise
+    
+    @staticmethod
+    async def _run_statements(tx, statements: List[str]):
+        """Run a sequence of statements inside one transaction"""
+        for statement in statements:
+            await tx.run(statement)
+    
+    @staticmethod
+    def _product_columns(products: List[FinancialProduct]) -> Dict[str, List[Any]]:
         """
-        Add a product node to Neo4j.
+        Serialize products as one parallel list per stored property.
+        
+        Datetimes are kept native so the driver sends bolt DateTime values
+        rather than ISO strings. They are made UTC-aware first: the driver
+        stores naive datetimes as LocalDateTime, which does not compare with
+        the zoned DateTime values the timestamp migration writes.
         
         Args:
-            product: Financial product to add
+            products: Financial products to serialize
+            
+        Returns:
+            Dict[str, List[Any]]: Property name to per-product values
+        """
+        columns = {field: [getattr(product, field) for product in products] for field in _PRODUCT_FIELDS}
+        for field in _TEMPORAL_PRODUCT_FIELDS:
+            columns[field] = [_as_utc(value) for value in columns[field]]
+        return columns
+    
+    @staticmethod
+    async def _merge_product_columns(tx, columns: Dict[str, List[Any]]):
+        """Merge a batch of product columns inside a write transaction"""
+        result = await tx.run(_MERGE_PRODUCTS_QUERY, columns)
+        await result.consume()
+    
+    async def add_product_nodes(self, products: List[FinancialProduct], batch_size: int = 1000):
+        """
+        Add product nodes to Neo4j in batches.
+        
+        Each batch is merged with a single UNWIND statement, so ingesting N
+        products takes N / batch_size round-trips instead of N. Batches are
+        sent as parallel lists rather than one map per product, which avoids
+        repeating every property name per row on the wire.
+        
+        Args:
+            products: Financial products to add
+            batch_size: Number of products merged per transaction
         """
         try:
-            cypher_query = """
-                MERGE (p:Product {product_id: $product_id})
-                SET p.name = $name,
-                    p.type = $type,
-                    p.risk_level = $risk_level,
-                    p.description = $description,
-                    p.issuer = $issuer,
-                    p.expected_return = $expected_return,
-                    p.volatility = $volatility,
-                    p.sharpe_ratio = $sharpe_ratio,
-                    p.minimum_investment = $minimum_investment,
-                    p.expense_ratio = $expense_ratio,
-                    p.dividend_yield = $dividend_yield,
-                    p.regulatory_status = $regulatory_status,
-                    p.compliance_requirements = $compliance_requirements,
-                    p.tags = $tags,
-                    p.categories = $categories,
-                    p.embedding_id = $embedding_id,
-                    p.created_at = $created_at,
-                    p.updated_at = $updated_at
-            """
+            await self.ensure_connected()
             
-            params = {
-                "product_id": product.product_id,
-                "name": product.name,
-                "type": product.type,
-                "risk_level": product.risk_level,
-                "description": product.description,
-                "issuer": product.issuer,
-                "expected_return": product.expected_return,
-                "volatility": product.volatility,
-                "sharpe_ratio": product.sharpe_ratio,
-                "minimum_investment": product.minimum_investment,
-                "expense_ratio": product.expense_ratio,
-                "dividend_yield": product.dividend_yield,
-                "regulatory_status": product.regulatory_status,
-                "compliance_requirements": product.compliance_requirements,
-                "tags": product.tags,
-                "categories": product.categories,
-                "embedding_id": product.embedding_id,
-                "created_at": product.created_at.isoformat() if product.created_at else None,
-                "updated_at": product.updated_at.isoformat() if product.updated_at else None
-            }
+            async with self._session(write=True) as session:
+                for start in range(0, len(products), batch_size):
+                    columns = self._product_columns(products[start:start + batch_size])
+                    await session.execute_write(self._merge_product_columns, columns)
             
-            await self.execute_query(cypher_query, params)
-            self._logger.info(f"Added product node to Neo4j: {product.product_id}")
+            self._logger.info(f"Added {len(products)} product nodes to Neo4j")
             
         except Exception as e:
-            self._logger.error(f"Error adding product node to Neo4j: {e}")
-            raise 
\ No newline at end of file
+            self._logger.error(f"Error adding product nodes to Neo4j: {e}")
+            raise
+        
+        finally:
+            # Earlier batches may have committed even if a later one failed
+            self.invalidate_result_cache()
+    
+    async def add_product_node(self, product: FinancialProduct):
+        """
+        Add a product node to Neo4j.
+        
+        Args:
+            product: Financial product to add
+        """
+        await self.add_product_nodes([product])
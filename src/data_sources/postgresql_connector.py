@@ -6,19 +6,140 @@ data storage and retrieval of financial products and user profiles.
 """
 
 import asyncio
+import functools
 import logging
-from typing import Dict, Any, List, Optional
+import operator
+import re
+import time
+from collections import OrderedDict
+from typing import Dict, Any, AsyncIterator, Hashable, List, Optional, Tuple
 from datetime import datetime
 
 import asyncpg
-from sqlalchemy import create_engine, text
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
 
 from .base_connector import BaseDataConnector, DataSourceType
 from src.data.models import FinancialProduct, UserProfile, GraphNode, GraphRelationship
 
 
+# :name placeholders, skipping PostgreSQL ::type casts
+_NAMED_PARAM = re.compile(r"(?<![:\w]):([A-Za-z_]\w*)")
+
+
+@functools.lru_cache(maxsize=512)
+def _to_positional(sql: str) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Rewrite :name placeholders into asyncpg's $n form.
+    
+    A name used more than once maps to the same position.
+    
+    Args:
+        sql: SQL with :name placeholders
+        
+    Returns:
+        Tuple[str, Tuple[str, ...]]: Rewritten SQL and parameter names by position
+    """
+    names: List[str] = []
+    
+    def replace(match: "re.Match[str]") -> str:
+        name = match.group(1)
+        if name not in names:
+            names.append(name)
+        return f"${names.index(name) + 1}"
+    
+    return _NAMED_PARAM.sub(replace, sql), tuple(names)
+
+
+
+# Product column projections: summary rows skip the wide text and array columns
+_SUMMARY_PRODUCT_COLUMNS = (
+    "product_id", "name", "type", "risk_level", "minimum_investment", "expected_return"
+)
+_FULL_PRODUCT_COLUMNS = (
+    "product_id", "name", "type", "risk_level", "description", "issuer",
+    "inception_date", "expected_return", "volatility", "sharpe_ratio",
+    "minimum_investment", "expense_ratio", "dividend_yield",
+    "regulatory_status", "compliance_requirements", "tags", "categories",
+    "embedding_id", "created_at", "updated_at"
+)
+_PRODUCT_PROJECTIONS = {
+    "summary": ", ".join(_SUMMARY_PRODUCT_COLUMNS),
+    "full": ", ".join(_FULL_PRODUCT_COLUMNS)
+}
+
+
+# Text match conditions by mode
+_PRODUCT_TEXT_CONDITIONS = {
+    # Name prefix (autocomplete) matches use the stored name_lower B-tree
+    "prefix": "name_lower LIKE :query",
+    "substring": "(name ILIKE :query OR description ILIKE :query)"
+}
+
+# Filter conditions in a fixed order, keyed by the parameter each one binds
+_PRODUCT_FILTER_CONDITIONS = (
+    ("risk_level", "risk_level = :risk_level"),
+    ("product_type", "type = :product_type"),
+    ("min_investment", "minimum_investment >= :min_investment"),
+    ("max_investment", "minimum_investment <= :max_investment")
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _search_products_sql(fields: str, text_mode: Optional[str], active_filters: Tuple[str, ...]) -> str:
+    """
+    Build product search SQL once per projection, text mode and filter set.
+    
+    Args:
+        fields: Column projection, "full" or "summary"
+        text_mode: "prefix", "substring" or None when there is no query
+        active_filters: Names of the active filters in _PRODUCT_FILTER_CONDITIONS order
+        
+    Returns:
+        str: SQL with :name placeholders
+    """
+    conditions = [_PRODUCT_TEXT_CONDITIONS[text_mode]] if text_mode else []
+    conditions.extend(condition for name, condition in _PRODUCT_FILTER_CONDITIONS if name in active_filters)
+    where = "".join(f" AND {condition}" for condition in conditions)
+    
+    return f"""
+        SELECT {_PRODUCT_PROJECTIONS[fields]}
+        FROM financial_products
+        WHERE 1=1{where}
+        ORDER BY name LIMIT :limit OFFSET :offset
+    """
+
+
+def _escape_like(text: str) -> str:
+    """Escape LIKE wildcards so user text is matched literally"""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+
+# user_profiles columns in insert order
+_PROFILE_COLUMNS = (
+    "user_id", "name", "email", "age", "income_level", "investment_experience",
+    "risk_tolerance", "investment_goals", "time_horizon", "preferred_product_types",
+    "preferred_sectors", "geographic_preferences", "current_portfolio_value",
+    "monthly_investment_capacity", "created_at", "updated_at"
+)
+
+_GET_USER_PROFILE_SQL = f"""
+    SELECT {", ".join(_PROFILE_COLUMNS)}
+    FROM user_profiles
+    WHERE user_id = :user_id
+"""
+
+# Reads a profile's columns into an insert row tuple in one call
+_profile_row = operator.attrgetter(*_PROFILE_COLUMNS)
+
+# Upsert with positional placeholders so executemany can reuse one prepared statement
+_UPSERT_PROFILE_SQL = f"""
+    INSERT INTO user_profiles ({", ".join(_PROFILE_COLUMNS)})
+    VALUES ({", ".join(f"${position}" for position in range(1, len(_PROFILE_COLUMNS) + 1))})
+    ON CONFLICT (user_id) DO UPDATE SET
+        {", ".join(f"{column} = EXCLUDED.{column}" for column in _PROFILE_COLUMNS if column not in ("user_id", "created_at"))}
+"""
+
+
 class PostgreSQLConnector(BaseDataConnector):
     """
     PostgreSQL connector implementation.
@@ -27,6 +148,15 @@ class PostgreSQLConnector(BaseDataConnector):
     structured query capabilities for financial products and user profiles.
     """
     
+    # Pool sizing used when the configuration leaves it out; sized to serve
+    # concurrent fan-out queries without serializing
+    POOL_DEFAULTS: Dict[str, Any] = {
+        "min_size": 10,
+        "max_size": 25,
+        "max_queries": 50000,
+        "max_inactive_connection_lifetime": 300.0
+    }
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the PostgreSQL connector.
@@ -35,8 +165,17 @@ class PostgreSQLConnector(BaseDataConnector):
             config: Configuration dictionary with PostgreSQL connection details
         """
         super().__init__(DataSourceType.POSTGRESQL, config)
-        self._engine = None
-        self._session_factory = None
+        self._pool: Optional[asyncpg.Pool] = None
+        # Search results keyed on the normalized search arguments; the
+        # generation is bumped on writes so in-flight reads cannot store
+        # stale pages
+        self._search_cache: "OrderedDict[Hashable, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._search_cache_size = self.get_config("search_cache_size", 1024)
+        self._search_cache_ttl = self.get_config("search_cache_ttl_seconds", 60)
+        self._search_inflight: Dict[Tuple[Hashable, int], "asyncio.Future[List[Dict[str, Any]]]"] = {}
+        self._generation = 0
+        # Monotonic time since when the pool has had no idle connection
+        self._pool_exhausted_since: Optional[float] = None
         
     @property
     def source_name(self) -> str:
@@ -53,23 +192,30 @@ class PostgreSQLConnector(BaseDataConnector):
             username = self.get_config("username", "postgres")
             password = self.get_config("password", "")
             
-            # Create async engine
-            connection_string = f"postgresql+asyncpg://{username}:{password}@{host}:{port}/{database}"
-            self._engine = create_async_engine(
-                connection_string,
-                echo=self.get_config("echo", False),
-                pool_size=self.get_config("pool_size", 10),
-                max_overflow=self.get_config("max_overflow", 20)
-            )
-            
-            # Create session factory
-            self._session_factory = sessionmaker(
-                self._engine, class_=AsyncSession, expire_on_commit=False
+            # Create a shared asyncpg pool; queries skip the SQLAlchemy layers
+            self._pool = await asyncpg.create_pool(
+                host=host,
+                port=port,
+                user=username,
+                password=password,
+                database=database,
+                min_size=self.get_config("min_size", self.POOL_DEFAULTS["min_size"]),
+                max_size=self.get_config("max_size", self.POOL_DEFAULTS["max_size"]),
+                max_queries=self.get_config("max_queries", self.POOL_DEFAULTS["max_queries"]),
+                max_inactive_connection_lifetime=self.get_config(
+                    "max_inactive_connection_lifetime", self.POOL_DEFAULTS["max_inactive_connection_lifetime"]
+                ),
+                command_timeout=self.get_config("command_timeout", 60),
+                # Prepared statements stay cached for the connection's lifetime;
+                # the module only issues a handful of distinct statements
+                statement_cache_size=self.get_config("statement_cache_size", 1024),
+                max_cached_statement_lifetime=self.get_config("max_cached_statement_lifetime", 0),
+                max_cacheable_statement_size=self.get_config("max_cacheable_statement_size", 16 * 1024)
             )
             
             # Test connection
-            async with self._engine.begin() as conn:
-                await conn.execute(text("SELECT 1"))
+            if await self._pool.fetchval("SELECT 1") != 1:
+                raise Exception("Connection test failed")
             
             self._connected = True
             self._logger.info(f"Connected to PostgreSQL database: {database}")
@@ -81,10 +227,9 @@ class PostgreSQLConnector(BaseDataConnector):
     async def disconnect(self):
         """Disconnect from PostgreSQL database"""
         try:
-            if self._engine:
-                await self._engine.dispose()
-                self._engine = None
-                self._session_factory = None
+            if self._pool:
+                await self._pool.close()
+                self._pool = None
             
             self._connected = False
             self._logger.info("Disconnected from PostgreSQL database")
@@ -92,6 +237,41 @@ class PostgreSQLConnector(BaseDataConnector):
         except Exception as e:
             self._logger.error(f"Error disconnecting from PostgreSQL: {e}")
     
+    async def pool_stats(self) -> Dict[str, Any]:
+        """
+        Report connection pool usage.
+        
+        Logs a warning when the pool has been fully checked out for longer
+        than pool_exhaustion_warning_seconds, a sign that max_size is too
+        small for the offered concurrency.
+        
+        Returns:
+            Dict[str, Any]: Pool size, idle connections and configured bounds
+        """
+        if not self._pool:
+            return {"size": 0, "idle": 0, "min": 0, "max": 0}
+        
+        stats = {
+            "size": self._pool.get_size(),
+            "idle": self._pool.get_idle_size(),
+            "min": self._pool.get_min_size(),
+            "max": self._pool.get_max_size()
+        }
+        
+        now = time.monotonic()
+        if stats["idle"] == 0 and stats["size"] >= stats["max"]:
+            if self._pool_exhausted_since is None:
+                self._pool_exhausted_since = now
+            elif now - self._pool_exhausted_since > self.get_config("pool_exhaustion_warning_seconds", 10.0):
+                self._logger.warning(
+                    f"PostgreSQL pool exhausted for {now - self._pool_exhausted_since:.1f}s "
+                    f"(size={stats['size']}, max={stats['max']})"
+                )
+        else:
+            self._pool_exhausted_since = None
+        
+        return stats
+    
     async def health_check(self) -> Dict[str, Any]:
         """
         Perform a health check on the PostgreSQL connector.
@@ -107,25 +287,27 @@ class PostgreSQLConnector(BaseDataConnector):
                     "error": "Not connected to database"
                 }
             
-            # Test connection with a simple query
-            async with self._engine.begin() as conn:
-                result = await conn.execute(text("SELECT 1 as test"))
-                row = result.fetchone()
+            # Ping through the pool without a transaction, failing fast when
+            # no connection frees up in time
+            timeout = self.get_config("health_check_timeout", 2.0)
+            async with self._pool.acquire(timeout=timeout) as conn:
+                ok = await conn.fetchval("SELECT 1", timeout=timeout)
+            
+            if ok == 1:
+                return {
+                    "status": "healthy",
+                    "source": self.source_name,
+                    "connected": True,
+                    "pool": await self.pool_stats(),
+                    "timestamp": datetime.now().isoformat()
+                }
+            else:
+                return {
+                    "status": "unhealthy",
+                    "source": self.source_name,
+                    "error": "Health check query failed"
+                }
                 
-                if row and row[0] == 1:
-                    return {
-                        "status": "healthy",
-                        "source": self.source_name,
-                        "connected": True,
-                        "timestamp": datetime.now().isoformat()
-                    }
-                else:
-                    return {
-                        "status": "unhealthy",
-                        "source": self.source_name,
-                        "error": "Health check query failed"
-                    }
-                    
         except Exception as e:
             return {
                 "status": "unhealthy",
@@ -138,92 +320,260 @@ class PostgreSQLConnector(BaseDataConnector):
         Execute a query on PostgreSQL.
         
         Args:
-            query: SQL query string
+            query: SQL query string with :name placeholders
             params: Query parameters
             
         Returns:
             List[Dict[str, Any]]: Query results
         """
         try:
-            await self.ensure_connected()
+            return await self._fetch(query, params)
             
-            async with self._session_factory() as session:
-                result = await session.execute(text(query), params or {})
-                rows = result.fetchall()
-                
-                # Convert to list of dictionaries
-                results = []
-                for row in rows:
-                    results.append(dict(row._mapping))
-                
-                return results
-                
         except Exception as e:
             self._logger.error(f"Error executing query: {e}")
             return []
     
+    async def _fetch(self, query: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Execute a query on PostgreSQL, raising on failure.
+        
+        Args:
+            query: SQL query string with :name placeholders
+            params: Query parameters
+            
+        Returns:
+            List[Dict[str, Any]]: Query results
+        """
+        rows = await self.fetch_records(query, params)
+        if not rows:
+            return []
+        
+        # All rows share one column list; zip it with each row's values
+        # instead of going through the mapping protocol per row
+        keys = tuple(rows[0].keys())
+        return [dict(zip(keys, row.values())) for row in rows]
+    
+    async def fetch_records(self, query: str, params: Optional[Dict[str, Any]] = None) -> List[asyncpg.Record]:
+        """
+        Execute a query and return asyncpg records without dict conversion.
+        
+        Records support both key and index access, so hot paths that only
+        read a few columns can skip building a dict per row. Errors are
+        raised to the caller.
+        
+        Args:
+            query: SQL query string with :name placeholders
+            params: Query parameters
+            
+        Returns:
+            List[asyncpg.Record]: Query records
+        """
+        await self.ensure_connected()
+        
+        sql, names = _to_positional(query)
+        params = params or {}
+        args = [params[name] for name in names]
+        
+        async with self._pool.acquire() as conn:
+            return await conn.fetch(sql, *args)
+    
     async def _search_products_structured(self, query: str, filters: Dict[str, Any], 
-                                        limit: int, offset: int) -> List[Dict[str, Any]]:
+                                        limit: int, offset: int,
+                                        fields: str = "full") -> List[Dict[str, Any]]:
         """
         Search products using structured SQL queries.
         
+        Setting filters["prefix_match"] matches query as a name prefix
+        instead of a substring of the name or description. Results are
+        cached for search_cache_ttl_seconds, and concurrent identical
+        searches share a single database query.
+        
         Args:
             query: Search query
             filters: Search filters
             limit: Maximum number of results
             offset: Result offset
+            fields: Column projection, "full" or "summary" (list views that
+                do not need descriptions or array columns)
             
         Returns:
             List[Dict[str, Any]]: Product results
         """
         try:
-            # Build SQL query
-            sql = """
-                SELECT 
-                    product_id, name, type, risk_level, description, issuer,
-                    inception_date, expected_return, volatility, sharpe_ratio,
-                    minimum_investment, expense_ratio, dividend_yield,
-                    regulatory_status, compliance_requirements, tags, categories,
-                    embedding_id, created_at, updated_at
-                FROM financial_products
-                WHERE 1=1
-            """
+            key = self._search_cache_key(query, filters, limit, offset, fields)
+            if key is None:
+                return await self._query_products(query, filters, limit, offset, fields)
+            
+            cached = self._cached_search(key)
+            if cached is not None:
+                return cached
+            
+            # Searches only join a leader started in the current generation,
+            # and the leader alone stores its results under that generation
+            flight = (key, self._generation)
+            search = self._search_inflight.get(flight)
+            if search is None:
+                search = asyncio.ensure_future(self._query_products(query, filters, limit, offset, fields))
+                self._search_inflight[flight] = search
+                search.add_done_callback(lambda task: self._finish_search(flight, task))
+            
+            results = await asyncio.shield(search)
+            return list(results)
             
-            params = {}
-            
-            # Add search conditions
-            if query:
-                sql += " AND (name ILIKE :query OR description ILIKE :query)"
-                params["query"] = f"%{query}%"
+        except Exception as e:
+            self._logger.error(f"Error in structured product search: {e}")
+            return []
+    
+    async def _query_products(self, query: str, filters: Dict[str, Any],
+                              limit: int, offset: int, fields: str) -> List[Dict[str, Any]]:
+        """
+        Run a structured product search against PostgreSQL.
+        
+        Args:
+            query: Search query
+            filters: Search filters
+            limit: Maximum number of results
+            offset: Result offset
+            fields: Column projection, "full" or "summary"
             
-            # Add filters
-            if filters:
-                if "risk_level" in filters:
-                    sql += " AND risk_level = :risk_level"
-                    params["risk_level"] = filters["risk_level"]
-                
-                if "product_type" in filters:
-                    sql += " AND type = :product_type"
-                    params["product_type"] = filters["product_type"]
-                
-                if "min_investment" in filters:
-                    sql += " AND minimum_investment >= :min_investment"
-                    params["min_investment"] = filters["min_investment"]
-                
-                if "max_investment" in filters:
-                    sql += " AND minimum_investment <= :max_investment"
-                    params["max_investment"] = filters["max_investment"]
+        Returns:
+            List[Dict[str, Any]]: Product results
+        """
+        sql, params = self._product_search_statement(query, filters, limit, offset, fields)
+        return await self._fetch(sql, params)
+    
+    @staticmethod
+    def _product_search_statement(query: str, filters: Dict[str, Any], limit: Optional[int],
+                                  offset: int, fields: str) -> Tuple[str, Dict[str, Any]]:
+        """
+        Select the product search SQL and bind its parameters.
+        
+        Args:
+            query: Search query
+            filters: Search filters
+            limit: Maximum number of results (None for no limit)
+            offset: Result offset
+            fields: Column projection, "full" or "summary"
             
-            # Add ordering and pagination
-            sql += " ORDER BY name LIMIT :limit OFFSET :offset"
-            params["limit"] = limit
-            params["offset"] = offset
+        Returns:
+            Tuple[str, Dict[str, Any]]: SQL and query parameters
+        """
+        params = {"limit": limit, "offset": offset}
+        
+        # Add search conditions
+        text_mode = None
+        if query and filters and filters.get("prefix_match"):
+            text_mode = "prefix"
+            params["query"] = _escape_like(query.lower()) + "%"
+        elif query:
+            text_mode = "substring"
+            params["query"] = f"%{query}%"
+        
+        # Add filters
+        active_filters = []
+        if filters:
+            for name, _ in _PRODUCT_FILTER_CONDITIONS:
+                if name in filters:
+                    active_filters.append(name)
+                    params[name] = filters[name]
+        
+        return _search_products_sql(fields, text_mode, tuple(active_filters)), params
+    
+    async def iter_query(self, query: str, params: Optional[Dict[str, Any]] = None,
+                         prefetch: int = 500) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream query results through a server-side cursor.
+        
+        Rows are fetched prefetch at a time, so memory stays bounded and a
+        caller that stops early does not pay for the remaining rows.
+        
+        Args:
+            query: SQL query string with :name placeholders
+            params: Query parameters
+            prefetch: Rows fetched per cursor round trip
             
-            return await self.execute_query(sql, params)
+        Yields:
+            Dict[str, Any]: Query rows
+        """
+        await self.ensure_connected()
+        
+        sql, names = _to_positional(query)
+        params = params or {}
+        args = [params[name] for name in names]
+        
+        async with self._pool.acquire() as conn:
+            # Cursors only exist inside a transaction
+            async with conn.transaction():
+                async for row in conn.cursor(sql, *args, prefetch=prefetch):
+                    yield dict(row)
+    
+    async def iter_products(self, query: Optional[str] = None, filters: Optional[Dict[str, Any]] = None,
+                            fields: str = "full", prefetch: int = 500) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream every product matching a search, e.g. for exports.
+        
+        Args:
+            query: Search query
+            filters: Search filters
+            fields: Column projection, "full" or "summary"
+            prefetch: Rows fetched per cursor round trip
             
-        except Exception as e:
-            self._logger.error(f"Error in structured product search: {e}")
-            return []
+        Yields:
+            Dict[str, Any]: Product results
+        """
+        sql, params = self._product_search_statement(query, filters, None, 0, fields)
+        async for row in self.iter_query(sql, params, prefetch=prefetch):
+            yield row
+    
+    @staticmethod
+    def _search_cache_key(query: str, filters: Dict[str, Any], limit: int,
+                          offset: int, fields: str) -> Optional[Hashable]:
+        """Build a search cache key, or None if a filter value is unhashable"""
+        try:
+            key = (query, frozenset((filters or {}).items()), limit, offset, fields)
+            hash(key)
+        except TypeError:
+            return None
+        return key
+    
+    def _cached_search(self, key: Hashable) -> Optional[List[Dict[str, Any]]]:
+        """Return a copy of fresh cached search results for a key"""
+        entry = self._search_cache.get(key)
+        if entry is None:
+            return None
+        
+        stored_at, results = entry
+        if time.monotonic() - stored_at > self._search_cache_ttl:
+            del self._search_cache[key]
+            return None
+        
+        self._search_cache.move_to_end(key)
+        return list(results)
+    
+    def _store_search(self, key: Hashable, generation: int, results: List[Dict[str, Any]]):
+        """Cache search results unless a write happened since the search started"""
+        if generation != self._generation:
+            return
+        
+        self._search_cache[key] = (time.monotonic(), list(results))
+        self._search_cache.move_to_end(key)
+        while len(self._search_cache) > self._search_cache_size:
+            self._search_cache.popitem(last=False)
+    
+    def _finish_search(self, flight: Tuple[Hashable, int],
+                       search: "asyncio.Future[List[Dict[str, Any]]]"):
+        """Retire a finished search leader and cache its results"""
+        self._search_inflight.pop(flight, None)
+        if search.cancelled() or search.exception() is not None:
+            return
+        
+        key, generation = flight
+        self._store_search(key, generation, search.result())
+    
+    def _invalidate_search_cache(self):
+        """Drop cached search results after the product tables have changed"""
+        self._generation += 1
+        self._search_cache.clear()
     
     async def _search_products_vector(self, query: str, filters: Dict[str, Any], 
                                     limit: int, offset: int) -> List[Dict[str, Any]]:
@@ -275,17 +625,7 @@ class PostgreSQLConnector(BaseDataConnector):
             Optional[Dict[str, Any]]: User profile data
         """
         try:
-            sql = """
-                SELECT 
-                    user_id, name, email, age, income_level, investment_experience,
-                    risk_tolerance, investment_goals, time_horizon, preferred_product_types,
-                    preferred_sectors, geographic_preferences, current_portfolio_value,
-                    monthly_investment_capacity, created_at, updated_at
-                FROM user_profiles
-                WHERE user_id = :user_id
-            """
-            
-            results = await self.execute_query(sql, {"user_id": user_id})
+            results = await self.execute_query(_GET_USER_PROFILE_SQL, {"user_id": user_id})
             
             if results:
                 return results[0]
@@ -302,53 +642,39 @@ class PostgreSQLConnector(BaseDataConnector):
         Args:
             profile: User profile to save
             
+        Returns:
+            bool: True if successful
+        """
+        return await self._save_user_profiles_bulk([profile])
+    
+    async def _save_user_profiles_bulk(self, profiles: List[UserProfile]) -> bool:
+        """
+        Save several user profiles in one transaction.
+        
+        The upsert is prepared once and executed for every row with
+        executemany, instead of parsing and planning it per profile.
+        
+        Args:
+            profiles: User profiles to save
+            
         Returns:
             bool: True if successful
         """
         try:
-            # Convert profile to dict for insertion
-            profile_data = profile.model_dump()
-            
-            # Handle list fields
-            profile_data["investment_goals"] = list(profile_data.get("investment_goals", []))
-            profile_data["preferred_product_types"] = list(profile_data.get("preferred_product_types", []))
-            profile_data["preferred_sectors"] = list(profile_data.get("preferred_sectors", []))
-            profile_data["geographic_preferences"] = list(profile_data.get("geographic_preferences", []))
-            
-            sql = """
-                INSERT INTO user_profiles (
-                    user_id, name, email, age, income_level, investment_experience,
-                    risk_tolerance, investment_goals, time_horizon, preferred_product_types,
-                    preferred_sectors, geographic_preferences, current_portfolio_value,
-                    monthly_investment_capacity, created_at, updated_at
-                ) VALUES (
-                    :user_id, :name, :email, :age, :income_level, :investment_experience,
-                    :risk_tolerance, :investment_goals, :time_horizon, :preferred_product_types,
-                    :preferred_sectors, :geographic_preferences, :current_portfolio_value,
-                    :monthly_investment_capacity, :created_at, :updated_at
-                )
-                ON CONFLICT (user_id) DO UPDATE SET
-                    name = EXCLUDED.name,
-                    email = EXCLUDED.email,
-                    age = EXCLUDED.age,
-                    income_level = EXCLUDED.income_level,
-                    investment_experience = EXCLUDED.investment_experience,
-                    risk_tolerance = EXCLUDED.risk_tolerance,
-                    investment_goals = EXCLUDED.investment_goals,
-                    time_horizon = EXCLUDED.time_horizon,
-                    preferred_product_types = EXCLUDED.preferred_product_types,
-                    preferred_sectors = EXCLUDED.preferred_sectors,
-                    geographic_preferences = EXCLUDED.geographic_preferences,
-                    current_portfolio_value = EXCLUDED.current_portfolio_value,
-                    monthly_investment_capacity = EXCLUDED.monthly_investment_capacity,
-                    updated_at = EXCLUDED.updated_at
-            """
+            await self.ensure_connected()
+            
+            # Attributes are read straight into row tuples: no model_dump dict and
+            # no re-listing of fields pydantic already stores as lists
+            rows = [_profile_row(profile) for profile in profiles]
+            
+            async with self._pool.acquire() as conn:
+                async with conn.transaction():
+                    await conn.executemany(_UPSERT_PROFILE_SQL, rows)
             
-            await self.execute_query(sql, profile_data)
             return True
             
         except Exception as e:
-            self._logger.error(f"Error saving user profile: {e}")
+            self._logger.error(f"Error saving user profiles: {e}")
             return False
     
     async def _get_graph_nodes_neo4j(self, node_type: str, filters: Dict[str, Any], 
@@ -363,6 +689,13 @@ class PostgreSQLConnector(BaseDataConnector):
         self._logger.warning("Graph relationship retrieval not supported for PostgreSQL")
         return []
     
+    async def _execute_ddl(self, statement: str):
+        """Run a DDL statement on its own pool connection, raising on failure"""
+        await self.ensure_connected()
+        
+        async with self._pool.acquire() as conn:
+            await conn.execute(statement)
+    
     async def create_tables(self):
         """Create database tables if they don't exist"""
         try:
@@ -371,6 +704,7 @@ class PostgreSQLConnector(BaseDataConnector):
                 CREATE TABLE IF NOT EXISTS financial_products (
                     product_id VARCHAR(50) PRIMARY KEY,
                     name VARCHAR(255) NOT NULL,
+                    name_lower TEXT GENERATED ALWAYS AS (lower(name)) STORED,
                     type VARCHAR(50) NOT NULL,
                     risk_level VARCHAR(20) NOT NULL,
                     description TEXT,
@@ -414,9 +748,38 @@ class PostgreSQLConnector(BaseDataConnector):
                 )
             """
             
-            await self.execute_query(products_sql)
-            await self.execute_query(profiles_sql)
-            
+            # Trigram indexes let ILIKE '%term%' searches use an index scan
+            index_statements = [
+                """
+                CREATE INDEX IF NOT EXISTS financial_products_name_trgm
+                    ON financial_products USING GIN (name gin_trgm_ops)
+                """,
+                """
+                CREATE INDEX IF NOT EXISTS financial_products_desc_trgm
+                    ON financial_products USING GIN (description gin_trgm_ops)
+                """,
+                # text_pattern_ops makes prefix LIKE indexable in any locale
+                """
+                CREATE INDEX IF NOT EXISTS financial_products_name_lower_idx
+                    ON financial_products (name_lower text_pattern_ops)
+                """
+            ]
+            
+            # Independent statements run concurrently on separate pool
+            # connections: tables and extension first, then the indexes on them
+            await asyncio.gather(
+                self._execute_ddl(products_sql),
+                self._execute_ddl(profiles_sql),
+                self._execute_ddl("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+            )
+            # Tables created before name_lower existed get the stored column here
+            await self._execute_ddl("""
+                ALTER TABLE financial_products
+                    ADD COLUMN IF NOT EXISTS name_lower TEXT GENERATED ALWAYS AS (lower(name)) STORED
+            """)
+            await asyncio.gather(*(self._execute_ddl(statement) for statement in index_statements))
+            
+            self._invalidate_search_cache()
             self._logger.info("Database tables created successfully")
             
         except Exception as e:
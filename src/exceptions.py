@@ -5,12 +5,17 @@ Provides specific exception types for different error scenarios
 to enable better error handling and debugging.
 """
 
+import warnings
 from typing import Optional, Dict, Any
 
 
 class FinancialRecommendationError(Exception):
     """Base exception for financial recommendation system errors."""
     
+    # Slots keep raises from materializing an instance __dict__, and the
+    # details dict is only allocated when it is first read
+    __slots__ = ("message", "_details")
+    
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         """
         Initialize the exception.
@@ -21,7 +26,22 @@ class FinancialRecommendationError(Exception):
         """
         super().__init__(message)
         self.message = message
-        self.details = details or {}
+        self._details = details or None
+    
+    @property
+    def details(self) -> Dict[str, Any]:
+        """Additional error details"""
+        if self._details is None:
+            self._details = {}
+        return self._details
+    
+    @details.setter
+    def details(self, value: Dict[str, Any]):
+        self._details = value
+    
+    def __reduce__(self):
+        # Slot values are not part of the default exception pickle state
+        return (self.__class__, (self.message, self._details), self.__dict__ or None)
 
 
 class AgentInitializationError(FinancialRecommendationError):
@@ -64,7 +84,7 @@ class DiscordBotError(FinancialRecommendationError):
     pass
 
 
-class TimeoutError(FinancialRecommendationError):
+class RecoTimeoutError(FinancialRecommendationError):
     """Raised when operations timeout."""
     pass
 
@@ -74,7 +94,7 @@ class ConfigurationError(FinancialRecommendationError):
     pass
 
 
-class ImportError(FinancialRecommendationError):
+class RecoImportError(FinancialRecommendationError):
     """Raised when required modules cannot be imported."""
     pass
 
@@ -167,3 +187,22 @@ class CrewAIAgentError(CrewAIError):
 class CrewAITimeoutError(CrewAIError):
     """Raised when CrewAI operations timeout."""
     pass
+
+
+# Former names that shadowed the TimeoutError and ImportError builtins. They
+# resolve lazily so they never enter this module's namespace or star-imports.
+_RENAMED = {
+    "TimeoutError": "RecoTimeoutError",
+    "ImportError": "RecoImportError"
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _RENAMED:
+        warnings.warn(
+            f"src.exceptions.{name} is deprecated; use {_RENAMED[name]}",
+            DeprecationWarning,
+            stacklevel=2
+        )
+        return globals()[_RENAMED[name]]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,15 +5,60 @@ This module analyzes user queries to determine intent and extract relevant
 information for financial product recommendations.
 """
 
+import asyncio
+import contextlib
 import logging
-from typing import Dict, Any, List, Optional
+import re
+from typing import Dict, Any, List, Optional, Callable, Awaitable, Sequence
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
 from .providers import LLMProvider, LLMResponse
+from src.utils.semantic_cache import SemanticCache
+from src.utils.lru_cache import LRUCache, request_cache_key
 
 logger = logging.getLogger(__name__)
 
+# Product, risk and goal keywords for the fallback extractor, matched in one pass
+_KEYWORD_RE = re.compile(
+    "fund|etf|bond|stock|mutual|investment|portfolio"
+    "|risk|safe|conservative|aggressive|volatile"
+    "|retirement|education|house|home|emergency|income"
+)
+_GENERAL_KEYWORD_RE = re.compile("invest|money|save|financial")
+
+# Outermost JSON object in a response, ignoring code fences or stray prose
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+# Static intent analysis instructions, sent as the system prompt; only the
+# short query message changes between calls
+_ANALYSIS_SYSTEM_PROMPT = """Analyze the user query for financial product recommendations and extract intent information.
+
+Respond with a single JSON object in the following format:
+
+{
+  "intent_type": "product_recommendation" | "product_comparison" | "risk_assessment" | "investment_goals" | "portfolio_review" | "general_question" | "unknown",
+  "confidence": number from 0.0 to 1.0,
+  "risk_tolerance": "low" | "medium" | "high" | null,
+  "investment_goals": zero or more of ["retirement", "education", "home_purchase", "emergency_fund", "wealth_building", "income_generation", "tax_efficiency"],
+  "investment_horizon": "short_term" | "medium_term" | "long_term" | null,
+  "preferred_product_types": zero or more of ["mutual_fund", "etf", "bond", "stock", "real_estate", "commodity"],
+  "budget_range": {"min": amount, "max": amount} with unknown bounds omitted, or null,
+  "keywords": [lowercase keywords],
+  "entities": {"mentioned_entities": "any specific entities mentioned"} or {}
+}
+
+Focus on:
+1. What type of financial product or service the user is looking for
+2. Their risk tolerance level
+3. Investment goals and time horizon
+4. Budget constraints
+5. Specific product preferences
+6. Any entities like company names, product names, etc.
+
+Provide only the JSON object, no additional text.
+"""
+
 
 class IntentType(str, Enum):
     """Types of user intents"""
@@ -44,8 +89,23 @@ class InvestmentGoal(str, Enum):
     TAX_EFFICIENCY = "tax_efficiency"
 
 
+# Enum members by value, so parsing a value is a dict lookup
+_INTENT_BY_VALUE: Dict[str, IntentType] = {member.value: member for member in IntentType}
+_GOAL_BY_VALUE: Dict[str, InvestmentGoal] = {member.value: member for member in InvestmentGoal}
+
+
+def _match_enum_value(text: str, by_value: Dict[str, Enum]) -> Optional[Enum]:
+    """Find the enum member named by text, tolerating extra words around the value"""
+    member = by_value.get(text)
+    if member is None:
+        member = next((m for value, m in by_value.items() if value in text), None)
+    return member
+
+
 class ExtractedIntent(BaseModel):
     """Extracted intent from user query"""
+    model_config = ConfigDict(frozen=True, validate_assignment=False)
+    
     intent_type: IntentType = Field(..., description="Primary intent type")
     confidence: float = Field(..., ge=0.0, le=1.0, description="Confidence score")
     risk_tolerance: Optional[RiskLevel] = Field(None, description="Extracted risk tolerance")
@@ -60,26 +120,100 @@ class ExtractedIntent(BaseModel):
 class IntentAnalyzer:
     """Analyzes user queries to determine intent and extract information"""
     
-    def __init__(self, llm_provider: LLMProvider):
+    def __init__(self,
+                 llm_provider: LLMProvider,
+                 embedder: Optional[Callable[[str], Awaitable[Sequence[float]]]] = None,
+                 semantic_cache: Optional[SemanticCache] = None,
+                 cache_size: int = 1024):
+        """
+        Initialize the intent analyzer.
+        
+        Args:
+            llm_provider: Provider used for intent analysis
+            embedder: Optional async function embedding a query; enables the semantic cache
+            semantic_cache: Cache for paraphrased queries (created when an embedder is given)
+            cache_size: Maximum number of intents kept for identical queries
+        """
         self.llm_provider = llm_provider
+        self.embedder = embedder
+        if semantic_cache is None and embedder is not None:
+            semantic_cache = SemanticCache(similarity_threshold=0.92, ttl_seconds=3600)
+        self.semantic_cache = semantic_cache
+        self._intent_cache = LRUCache(cache_size)
     
     async def analyze_intent(self, query: str, context: Optional[Dict[str, Any]] = None) -> ExtractedIntent:
         """Analyze user query to determine intent and extract information"""
+        return await self._analyze_intent(query, context)
+    
+    async def analyze_intent_batch(self,
+                                   queries: List[str],
+                                   context: Optional[Dict[str, Any]] = None,
+                                   *,
+                                   concurrency: int = 10) -> List[ExtractedIntent]:
+        """
+        Analyze many queries concurrently.
+        
+        At most `concurrency` LLM calls are in flight at once; cache hits
+        return without waiting for a slot. Like analyze_intent, a failed
+        analysis yields a default intent instead of raising.
+        
+        Args:
+            queries: User queries to analyze
+            context: Optional context shared by all queries
+            concurrency: Maximum number of concurrent LLM calls
+            
+        Returns:
+            List[ExtractedIntent]: Intents in the same order as queries
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        return list(await asyncio.gather(
+            *(self._analyze_intent(query, context, semaphore) for query in queries)
+        ))
+    
+    async def _analyze_intent(self,
+                              query: str,
+                              context: Optional[Dict[str, Any]],
+                              llm_slots: Optional[asyncio.Semaphore] = None) -> ExtractedIntent:
+        """Analyze a query, holding a slot from llm_slots (if given) only around the LLM call"""
         try:
+            # Identical queries skip even the embedding call
+            cache_key = request_cache_key(query, context)
+            cached = self._intent_cache.get(cache_key)
+            if cached is not None:
+                return cached.model_copy(deep=True)
+            
+            # Paraphrases of a recently analyzed query reuse its intent, but only
+            # within the same request context (user profile and conversation)
+            query_embedding = await self._embed_query(query)
+            semantic_scope = request_cache_key("", context)
+            if query_embedding is not None:
+                cached = await self.semantic_cache.get(query_embedding, scope=semantic_scope)
+                if cached is not None:
+                    self._intent_cache.set(cache_key, cached)
+                    return cached.model_copy(deep=True)
+            
             # Create analysis prompt
             analysis_prompt = self._create_analysis_prompt(query)
             
             # Generate analysis using LLM
-            response = await self.llm_provider.generate_response(
-                prompt=analysis_prompt,
-                context=context,
-                temperature=0.3,  # Lower temperature for more consistent analysis
-                max_tokens=500
-            )
+            async with llm_slots or contextlib.nullcontext():
+                response = await self.llm_provider.generate_response(
+                    prompt=analysis_prompt,
+                    context=context,
+                    system_prompt=_ANALYSIS_SYSTEM_PROMPT,
+                    temperature=0.3,  # Lower temperature for more consistent analysis
+                    max_tokens=500
+                )
             
             # Parse the response to extract intent
             extracted_intent = self._parse_analysis_response(response.content, query)
             
+            if extracted_intent.intent_type != IntentType.UNKNOWN:
+                cached = extracted_intent.model_copy(deep=True)
+                self._intent_cache.set(cache_key, cached)
+                if query_embedding is not None:
+                    await self.semantic_cache.set(query_embedding, cached, scope=semantic_scope)
+            
             return extracted_intent
             
         except Exception as e:
@@ -91,57 +225,50 @@ class IntentAnalyzer:
                 keywords=self._extract_basic_keywords(query)
             )
     
+    async def _embed_query(self, query: str) -> Optional[Sequence[float]]:
+        """Embed a query for the semantic cache, or None when caching is unavailable"""
+        if self.embedder is None or self.semantic_cache is None:
+            return None
+        
+        try:
+            return await self.embedder(query)
+        except Exception as e:
+            logger.debug(f"Skipping intent semantic cache, query embedding failed: {e}")
+            return None
+    
     def _create_analysis_prompt(self, query: str) -> str:
-        """Create prompt for intent analysis"""
-        return f"""
-Analyze the following user query for financial product recommendations and extract intent information.
-
-Query: "{query}"
-
-Please analyze this query and provide a structured response in the following format:
-
-INTENT_TYPE: [product_recommendation|product_comparison|risk_assessment|investment_goals|portfolio_review|general_question|unknown]
-CONFIDENCE: [0.0-1.0]
-RISK_TOLERANCE: [low|medium|high|null]
-INVESTMENT_GOALS: [retirement,education,home_purchase,emergency_fund,wealth_building,income_generation,tax_efficiency]
-INVESTMENT_HORIZON: [short_term|medium_term|long_term|null]
-PREFERRED_PRODUCTS: [mutual_fund,etf,bond,stock,real_estate,commodity]
-BUDGET_MIN: [amount or null]
-BUDGET_MAX: [amount or null]
-KEYWORDS: [comma-separated keywords]
-ENTITIES: [any specific entities mentioned]
-
-Focus on:
-1. What type of financial product or service the user is looking for
-2. Their risk tolerance level
-3. Investment goals and time horizon
-4. Budget constraints
-5. Specific product preferences
-6. Any entities like company names, product names, etc.
-
-Provide only the structured response, no additional text.
-"""
+        """Create the per-query part of the intent analysis prompt"""
+        return f'Query: "{query}"'
     
     def _parse_analysis_response(self, response: str, original_query: str) -> ExtractedIntent:
         """Parse LLM response to extract intent information"""
+        # Structured JSON output validates straight into the model
+        json_match = _JSON_OBJECT_RE.search(response)
+        if json_match is None:
+            return self._parse_text_response(response, original_query)
+        
+        try:
+            return ExtractedIntent.model_validate_json(json_match.group())
+        except ValidationError as e:
+            logger.error(f"Structured intent response failed validation: {e}")
+            return ExtractedIntent(
+                intent_type=IntentType.UNKNOWN,
+                confidence=0.0,
+                keywords=self._extract_basic_keywords(original_query)
+            )
+    
+    def _parse_text_response(self, response: str, original_query: str) -> ExtractedIntent:
+        """Parse a KEY: value formatted LLM response to extract intent information"""
         try:
-            lines = response.strip().split('\n')
             parsed_data = {}
-            
-            for line in lines:
-                if ':' in line:
-                    key, value = line.split(':', 1)
-                    key = key.strip().upper()
-                    value = value.strip()
-                    parsed_data[key] = value
+            for line in response.splitlines():
+                key, sep, value = line.partition(':')
+                if sep:
+                    parsed_data[key.strip().upper()] = value.strip()
             
             # Extract intent type
             intent_type_str = parsed_data.get('INTENT_TYPE', 'unknown').lower()
-            intent_type = IntentType.UNKNOWN
-            for intent in IntentType:
-                if intent.value in intent_type_str:
-                    intent_type = intent
-                    break
+            intent_type = _match_enum_value(intent_type_str, _INTENT_BY_VALUE) or IntentType.UNKNOWN
             
             # Extract confidence
             confidence = float(parsed_data.get('CONFIDENCE', '0.0'))
@@ -157,11 +284,9 @@ Provide only the structured response, no additional text.
             investment_goals = []
             if goals_str and goals_str != 'null':
                 for goal in goals_str.split(','):
-                    goal = goal.strip().lower()
-                    for enum_goal in InvestmentGoal:
-                        if enum_goal.value in goal:
-                            investment_goals.append(enum_goal)
-                            break
+                    enum_goal = _match_enum_value(goal.strip().lower(), _GOAL_BY_VALUE)
+                    if enum_goal is not None:
+                        investment_goals.append(enum_goal)
             
             # Extract investment horizon
             horizon = parsed_data.get('INVESTMENT_HORIZON', None)
@@ -221,34 +346,13 @@ Provide only the structured response, no additional text.
     
     def _extract_basic_keywords(self, query: str) -> List[str]:
         """Extract basic keywords from query as fallback"""
-        # Simple keyword extraction
-        keywords = []
+        # Substring matches (e.g. "funds" yields "fund"), deduplicated in query order
         query_lower = query.lower()
-        
-        # Financial product keywords
-        product_keywords = ['fund', 'etf', 'bond', 'stock', 'mutual', 'investment', 'portfolio']
-        for keyword in product_keywords:
-            if keyword in query_lower:
-                keywords.append(keyword)
-        
-        # Risk keywords
-        risk_keywords = ['risk', 'safe', 'conservative', 'aggressive', 'volatile']
-        for keyword in risk_keywords:
-            if keyword in query_lower:
-                keywords.append(keyword)
-        
-        # Goal keywords
-        goal_keywords = ['retirement', 'education', 'house', 'home', 'emergency', 'income']
-        for keyword in goal_keywords:
-            if keyword in query_lower:
-                keywords.append(keyword)
+        keywords = list(dict.fromkeys(_KEYWORD_RE.findall(query_lower)))
         
         # If no specific keywords found, add general investment terms
         if not keywords:
-            general_keywords = ['invest', 'money', 'save', 'financial']
-            for keyword in general_keywords:
-                if keyword in query_lower:
-                    keywords.append(keyword)
+            keywords = list(dict.fromkeys(_GENERAL_KEYWORD_RE.findall(query_lower)))
         
         return keywords
     
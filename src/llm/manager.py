@@ -7,18 +7,31 @@ and response generation with fallback mechanisms.
 
 import asyncio
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Callable, Awaitable, Sequence, TypeVar
 from datetime import datetime, timezone
 from pydantic import BaseModel, Field
 
 from .providers import LLMProvider, AnthropicProvider, OpenAIProvider, LLMResponse
-from .intent_analyzer import IntentAnalyzer, ExtractedIntent
+from .intent_analyzer import IntentAnalyzer, ExtractedIntent, IntentType
 from .response_generator import ResponseGenerator, RecommendationResponse
 from src.data.models import FinancialProduct, UserProfile, ChatMessage
 from src.core.exceptions import LLMError, NetworkError, ConfigurationError
+from src.utils.lru_cache import LRUCache, request_cache_key
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+def _is_degraded_intent(intent: ExtractedIntent) -> bool:
+    """Whether an intent is the analyzer's placeholder for a failed analysis"""
+    return intent.intent_type == IntentType.UNKNOWN
+
+
+def _is_degraded_response(response: RecommendationResponse) -> bool:
+    """Whether a response is the generator's placeholder for a failed generation"""
+    return bool(response.metadata.get("fallback"))
+
 
 class LLMConfig(BaseModel):
     """Configuration for LLM providers"""
@@ -29,6 +42,14 @@ class LLMConfig(BaseModel):
     fallback_enabled: bool = Field(default=True, description="Enable fallback to OpenAI")
     max_retries: int = Field(default=3, description="Maximum retry attempts")
     timeout_seconds: int = Field(default=30, description="Request timeout in seconds")
+    hedge_delay_seconds: Optional[float] = Field(
+        default=None,
+        description="Also call the fallback provider if the primary has not answered after this delay (disabled when None)"
+    )
+    intent_embedding_model: Optional[str] = Field(
+        default="text-embedding-3-small",
+        description="OpenAI model embedding queries for the semantic intent cache (disabled when None)"
+    )
 
 
 class LLMHealthStatus(BaseModel):
@@ -49,6 +70,10 @@ class LLMManager:
         self.fallback_provider: Optional[LLMProvider] = None
         self.intent_analyzer: Optional[IntentAnalyzer] = None
         self.response_generator: Optional[ResponseGenerator] = None
+        self._fallback_intent_analyzer: Optional[IntentAnalyzer] = None
+        self._fallback_response_generator: Optional[ResponseGenerator] = None
+        # Intents of recent queries, keyed by user, risk tolerance and recent history
+        self._intent_cache = LRUCache(256)
         self._initialized = False
     
     async def initialize(self) -> bool:
@@ -70,15 +95,18 @@ class LLMManager:
                 self.config.openai_api_key != "your_openai_api_key_here"):
                 self.fallback_provider = OpenAIProvider(
                     api_key=self.config.openai_api_key,
-                    model=self.config.openai_model
+                    model=self.config.openai_model,
+                    embedding_model=self.config.intent_embedding_model
                 )
                 logger.info("OpenAI fallback provider initialized")
             else:
                 logger.info("OpenAI fallback disabled (not configured)")
             
-            # Check provider health
-            primary_healthy = await self._check_provider_health(self.primary_provider)
-            fallback_healthy = await self._check_provider_health(self.fallback_provider)
+            # Check provider health (both round-trips run concurrently)
+            primary_healthy, fallback_healthy = await asyncio.gather(
+                self._check_provider_health(self.primary_provider),
+                self._check_provider_health(self.fallback_provider)
+            )
             
             if not primary_healthy and not fallback_healthy:
                 logger.error("No LLM providers are healthy - will use mock responses")
@@ -86,11 +114,16 @@ class LLMManager:
             
             # Initialize intent analyzer with healthy provider
             active_provider = self.primary_provider if primary_healthy else self.fallback_provider
-            self.intent_analyzer = IntentAnalyzer(active_provider)
+            self.intent_analyzer = IntentAnalyzer(active_provider, embedder=self._intent_embedder())
             
             # Initialize response generator with active provider
             self.response_generator = ResponseGenerator(active_provider)
             
+            # Fallback components are reused by every request that falls back
+            if self.fallback_provider:
+                self._fallback_intent_analyzer = IntentAnalyzer(self.fallback_provider, embedder=self._intent_embedder())
+                self._fallback_response_generator = ResponseGenerator(self.fallback_provider)
+            
             self._initialized = True
             logger.info("LLM manager initialized successfully")
             return True
@@ -147,6 +180,36 @@ class LLMManager:
         conversation_history: Optional[List[ChatMessage]] = None
     ) -> ExtractedIntent:
         """Analyze intent with fallback to alternative provider"""
+        recent_messages = [
+            getattr(message, "content", None) or getattr(message, "message_text", "")
+            for message in (conversation_history or [])[-3:]
+        ]
+        cache_key = request_cache_key(
+            query,
+            getattr(user_profile, "user_id", None),
+            getattr(user_profile, "risk_tolerance", None),
+            recent_messages
+        )
+        cached = self._intent_cache.get(cache_key)
+        if cached is not None:
+            return cached.model_copy(deep=True)
+        
+        intent = await self._analyze_intent_uncached(query, user_profile, conversation_history)
+        if intent.intent_type != IntentType.UNKNOWN:
+            self._intent_cache.set(cache_key, intent.model_copy(deep=True))
+        return intent
+    
+    def clear_intent_cache(self) -> None:
+        """Drop cached intents, e.g. after a user's profile changes"""
+        self._intent_cache.clear()
+    
+    async def _analyze_intent_uncached(
+        self,
+        query: str,
+        user_profile: Optional[UserProfile] = None,
+        conversation_history: Optional[List[ChatMessage]] = None
+    ) -> ExtractedIntent:
+        """Analyze intent with the primary provider, then the fallback provider"""
         context = {}
         if user_profile:
             context["user_profile"] = user_profile
@@ -156,6 +219,12 @@ class LLMManager:
         # Try primary provider first
         if self.intent_analyzer and self.primary_provider:
             try:
+                if self.fallback_provider and self.config.hedge_delay_seconds is not None:
+                    return await self._run_hedged(
+                        self.intent_analyzer.analyze_intent(query, context),
+                        lambda: self._get_fallback_intent_analyzer().analyze_intent(query, context),
+                        _is_degraded_intent
+                    )
                 return await self.intent_analyzer.analyze_intent(query, context)
             except Exception as e:
                 logger.warning(f"Primary intent analysis failed: {e}")
@@ -163,8 +232,7 @@ class LLMManager:
         # Try fallback provider
         if self.fallback_provider:
             try:
-                fallback_analyzer = IntentAnalyzer(self.fallback_provider)
-                return await fallback_analyzer.analyze_intent(query, context)
+                return await self._get_fallback_intent_analyzer().analyze_intent(query, context)
             except Exception as e:
                 logger.error(f"Fallback intent analysis failed: {e}")
         
@@ -189,6 +257,16 @@ class LLMManager:
         # Try primary provider first
         if self.response_generator and self.primary_provider:
             try:
+                if self.fallback_provider and self.config.hedge_delay_seconds is not None:
+                    return await self._run_hedged(
+                        self.response_generator.generate_recommendation(
+                            query, intent, available_products, user_profile, conversation_history, **kwargs
+                        ),
+                        lambda: self._get_fallback_response_generator().generate_recommendation(
+                            query, intent, available_products, user_profile, conversation_history, **kwargs
+                        ),
+                        _is_degraded_response
+                    )
                 return await self.response_generator.generate_recommendation(
                     query, intent, available_products, user_profile, conversation_history, **kwargs
                 )
@@ -198,8 +276,7 @@ class LLMManager:
         # Try fallback provider
         if self.fallback_provider:
             try:
-                fallback_generator = ResponseGenerator(self.fallback_provider)
-                return await fallback_generator.generate_recommendation(
+                return await self._get_fallback_response_generator().generate_recommendation(
                     query, intent, available_products, user_profile, conversation_history, **kwargs
                 )
             except Exception as e:
@@ -208,6 +285,74 @@ class LLMManager:
         # Return fallback response
         return self._create_error_response(query, available_products)
     
+    def _get_fallback_intent_analyzer(self) -> IntentAnalyzer:
+        """Get the intent analyzer bound to the fallback provider, creating it if needed"""
+        if self._fallback_intent_analyzer is None:
+            self._fallback_intent_analyzer = IntentAnalyzer(self.fallback_provider, embedder=self._intent_embedder())
+        return self._fallback_intent_analyzer
+    
+    def _intent_embedder(self) -> Optional[Callable[[str], Awaitable[Sequence[float]]]]:
+        """Get the query embedder for the semantic intent cache, if one is configured"""
+        if not self.config.intent_embedding_model or not isinstance(self.fallback_provider, OpenAIProvider):
+            return None
+        return self.fallback_provider.embed
+    
+    def _get_fallback_response_generator(self) -> ResponseGenerator:
+        """Get the response generator bound to the fallback provider, creating it if needed"""
+        if self._fallback_response_generator is None:
+            self._fallback_response_generator = ResponseGenerator(self.fallback_provider)
+        return self._fallback_response_generator
+    
+    async def _run_hedged(self, primary: Awaitable[T], start_fallback: Callable[[], Awaitable[T]],
+                          degraded: Callable[[T], bool]) -> T:
+        """
+        Await the primary call, starting the fallback call too if the primary is slow.
+        
+        The fallback starts once hedge_delay_seconds pass without a good primary
+        result, and the first good result wins; the other call is cancelled.
+        Analyzers and generators report provider errors as degraded results
+        rather than raising, so a degraded result does not win the race.
+        
+        Args:
+            primary: Primary provider call
+            start_fallback: Starts the fallback provider call
+            degraded: Whether a result is a placeholder for a failed call
+        
+        Returns:
+            T: First good result, else a degraded result (the primary's first)
+        """
+        primary_task = asyncio.ensure_future(primary)
+        pending = {primary_task}
+        results: Dict[asyncio.Future, T] = {}
+        error: Optional[BaseException] = None
+        try:
+            done, pending = await asyncio.wait(pending, timeout=self.config.hedge_delay_seconds)
+            if done and primary_task.exception() is None and not degraded(primary_task.result()):
+                return primary_task.result()
+            
+            logger.info(f"Primary provider failed or slower than {self.config.hedge_delay_seconds}s, hedging with fallback")
+            fallback_task = asyncio.ensure_future(start_fallback())
+            pending = pending | {fallback_task}
+            while True:
+                for task in done:
+                    if task.exception() is not None:
+                        error = task.exception()
+                    elif degraded(task.result()):
+                        results[task] = task.result()
+                    else:
+                        return task.result()
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            
+            for task in (primary_task, fallback_task):
+                if task in results:
+                    return results[task]
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+    
     async def _check_provider_health(self, provider: Optional[LLMProvider]) -> bool:
         """Check if provider is healthy"""
         if not provider:
@@ -258,8 +403,10 @@ I'll be happy to assist once the system is back online.
     
     async def health_check(self) -> LLMHealthStatus:
         """Check health of all LLM components"""
-        anthropic_healthy = await self._check_provider_health(self.primary_provider)
-        openai_healthy = await self._check_provider_health(self.fallback_provider)
+        anthropic_healthy, openai_healthy = await asyncio.gather(
+            self._check_provider_health(self.primary_provider),
+            self._check_provider_health(self.fallback_provider)
+        )
         
         primary_provider = "anthropic" if anthropic_healthy else "openai" if openai_healthy else "none"
         # Fallback is available if the other provider is healthy when primary fails
@@ -274,23 +421,24 @@ I'll be happy to assist once the system is back online.
     
     async def get_available_models(self) -> Dict[str, List[str]]:
         """Get available models for each provider"""
-        models = {}
-        
+        providers = {}
         if self.primary_provider:
-            try:
-                models["anthropic"] = await self.primary_provider.get_models()
-            except Exception as e:
-                logger.error(f"Failed to get Anthropic models: {e}")
-                models["anthropic"] = []
-        
+            providers["anthropic"] = self.primary_provider
         if self.fallback_provider:
-            try:
-                models["openai"] = await self.fallback_provider.get_models()
-            except Exception as e:
-                logger.error(f"Failed to get OpenAI models: {e}")
-                models["openai"] = []
+            providers["openai"] = self.fallback_provider
         
-        return models
+        model_lists = await asyncio.gather(
+            *(self._get_provider_models(name, provider) for name, provider in providers.items())
+        )
+        return dict(zip(providers, model_lists))
+    
+    async def _get_provider_models(self, name: str, provider: LLMProvider) -> List[str]:
+        """Get a provider's models, or an empty list if the request fails"""
+        try:
+            return await provider.get_models()
+        except Exception as e:
+            logger.error(f"Failed to get {name} models: {e}")
+            return []
     
     async def test_generation(self, test_prompt: str = "Hello, how can you help me with investments?") -> Dict[str, Any]:
         """Test LLM generation capabilities"""
@@ -44,9 +44,22 @@ class LLMProvider(ABC):
         self, 
         prompt: str, 
         context: Optional[Dict[str, Any]] = None,
+        system_prompt: Optional[str] = None,
         **kwargs
     ) -> LLMResponse:
-        """Generate response from LLM"""
+        """
+        Generate response from LLM.
+        
+        Args:
+            prompt: Per-request user message
+            context: Optional products, user profile and conversation history
+            system_prompt: Optional static instructions, placed ahead of the
+                per-request content
+            **kwargs: Provider request options (e.g. temperature, max_tokens)
+            
+        Returns:
+            LLMResponse: Generated response
+        """
         pass
     
     @abstractmethod
@@ -71,6 +84,7 @@ class AnthropicProvider(LLMProvider):
         self, 
         prompt: str, 
         context: Optional[Dict[str, Any]] = None,
+        system_prompt: Optional[str] = None,
         **kwargs
     ) -> LLMResponse:
         """Generate response using Anthropic Claude"""
@@ -98,7 +112,7 @@ class AnthropicProvider(LLMProvider):
                         system_message += f"Conversation history:\n{history}\n\n"
                 
                 # Add default system message for financial recommendations
-                if not system_message:
+                if not system_message and not system_prompt:
                     system_message = """You are a financial product recommendation assistant. 
                     Provide helpful, accurate, and personalized financial product recommendations 
                     based on user queries and available products. Always consider risk tolerance, 
@@ -117,15 +131,20 @@ class AnthropicProvider(LLMProvider):
                         "content": prompt
                     })
                 
+                # Static instructions go in the system prompt ahead of the messages.
+                # They are too short for prompt caching (1024 tokens minimum), so
+                # no cache_control breakpoint is set.
+                request_options = {"max_tokens": 4000, "temperature": 0.7, **kwargs}
+                if system_prompt:
+                    request_options["system"] = system_prompt
+                
                 # Make API call with timeout and retry logic
                 response = await asyncio.wait_for(
                     asyncio.to_thread(
                         self.client.messages.create,
                         model=self.model,
                         messages=messages,
-                        max_tokens=4000,
-                        temperature=0.7,
-                        **kwargs
+                        **request_options
                     ),
                     timeout=30.0  # 30 second timeout
                 )
@@ -297,22 +316,26 @@ class AnthropicProvider(LLMProvider):
 class OpenAIProvider(LLMProvider):
     """OpenAI provider implementation (fallback)"""
     
-    def __init__(self, api_key: str, model: str = "gpt-4", **kwargs):
+    def __init__(self, api_key: str, model: str = "gpt-4",
+                 embedding_model: Optional[str] = "text-embedding-3-small", **kwargs):
         super().__init__(api_key, model, **kwargs)
+        self.embedding_model = embedding_model
         self.client = openai.AsyncOpenAI(api_key=api_key)
     
     async def generate_response(
         self, 
         prompt: str, 
         context: Optional[Dict[str, Any]] = None,
+        system_prompt: Optional[str] = None,
         **kwargs
     ) -> LLMResponse:
         """Generate response using OpenAI"""
         start_time = datetime.now(timezone.utc)
         
         try:
-            # Prepare system message
-            system_message = """You are a financial product recommendation assistant. 
+            # Prepare system message; static instructions come first so the
+            # prompt prefix stays identical (and cacheable) across requests
+            system_message = system_prompt or """You are a financial product recommendation assistant. 
             Provide helpful, accurate, and personalized financial product recommendations 
             based on user queries and available products."""
             
@@ -373,6 +396,19 @@ class OpenAIProvider(LLMProvider):
             logger.error(f"OpenAI health check failed: {e}")
             return False
     
+    async def embed(self, text: str) -> List[float]:
+        """
+        Embed text with the OpenAI embedding model.
+        
+        Args:
+            text: Text to embed
+        
+        Returns:
+            List[float]: Text embedding
+        """
+        response = await self.client.embeddings.create(model=self.embedding_model, input=text)
+        return response.data[0].embedding
+    
     async def get_models(self) -> List[str]:
         """Get available OpenAI models"""
         try:
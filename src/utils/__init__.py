@@ -6,8 +6,15 @@ the system for session management, caching, and other common operations.
 """
 
 from .session_manager import SessionManager, ConversationManager
+from .semantic_cache import SemanticCache
+from .lru_cache import LRUCache, request_cache_key
+from .serialization import dumps_json
 
 __all__ = [
     "SessionManager",
-    "ConversationManager"
+    "ConversationManager",
+    "SemanticCache",
+    "LRUCache",
+    "request_cache_key",
+    "dumps_json"
 ]
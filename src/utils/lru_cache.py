@@ -0,0 +1,98 @@
+"""
+Exact-match LRU cache for the financial product recommendation system.
+
+This module provides a small bounded cache for results of repeated,
+identical requests, and a helper that derives a stable key for them.
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+from .serialization import dumps_json
+
+
+def request_cache_key(query: str, *parts: Any) -> str:
+    """
+    Build a cache key from a normalized query and its request context.
+    
+    Args:
+        query: User query (case and surrounding whitespace are ignored)
+        *parts: Additional JSON-serializable context such as a user profile
+    
+    Returns:
+        str: Hex digest identifying the request
+    """
+    payload = dumps_json(parts, sort_keys=True)
+    digest = hashlib.blake2b(query.strip().lower().encode(), digest_size=16)
+    digest.update(payload.encode())
+    return digest.hexdigest()
+
+
+class LRUCache:
+    """Bounded mapping that evicts the least recently used entry"""
+    
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_entries: Maximum number of cached entries
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Look up a cached value and mark it as recently used.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Optional[Any]: Cached value if present
+        """
+        value = self._entries.get(key)
+        if value is None:
+            self._misses += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return value
+    
+    def set(self, key: Hashable, value: Any):
+        """
+        Store a value, evicting the oldest entry on overflow.
+        
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def clear(self):
+        """Remove all cached entries"""
+        self._entries.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dict[str, Any]: Entry count, hits and misses
+        """
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self._hits,
+            "misses": self._misses
+        }
+    
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,150 @@
+"""
+Semantic cache for the financial product recommendation system.
+
+This module provides an embedding-keyed cache that returns previously
+computed results for near-duplicate (paraphrased) queries.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Hashable, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class SemanticCache:
+    """
+    Cache keyed on query embeddings rather than exact query strings.
+    
+    Each embedding is projected to a SimHash signature using the sign bits of
+    fixed random hyperplanes. Lookups first shortlist entries whose signature
+    is within a small Hamming distance, then verify the shortlist with exact
+    cosine similarity before returning a hit.
+    """
+    
+    def __init__(self,
+                 max_entries: int = 1024,
+                 num_bits: int = 64,
+                 max_hamming: int = 8,
+                 similarity_threshold: float = 0.95,
+                 ttl_seconds: Optional[float] = None,
+                 seed: int = 0):
+        """
+        Initialize the semantic cache.
+        
+        Args:
+            max_entries: Maximum number of cached entries (oldest evicted first)
+            num_bits: Number of random hyperplanes in the SimHash signature
+            max_hamming: Maximum signature distance for a candidate match
+            similarity_threshold: Minimum cosine similarity for a cache hit
+            ttl_seconds: Optional entry lifetime in seconds
+            seed: Seed for the random hyperplanes
+        """
+        self.max_entries = max_entries
+        self.num_bits = num_bits
+        self.max_hamming = max_hamming
+        self.similarity_threshold = similarity_threshold
+        self.ttl_seconds = ttl_seconds
+        self._seed = seed
+        self._planes: Optional[np.ndarray] = None
+        # (scope, simhash, unit embedding, value, stored_at)
+        self._entries: Deque[Tuple[Hashable, int, np.ndarray, Any, float]] = deque(maxlen=max_entries)
+        self._lock = asyncio.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._logger = logging.getLogger(__name__)
+    
+    def _normalize(self, embedding: Sequence[float]) -> np.ndarray:
+        """Convert an embedding into a unit-length float vector"""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+    
+    def _simhash(self, vector: np.ndarray) -> int:
+        """Project a unit vector to a SimHash signature"""
+        if self._planes is None or self._planes.shape[1] != vector.shape[0]:
+            rng = np.random.default_rng(self._seed)
+            self._planes = rng.standard_normal((self.num_bits, vector.shape[0])).astype(np.float32)
+        
+        bits = (self._planes @ vector) > 0
+        return int.from_bytes(np.packbits(bits).tobytes(), "big")
+    
+    def _is_expired(self, stored_at: float, now: float) -> bool:
+        """Check whether an entry has outlived the TTL"""
+        return self.ttl_seconds is not None and now - stored_at > self.ttl_seconds
+    
+    async def get(self, embedding: Sequence[float], scope: Hashable = None) -> Optional[Any]:
+        """
+        Look up a cached value for a semantically similar embedding.
+        
+        Args:
+            embedding: Query embedding
+            scope: Exact-match partition (e.g. filters and pagination)
+        
+        Returns:
+            Optional[Any]: Cached value if a similar entry exists
+        """
+        vector = self._normalize(embedding)
+        
+        async with self._lock:
+            signature = self._simhash(vector)
+            now = time.monotonic()
+            
+            best_value = None
+            best_similarity = self.similarity_threshold
+            for entry_scope, entry_signature, entry_vector, value, stored_at in self._entries:
+                if entry_scope != scope or self._is_expired(stored_at, now):
+                    continue
+                if (signature ^ entry_signature).bit_count() > self.max_hamming:
+                    continue
+                
+                similarity = float(np.dot(vector, entry_vector))
+                if similarity >= best_similarity:
+                    best_similarity = similarity
+                    best_value = value
+            
+            if best_value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+            return best_value
+    
+    async def set(self, embedding: Sequence[float], value: Any, scope: Hashable = None):
+        """
+        Store a value under an embedding.
+        
+        Args:
+            embedding: Query embedding
+            value: Value to cache
+            scope: Exact-match partition (e.g. filters and pagination)
+        """
+        vector = self._normalize(embedding)
+        
+        async with self._lock:
+            signature = self._simhash(vector)
+            self._entries.append((scope, signature, vector, value, time.monotonic()))
+    
+    async def clear(self):
+        """Remove all cached entries"""
+        async with self._lock:
+            self._entries.clear()
+        self._logger.debug("Semantic cache cleared")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dict[str, Any]: Entry count, hits and misses
+        """
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self._hits,
+            "misses": self._misses
+        }
+    
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,49 @@
+"""
+JSON serialization helpers for the financial product recommendation system.
+
+This module encodes JSON with orjson when it is installed and falls back to
+the standard library otherwise.
+"""
+
+import json
+from datetime import date, datetime, time
+from enum import Enum
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_default(value: Any) -> Any:
+    """Encode the types orjson handles natively the same way it does"""
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+
+def dumps_json(obj: Any, sort_keys: bool = False) -> str:
+    """
+    Serialize an object to a JSON string.
+    
+    Types without a native JSON form (e.g. pydantic models) are encoded with
+    str(); datetimes, enums and UUIDs are encoded as orjson does. Both paths
+    produce the same compact text.
+    
+    Args:
+        obj: Object to serialize
+        sort_keys: Sort dictionary keys, for stable hashing
+    
+    Returns:
+        str: JSON text
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, default=str, option=option).decode()
+    return json.dumps(
+        obj, sort_keys=sort_keys, default=_json_default,
+        separators=(",", ":"), ensure_ascii=False
+    )
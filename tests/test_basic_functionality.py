@@ -7,6 +7,7 @@ correctly, including data models, event bus, and API endpoints.
 
 import pytest
 import asyncio
+import pickle
 from datetime import datetime, timezone
 from typing import Dict, Any
 
@@ -16,6 +17,9 @@ from src.data.models import (
 )
 from src.core.event_bus import EventBus, EventType
 from src.utils.session_manager import SessionManager
+from src.utils.semantic_cache import SemanticCache
+from src.utils import serialization
+from src.exceptions import ValidationError
 
 
 class TestDataModels:
@@ -211,6 +215,68 @@ class TestSessionManager:
         assert stats["message_count"] == 0
 
 
+class TestSemanticCache:
+    """Test semantic cache functionality"""
+    
+    @pytest.mark.asyncio
+    async def test_similar_embedding_hit(self):
+        """Test that a near-duplicate embedding returns the cached value"""
+        cache = SemanticCache(similarity_threshold=0.95)
+        await cache.set([1.0, 0.0, 0.2, 0.1], "cached", scope="scope")
+        
+        assert await cache.get([1.0, 0.01, 0.2, 0.1], scope="scope") == "cached"
+        assert await cache.get([0.0, 1.0, 0.0, 0.0], scope="scope") is None
+    
+    @pytest.mark.asyncio
+    async def test_scope_and_clear(self):
+        """Test that scopes are isolated and clear removes entries"""
+        cache = SemanticCache()
+        await cache.set([0.3, 0.4, 0.5], "cached", scope="a")
+        
+        assert await cache.get([0.3, 0.4, 0.5], scope="b") is None
+        
+        await cache.clear()
+        assert await cache.get([0.3, 0.4, 0.5], scope="a") is None
+        assert len(cache) == 0
+
+
+class TestExceptions:
+    """Test custom exception behaviour"""
+    
+    def test_error_details_default_and_pickle(self):
+        """Test omitted details are a fresh mutable dict and details survive pickling"""
+        error = ValidationError("bad input")
+        error.details["field"] = "age"
+        
+        assert ValidationError("other").details == {}
+        assert error.details == {"field": "age"}
+        
+        restored = pickle.loads(pickle.dumps(ValidationError("bad input", {"field": "age"})))
+        assert type(restored) is ValidationError
+        assert restored.message == "bad input"
+        assert restored.details == {"field": "age"}
+        assert str(restored) == "bad input"
+
+
+class TestSerialization:
+    """Test JSON serialization helpers"""
+    
+    def test_json_fallback_matches_orjson_output(self, monkeypatch):
+        """Test the standard library path emits the same compact text as orjson"""
+        monkeypatch.setattr(serialization, "orjson", None)
+        payload = {
+            "name": "元大台灣50",
+            "risk": RiskLevel.LOW,
+            "at": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            "tags": [1, 2.5, None]
+        }
+        
+        assert serialization.dumps_json(payload, sort_keys=True) == (
+            '{"at":"2024-01-02T03:04:05+00:00","name":"元大台灣50",'
+            '"risk":"low","tags":[1,2.5,null]}'
+        )
+
+
 class TestAPIEndpoints:
     """Test API endpoint functionality"""
     
@@ -7,14 +7,15 @@ are working correctly with the multi-source architecture.
 
 import pytest
 import asyncio
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Any
+from unittest.mock import Mock
 
 from src.data_sources import (
     BaseDataConnector, PostgreSQLConnector, ChromaDBConnector, Neo4jConnector,
-    DataManager, DataSourceType, QueryType, FusionStrategy
+    DataManager, DataSourceType, QueryType, FusionStrategy, MockDataManager
 )
-from src.data.models import FinancialProduct, UserProfile, GraphNode, GraphRelationship
+from src.data.models import FinancialProduct, UserProfile, GraphNode, GraphRelationship, ProductType, RiskLevel
 
 @pytest.fixture
 def data_manager_config():
@@ -129,6 +130,217 @@ class TestDataConnectors:
         health = await connector.health_check()
         assert health["status"] == "disconnected"
         assert health["source"] == "neo4j"
+    
+    def test_postgresql_search_statement_reuse(self):
+        """Test that equivalent searches reuse one prebuilt SQL statement"""
+        build = PostgreSQLConnector._product_search_statement
+        
+        sql, params = build("fund", {"risk_level": "low", "product_type": "etf"}, 10, 0, "full")
+        same_sql, _ = build("bond", {"product_type": "bond", "risk_level": "high"}, 5, 20, "full")
+        prefix_sql, prefix_params = build("Yu_", {"prefix_match": True}, 10, 0, "summary")
+        
+        assert sql is same_sql
+        assert params["query"] == "%fund%"
+        assert prefix_sql is not sql
+        assert prefix_params["query"] == "yu\\_%"
+    
+    @pytest.mark.asyncio
+    async def test_postgresql_concurrent_searches_coalesced(self, postgresql_config):
+        """Test concurrent identical PostgreSQL searches share one round trip"""
+        connector = PostgreSQLConnector(postgresql_config)
+        calls = 0
+        
+        async def query_products(query, filters, limit, offset, fields):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return [{"product_id": "P1"}]
+        
+        connector._query_products = query_products
+        
+        results = await asyncio.gather(*[
+            connector._search_products_structured("fund", {"risk_level": "low"}, 10, 0)
+            for _ in range(5)
+        ])
+        
+        assert calls == 1
+        assert all(r == [{"product_id": "P1"}] for r in results)
+        assert connector._search_inflight == {}
+    
+    @pytest.mark.asyncio
+    async def test_postgresql_search_invalidated_in_flight(self, postgresql_config):
+        """Test a write during an in-flight search keeps its stale page out of the cache"""
+        connector = PostgreSQLConnector(postgresql_config)
+        pages = iter([[{"product_id": "stale"}], [{"product_id": "fresh"}]])
+        
+        async def query_products(query, filters, limit, offset, fields):
+            page = next(pages)
+            await asyncio.sleep(0.01)
+            return page
+        
+        connector._query_products = query_products
+        
+        leader = asyncio.ensure_future(
+            connector._search_products_structured("fund", {}, 10, 0)
+        )
+        await asyncio.sleep(0)
+        connector._invalidate_search_cache()
+        follower = await connector._search_products_structured("fund", {}, 10, 0)
+        
+        assert await leader == [{"product_id": "stale"}]
+        assert follower == [{"product_id": "fresh"}]
+        assert await connector._search_products_structured("fund", {}, 10, 0) == follower
+        assert connector._search_inflight == {}
+    
+    @pytest.mark.asyncio
+    async def test_postgresql_iter_products_streams_cursor(self, postgresql_config):
+        """Test product streaming binds the search filters and reads rows through a cursor"""
+        import contextlib
+        
+        connector = PostgreSQLConnector(postgresql_config)
+        rows = [{"product_id": f"P{i}"} for i in range(5)]
+        calls = {}
+        
+        class FakeConnection:
+            @contextlib.asynccontextmanager
+            async def transaction(self):
+                calls["in_transaction"] = True
+                try:
+                    yield
+                finally:
+                    calls["in_transaction"] = False
+            
+            async def cursor(self, sql, *args, prefetch):
+                calls.update(sql=sql, args=args, prefetch=prefetch)
+                for row in rows:
+                    assert calls["in_transaction"]
+                    yield row
+        
+        class FakePool:
+            @contextlib.asynccontextmanager
+            async def acquire(self):
+                yield FakeConnection()
+        
+        connector._pool = FakePool()
+        connector._connected = True
+        
+        streamed = [
+            row async for row in connector.iter_products(
+                "fund", {"risk_level": "low", "max_investment": 5000.0}, fields="summary", prefetch=2
+            )
+        ]
+        
+        assert streamed == rows
+        assert calls["prefetch"] == 2
+        assert calls["args"] == ("%fund%", "low", 5000.0, None, 0)
+        assert "(name ILIKE $1 OR description ILIKE $1)" in calls["sql"]
+        assert "risk_level = $2" in calls["sql"] and "minimum_investment <= $3" in calls["sql"]
+        assert "LIMIT $4 OFFSET $5" in calls["sql"]
+        assert "description," not in calls["sql"]
+        assert not calls["in_transaction"]
+        
+        # A consumer that stops early and closes the stream releases the cursor's transaction
+        stream = connector.iter_query("SELECT product_id FROM financial_products WHERE type = :type", {"type": "etf"})
+        async with contextlib.aclosing(stream):
+            async for row in stream:
+                assert calls["in_transaction"]
+                break
+        assert not calls["in_transaction"]
+        assert calls["args"] == ("etf",) and calls["prefetch"] == 500
+    
+    @pytest.mark.asyncio
+    async def test_postgresql_create_tables_raises_on_failed_ddl(self, postgresql_config):
+        """Test a failing DDL statement fails table creation instead of being logged and skipped"""
+        import contextlib
+        
+        connector = PostgreSQLConnector(postgresql_config)
+        executed = []
+        
+        class FakeConnection:
+            async def execute(self, statement):
+                if "pg_trgm" in statement:
+                    raise RuntimeError("permission denied to create extension")
+                executed.append(statement)
+        
+        class FakePool:
+            @contextlib.asynccontextmanager
+            async def acquire(self):
+                yield FakeConnection()
+        
+        connector._pool = FakePool()
+        connector._connected = True
+        
+        with pytest.raises(RuntimeError, match="permission denied"):
+            await connector.create_tables()
+        
+        assert not any("CREATE INDEX" in statement for statement in executed)
+    
+    def test_neo4j_search_escapes_lucene_syntax(self, neo4j_config):
+        """Test Neo4j fulltext queries match operator words and symbols literally"""
+        connector = Neo4jConnector(neo4j_config)
+        
+        shape, params = connector._search_params("stocks AND NOT bonds", {}, 10, 0)
+        _, symbol_params = connector._search_params("S&P 500 (ETF)", {}, 10, 0)
+        
+        assert "query" in shape
+        assert params["query"] == "stocks and not bonds"
+        assert symbol_params["query"] == "S\\&P 500 \\(ETF\\)"
+    
+    def test_neo4j_product_columns_write_utc_datetimes(self):
+        """Test product timestamps are written as UTC-aware datetimes, never LocalDateTime"""
+        product = FinancialProduct(
+            product_id="TS_001", name="Timestamp Fund", type="etf", risk_level="low",
+            description="desc", issuer="issuer", inception_date=datetime(2020, 1, 1),
+            expected_return="3%", volatility=0.05, sharpe_ratio=0.6,
+            minimum_investment=100.0, expense_ratio=0.003, dividend_yield=0.02,
+            regulatory_status="approved", compliance_requirements=["SEC"],
+            tags=["bonds"], categories=["fixed_income"], embedding_id=None,
+            created_at=datetime(2024, 1, 1, 12, 0),
+            updated_at=datetime(2024, 1, 1, 20, 0, tzinfo=timezone(timedelta(hours=8)))
+        )
+        
+        columns = Neo4jConnector._product_columns([product])
+        
+        assert columns["created_at"] == [datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)]
+        assert columns["updated_at"] == [datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)]
+        assert all(value.tzinfo is timezone.utc for value in columns["created_at"] + columns["updated_at"])
+    
+    @pytest.mark.asyncio
+    async def test_neo4j_iter_products_prefetches_pages(self, neo4j_config):
+        """Test Neo4j product iteration pages through results and cancels its prefetch on close"""
+        import contextlib
+        
+        connector = Neo4jConnector(neo4j_config)
+        products = [{"product_id": f"P{i}"} for i in range(250)]
+        offsets = []
+        prefetch_delay = 0
+        cancelled = asyncio.Event()
+        
+        async def search(query, filters, limit, offset):
+            offsets.append(offset)
+            try:
+                await asyncio.sleep(prefetch_delay if offset else 0)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return products[offset:offset + limit]
+        
+        connector._search_products_structured = search
+        
+        streamed = [product async for product in connector.iter_products("fund", {}, page_size=100)]
+        assert streamed == products
+        assert offsets == [0, 100, 200]
+        
+        # Closing early cancels the page requested ahead of the consumer
+        offsets.clear()
+        prefetch_delay = 10
+        stream = connector.iter_products("fund", {}, page_size=100)
+        async with contextlib.aclosing(stream):
+            async for product in stream:
+                await asyncio.sleep(0)  # Let the prefetch start
+                break
+        await asyncio.wait_for(cancelled.wait(), 1)
+        assert offsets == [0, 100]
 
 
 class TestDataManager:
@@ -156,6 +368,131 @@ class TestDataManager:
         assert "chromadb" in health["sources"]
         assert "neo4j" in health["sources"]
     
+    @pytest.mark.asyncio
+    async def test_data_manager_pool_defaults(self, data_manager_config):
+        """Test data manager injects pool sizes suited to concurrent queries"""
+        data_manager_config["neo4j"]["max_connection_pool_size"] = 200
+        manager = DataManager(data_manager_config)
+        
+        postgres_config = manager._connectors[DataSourceType.POSTGRESQL].config
+        assert postgres_config["min_size"] >= 5
+        assert postgres_config["max_size"] >= 20
+        assert postgres_config["max_queries"] == PostgreSQLConnector.POOL_DEFAULTS["max_queries"]
+        
+        neo4j_config = manager._connectors[DataSourceType.NEO4J].config
+        assert neo4j_config["max_connection_pool_size"] == 200
+    
+    @pytest.mark.asyncio
+    async def test_schema_setup_migrates_neo4j_timestamps(self):
+        """Test schema setup converts legacy Neo4j timestamps after creating the graph schema"""
+        from src.data_sources.neo4j_connector import _TEMPORAL_MIGRATION_STATEMENTS
+        
+        manager = DataManager({"neo4j": {"uri": "bolt://localhost:7687"}})
+        connector = manager._connectors[DataSourceType.NEO4J]
+        transactions = []
+        
+        class FakeTransaction:
+            def __init__(self):
+                self.statements = []
+                transactions.append(self.statements)
+            
+            async def run(self, statement, *args):
+                self.statements.append(statement)
+        
+        class FakeSession:
+            async def __aenter__(self):
+                return self
+            
+            async def __aexit__(self, *exc_info):
+                return False
+            
+            async def execute_write(self, work, *args):
+                return await work(FakeTransaction(), *args)
+        
+        connector._driver = Mock(session=Mock(return_value=FakeSession()))
+        connector._connected = True
+        
+        await manager._create_schemas()
+        
+        # Schema changes and data writes cannot share a Neo4j transaction
+        schema, migration = transactions
+        assert any(statement.startswith("CREATE CONSTRAINT") for statement in schema)
+        assert migration == _TEMPORAL_MIGRATION_STATEMENTS
+    
+    @pytest.mark.asyncio
+    async def test_bulk_product_validation(self):
+        """Test bulk product validation through the process pool"""
+        manager = DataManager({})
+        now = datetime.now(timezone.utc)
+        raw_products = [
+            {
+                "product_id": f"BULK_{i}", "name": f"Bulk Fund {i}", "type": "etf",
+                "risk_level": "low", "description": "desc", "issuer": "issuer",
+                "inception_date": now, "expected_return": "3%", "volatility": 0.05,
+                "sharpe_ratio": 0.6, "minimum_investment": 100.0, "expense_ratio": 0.003,
+                "dividend_yield": 0.02, "regulatory_status": "approved",
+                "compliance_requirements": ["SEC"], "tags": ["bonds"],
+                "categories": ["fixed_income"], "embedding_id": None
+            }
+            for i in range(300)
+        ]
+        
+        try:
+            products = await manager.add_products_to_all_sources(raw_products)
+        finally:
+            await manager.stop()
+        
+        assert len(products) == 300
+        assert all(isinstance(p, FinancialProduct) for p in products)
+        assert products[-1].product_id == "BULK_299"
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_searches_single_flight(self):
+        """Test concurrent identical searches share one backend call"""
+        class CountingConnector:
+            def __init__(self):
+                self.calls = 0
+            
+            async def search_products(self, query, filters, limit, offset):
+                self.calls += 1
+                await asyncio.sleep(0.01)
+                return []
+        
+        manager = DataManager({})
+        connector = CountingConnector()
+        manager._connectors[DataSourceType.POSTGRESQL] = connector
+        
+        results = await asyncio.gather(*[
+            manager.search_products(query="fund", query_types=[QueryType.STRUCTURED])
+            for _ in range(5)
+        ])
+        
+        assert connector.calls == 1
+        assert all(r == [] for r in results)
+        assert manager._inflight == {}
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_search_leader_keeps_followers(self):
+        """Test cancelling the first of identical searches leaves the others running"""
+        class SlowConnector:
+            async def search_products(self, query, filters, limit, offset):
+                await asyncio.sleep(0.02)
+                return []
+        
+        manager = DataManager({})
+        manager._connectors[DataSourceType.POSTGRESQL] = SlowConnector()
+        
+        search = lambda: manager.search_products(query="fund", query_types=[QueryType.STRUCTURED])
+        leader = asyncio.ensure_future(search())
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(search())
+        await asyncio.sleep(0)
+        leader.cancel()
+        
+        assert await follower == []
+        assert leader.cancelled()
+        assert manager._inflight == {}
+    
     @pytest.mark.asyncio
     async def test_data_manager_fusion_strategies(self, data_manager_config):
         """Test data manager fusion strategies"""
@@ -382,6 +719,108 @@ class TestDataFusion:
         assert DataSourceType.CHROMADB in all_results
 
 
+
+class TestMockDataManager:
+    """Test mock data manager lookups"""
+    
+    @pytest.mark.asyncio
+    async def test_search_filters(self):
+        """Test indexed filters, text search and pagination"""
+        manager = MockDataManager()
+        
+        low_risk = await manager.search_products(filters={"risk_level": RiskLevel.LOW})
+        assert [p.product_id for p in low_risk] == ["MF_003", "ETF_002", "BOND_001"]
+        
+        medium_etfs = await manager.search_products(filters={"risk_level": "medium", "type": ProductType.ETF})
+        assert [p.product_id for p in medium_etfs] == ["ETF_001"]
+        
+        affordable = await manager.search_products(filters={"min_investment": 1000.0, "max_investment": 3000.0})
+        assert [p.product_id for p in affordable] == ["MF_002", "MF_003", "BOND_001", "RET_001"]
+        
+        income = await manager.search_products(query="Income", filters={"max_investment": 2000.0})
+        assert [p.product_id for p in income] == ["MF_003", "ETF_002", "BOND_001"]
+        
+        page = await manager.search_products(limit=2, offset=1)
+        assert [p.product_id for p in page] == ["MF_002", "MF_003"]
+    
+    @pytest.mark.asyncio
+    async def test_added_product_is_searchable(self):
+        """Test that added products are visible to indexed and cached searches"""
+        manager = MockDataManager()
+        template = (await manager.search_products(limit=1))[0]
+        product = template.model_copy(update={"product_id": "NEW_001", "minimum_investment": 50.0})
+        assert await manager.search_products(filters={"max_investment": 50.0}) == []
+        
+        await manager.add_product_to_all_sources(product)
+        
+        results = await manager.search_products(filters={"max_investment": 50.0})
+        assert [p.product_id for p in results] == ["NEW_001"]
+    
+    @pytest.mark.asyncio
+    async def test_offloaded_search_racing_an_add(self):
+        """Test a worker-thread search finishing after an add cannot cache stale matches"""
+        from unittest.mock import patch
+        from src.data_sources import mock_data_manager
+        
+        manager = MockDataManager()
+        template = (await manager.search_products(limit=1))[0]
+        while len(manager._mock_products) < mock_data_manager._OFFLOAD_THRESHOLD:
+            manager.add_product_to_all_sources_sync(
+                template.model_copy(update={"product_id": f"PAD_{len(manager._mock_products)}"})
+            )
+        new_product = template.model_copy(update={"product_id": "NEW_001", "name": "Zephyr Growth Fund"})
+        
+        real_trigrams = mock_data_manager._trigrams
+        
+        def trigrams_then_add(text):
+            # The product is added while the offloaded search is matching the query
+            if text == "zephyr" and new_product not in manager._mock_products:
+                manager.add_product_to_all_sources_sync(new_product)
+            return real_trigrams(text)
+        
+        with patch.object(mock_data_manager, "_trigrams", trigrams_then_add):
+            assert await manager.search_products(query="zephyr") == []
+        
+        results = await manager.search_products(query="zephyr")
+        assert [p.product_id for p in results] == ["NEW_001"]
+    
+    def test_filter_mask_kernel_matches_numpy(self):
+        """Test the (numba when installed) mask kernel and the numpy path agree on the catalog"""
+        import itertools
+        import numpy as np
+        from src.data_sources import mock_data_manager
+        
+        columns = MockDataManager()._ensure_product_indexes().columns
+        positions = np.arange(len(columns["type"]))
+        risk_codes = [mock_data_manager._NO_FILTER, *mock_data_manager._RISK_CODES.values()]
+        type_codes = [mock_data_manager._NO_FILTER, *mock_data_manager._TYPE_CODES.values()]
+        ranges = [(-np.inf, np.inf), (1000.0, 3000.0), (0.0, 500.0)]
+        
+        for risk_code, type_code, (low, high) in itertools.product(risk_codes, type_codes, ranges):
+            args = (columns["risk_level"], columns["type"], columns["minimum_investment"],
+                    positions, risk_code, type_code, low, high)
+            kernel_mask = np.empty(len(positions), dtype=bool)
+            mock_data_manager._filter_mask_kernel(*args, kernel_mask)
+            
+            assert np.array_equal(kernel_mask, mock_data_manager._filter_mask_numpy(*args))
+    
+    @pytest.mark.asyncio
+    async def test_graph_lookups(self):
+        """Test indexed graph node and relationship lookups"""
+        manager = MockDataManager()
+        
+        sectors = await manager.get_graph_nodes(node_type="sector")
+        assert [n.node_id for n in sectors] == ["node_002"]
+        assert len(await manager.get_graph_nodes(limit=2)) == 2
+        
+        outgoing = await manager.get_graph_relationships(source_node_id="node_001")
+        assert [r.relationship_id for r in outgoing] == ["rel_001", "rel_002"]
+        
+        supports = await manager.get_graph_relationships(source_node_id="node_001", relationship_type="supports")
+        assert [r.relationship_id for r in supports] == ["rel_002"]
+        
+        assert await manager.get_graph_relationships(target_node_id="node_002", relationship_type="supports") == []
+
 if __name__ == "__main__":
     # Run data sources integration tests
     pytest.main([__file__, "-v"]) 
\ No newline at end of file
@@ -191,6 +191,38 @@ ENTITIES: Test Fund""",
         assert "investment" in intent.keywords
         assert "fund" in intent.keywords
     
+    @pytest.mark.asyncio
+    async def test_intent_analysis_json_response(self, mock_llm_provider):
+        """Test structured JSON responses validate directly into the intent"""
+        mock_llm_provider.generate_response.return_value = LLMResponse(
+            content="""```json
+{"intent_type": "product_comparison", "confidence": 0.9, "risk_tolerance": null,
+ "investment_goals": ["education"], "preferred_product_types": ["etf", "bond"],
+ "budget_range": {"max": 20000}, "keywords": ["compare"], "entities": {}}
+```""",
+            model="test-model",
+            provider="test-provider"
+        )
+        
+        analyzer = IntentAnalyzer(mock_llm_provider)
+        intent = await analyzer.analyze_intent("Compare ETFs and bonds for education savings")
+        
+        assert intent.intent_type == IntentType.PRODUCT_COMPARISON
+        assert intent.investment_goals == [InvestmentGoal.EDUCATION]
+        assert intent.preferred_product_types == ["etf", "bond"]
+        assert intent.budget_range == {"max": 20000.0}
+        
+        # Invalid structured output falls back to basic keywords
+        mock_llm_provider.generate_response.return_value = LLMResponse(
+            content='{"intent_type": "buy_everything", "confidence": 2}',
+            model="test-model",
+            provider="test-provider"
+        )
+        intent = await analyzer.analyze_intent("Which bond is safe?")
+        
+        assert intent.intent_type == IntentType.UNKNOWN
+        assert intent.keywords == ["bond", "safe"]
+    
     @pytest.mark.asyncio
     async def test_intent_analysis_failure(self, mock_llm_provider):
         """Test intent analysis when LLM fails"""
@@ -205,6 +237,80 @@ ENTITIES: Test Fund""",
         assert "fund" in intent.keywords  # Should extract 'fund' from 'mutual funds'
         assert "retirement" in intent.keywords  # Should extract 'retirement'
     
+    @pytest.mark.asyncio
+    async def test_intent_semantic_cache(self, mock_llm_provider):
+        """Test paraphrased queries reuse a cached intent"""
+        mock_llm_provider.generate_response.return_value = LLMResponse(
+            content="INTENT_TYPE: product_recommendation\nCONFIDENCE: 0.9\nRISK_TOLERANCE: low",
+            model="test-model",
+            provider="test-provider"
+        )
+        
+        async def embed(text):
+            return [1.0, 0.0, 0.01] if "safe" in text else [1.0, 0.02, 0.0]
+        
+        analyzer = IntentAnalyzer(mock_llm_provider, embedder=embed)
+        first = await analyzer.analyze_intent("I want a safe fund")
+        second = await analyzer.analyze_intent("Give me a conservative fund")
+        
+        assert mock_llm_provider.generate_response.call_count == 1
+        assert second == first
+        assert second is not first
+        
+        # Another user's paraphrase does not reuse this user's intent
+        await analyzer.analyze_intent("Give me a conservative fund", {"user_id": "u2"})
+        assert mock_llm_provider.generate_response.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_intent_exact_cache(self, mock_llm_provider):
+        """Test identical queries are answered without another LLM call"""
+        mock_llm_provider.generate_response.return_value = LLMResponse(
+            content="INTENT_TYPE: risk_assessment\nCONFIDENCE: 0.7",
+            model="test-model",
+            provider="test-provider"
+        )
+        
+        analyzer = IntentAnalyzer(mock_llm_provider)
+        first = await analyzer.analyze_intent("How risky is this ETF?")
+        second = await analyzer.analyze_intent("  how risky is this etf?")
+        other = await analyzer.analyze_intent("How risky is this ETF?", {"user_id": "u2"})
+        
+        assert mock_llm_provider.generate_response.call_count == 2
+        assert second == first
+        assert other.intent_type == IntentType.RISK_ASSESSMENT
+        
+        # Callers mutating a returned intent's lists do not corrupt the cache
+        first.keywords.append("mutated")
+        third = await analyzer.analyze_intent("How risky is this ETF?")
+        assert "mutated" not in third.keywords
+    
+    @pytest.mark.asyncio
+    async def test_intent_batch_analysis(self, mock_llm_provider):
+        """Test batch analysis bounds concurrent LLM calls and keeps query order"""
+        in_flight = 0
+        peak = 0
+        
+        async def generate_response(prompt, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            intent = "portfolio_review" if 'portfolio"' in prompt else "product_recommendation"
+            return LLMResponse(content=f"INTENT_TYPE: {intent}\nCONFIDENCE: 0.8", model="m", provider="p")
+        
+        mock_llm_provider.generate_response.side_effect = generate_response
+        
+        analyzer = IntentAnalyzer(mock_llm_provider)
+        queries = ["review my portfolio", "find a bond fund", "check portfolio", "best ETF", "cheap fund"]
+        intents = await analyzer.analyze_intent_batch(queries, concurrency=2)
+        
+        assert peak == 2
+        assert [i.intent_type for i in intents] == [
+            IntentType.PORTFOLIO_REVIEW, IntentType.PRODUCT_RECOMMENDATION, IntentType.PORTFOLIO_REVIEW,
+            IntentType.PRODUCT_RECOMMENDATION, IntentType.PRODUCT_RECOMMENDATION
+        ]
+    
     @pytest.mark.asyncio
     async def test_intent_validation(self, mock_llm_provider):
         """Test intent validation"""
@@ -438,6 +544,9 @@ class TestLLMManager:
             assert manager.fallback_provider is not None
             assert manager.intent_analyzer is not None
             assert manager.response_generator is not None
+            # Queries are embedded with OpenAI for the semantic intent cache
+            assert manager.intent_analyzer.embedder == manager.fallback_provider.embed
+            assert manager.intent_analyzer.semantic_cache is not None
     
     @pytest.mark.asyncio
     async def test_llm_manager_initialization_failure(self, llm_config):
@@ -562,6 +671,93 @@ class TestLLMManager:
                         assert "intent" in result
                         assert "recommendation" in result
                         assert "health" in result
+    
+    @pytest.mark.asyncio
+    async def test_hedged_intent_analysis_uses_faster_fallback(self, llm_config):
+        """Test a slow primary is raced against the fallback after the hedge delay"""
+        llm_config.hedge_delay_seconds = 0.01
+        manager = LLMManager(llm_config)
+        manager.primary_provider = Mock()
+        manager.fallback_provider = Mock()
+        primary_cancelled = asyncio.Event()
+        
+        async def slow_analysis(query, context):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                primary_cancelled.set()
+                raise
+        
+        manager.intent_analyzer = Mock(analyze_intent=slow_analysis)
+        fallback_intent = ExtractedIntent(intent_type=IntentType.RISK_ASSESSMENT, confidence=0.8)
+        
+        with patch('src.llm.manager.IntentAnalyzer') as mock_analyzer:
+            mock_analyzer.return_value.analyze_intent = AsyncMock(return_value=fallback_intent)
+            intent = await asyncio.wait_for(manager._analyze_intent_with_fallback("Is this fund risky?"), 1)
+        
+        assert intent is fallback_intent
+        await asyncio.wait_for(primary_cancelled.wait(), 1)
+    
+    @pytest.mark.asyncio
+    async def test_hedged_intent_analysis_ignores_failed_fallback(self, llm_config):
+        """Test a fallback that fails fast does not beat a slower healthy primary"""
+        llm_config.hedge_delay_seconds = 0.01
+        manager = LLMManager(llm_config)
+        manager.primary_provider = Mock()
+        manager.fallback_provider = Mock()
+        primary_intent = ExtractedIntent(intent_type=IntentType.RISK_ASSESSMENT, confidence=0.8)
+        
+        async def slow_analysis(query, context):
+            await asyncio.sleep(0.05)
+            return primary_intent
+        
+        manager.intent_analyzer = Mock(analyze_intent=slow_analysis)
+        failed_intent = ExtractedIntent(intent_type=IntentType.UNKNOWN, confidence=0.0)
+        
+        with patch('src.llm.manager.IntentAnalyzer') as mock_analyzer:
+            mock_analyzer.return_value.analyze_intent = AsyncMock(return_value=failed_intent)
+            intent = await asyncio.wait_for(manager._analyze_intent_with_fallback("Is this fund risky?"), 1)
+        
+        assert intent is primary_intent
+        assert mock_analyzer.return_value.analyze_intent.await_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_hedged_call_cancels_primary_with_caller(self, llm_config):
+        """Test cancelling a hedged call before the hedge delay also cancels the primary"""
+        llm_config.hedge_delay_seconds = 10
+        manager = LLMManager(llm_config)
+        primary_cancelled = asyncio.Event()
+        
+        async def slow_call():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                primary_cancelled.set()
+                raise
+        
+        call = asyncio.ensure_future(manager._run_hedged(slow_call(), slow_call, lambda _: False))
+        await asyncio.sleep(0.01)
+        call.cancel()
+        
+        await asyncio.wait_for(primary_cancelled.wait(), 1)
+        assert call.cancelled()
+    
+    @pytest.mark.asyncio
+    async def test_intent_cache_reuses_analysis(self, llm_config):
+        """Test repeated queries reuse the cached intent until the cache is cleared"""
+        manager = LLMManager(llm_config)
+        manager.primary_provider = Mock()
+        intent = ExtractedIntent(intent_type=IntentType.PRODUCT_RECOMMENDATION, confidence=0.9)
+        manager.intent_analyzer = Mock(analyze_intent=AsyncMock(return_value=intent))
+        
+        first = await manager._analyze_intent_with_fallback("Recommend an ETF")
+        second = await manager._analyze_intent_with_fallback("  recommend an etf ")
+        assert first.intent_type == second.intent_type == IntentType.PRODUCT_RECOMMENDATION
+        assert manager.intent_analyzer.analyze_intent.await_count == 1
+        
+        manager.clear_intent_cache()
+        await manager._analyze_intent_with_fallback("Recommend an ETF")
+        assert manager.intent_analyzer.analyze_intent.await_count == 2
 
 
 class TestLLMIntegration:
@@ -612,4 +808,98 @@ class TestLLMIntegration:
                         
                         assert result.content == "I recommend the Test Mutual Fund for your retirement goals."
                         assert result.confidence == 0.9
-                        assert result.intent_type == IntentType.PRODUCT_RECOMMENDATION 
\ No newline at end of file
+                        assert result.intent_type == IntentType.PRODUCT_RECOMMENDATION 
+
+class TestCrewAIManager:
+    """Test CrewAI manager helpers"""
+    
+    def test_breaker_opens_and_recovers(self):
+        """Test the breaker trips on outages and closes after a successful probe"""
+        from src.llm.crewai_manager import _CircuitBreaker, _is_outage_error
+        
+        assert _is_outage_error("Error code: 529 - overloaded_error")
+        assert not _is_outage_error("401 invalid x-api-key")
+        
+        breaker = _CircuitBreaker(failure_threshold=2, recovery_timeout=0.0)
+        breaker.record_failure()
+        assert breaker.state == _CircuitBreaker.CLOSED
+        breaker.record_failure()
+        assert breaker.state == _CircuitBreaker.OPEN
+        
+        # Half-open admits exactly one probe
+        assert breaker.allow_request()
+        assert breaker.state == _CircuitBreaker.HALF_OPEN
+        breaker.recovery_timeout = 60.0
+        assert not breaker.allow_request()
+        
+        breaker.record_success()
+        assert breaker.state == _CircuitBreaker.CLOSED
+        assert breaker.allow_request()
+    
+    @pytest.mark.asyncio
+    async def test_process_batch_resumes_from_checkpoint(self, tmp_path):
+        """Test batch processing skips queries already in the JSONL checkpoint"""
+        import json
+        from src.llm.crewai_manager import CrewAIManager
+        
+        manager = CrewAIManager.__new__(CrewAIManager)
+        processed = []
+        
+        async def process_query(query, user_profile=None):
+            processed.append(query)
+            return {"query": query, "response": f"answer to {query}"}
+        
+        manager.process_query_with_crewai = process_query
+        output = tmp_path / "results.jsonl"
+        
+        assert await manager.process_batch(["q1", "q2"], str(output)) == 2
+        with open(output, "a") as f:
+            f.write('{"query_hash": "trunc')  # interrupted write
+        assert await manager.process_batch(["q1", "q2", "q3", "q3"], str(output)) == 1
+        
+        assert processed == ["q1", "q2", "q3"]
+        lines = output.read_text().splitlines()
+        assert json.loads(lines[-1])["query"] == "q3"
+        assert {json.loads(line)["query"] for line in lines[:2]} == {"q1", "q2"}
+    
+    def test_orchestrator_created_on_first_use(self):
+        """Test the crew orchestrator is only built when CrewAI is used"""
+        from src.llm.crewai_manager import CrewAIManager
+        
+        with patch('src.llm.crewai_manager.FinancialCrewOrchestrator') as mock_orchestrator:
+            mock_orchestrator.return_value.agents = {"market_data": Mock()}
+            manager = CrewAIManager(Mock(primary_provider=None))
+            
+            status = manager.get_crew_status()
+            assert not status["orchestrator_initialized"]
+            mock_orchestrator.assert_not_called()
+            
+            assert manager.crew_orchestrator is manager.crew_orchestrator
+            mock_orchestrator.assert_called_once_with("anthropic")
+            assert len(manager._agents_list) == 1
+    
+    @pytest.mark.asyncio
+    async def test_batch_runs_queue_for_crew_without_timeouts(self, tmp_path):
+        """Test batch items waiting for the shared crew neither time out nor trip the breaker"""
+        import time
+        from src.llm.crewai_manager import CrewAIManager, _CircuitBreaker
+        
+        manager = CrewAIManager(Mock(primary_provider=None))
+        manager._crew_timeout = 0.3
+        running = []
+        
+        def process_financial_query(user_query, user_profile, conversation_history):
+            running.append(user_query)
+            assert len(running) == 1, "crew runs overlapped"
+            time.sleep(0.1)
+            running.remove(user_query)
+            return {"success": True}
+        
+        manager._orchestrator = Mock(process_financial_query=process_financial_query)
+        manager._format_crewai_result = lambda crew_result, query: {"query": query, "source": "crewai"}
+        manager._fallback_to_llm_manager = AsyncMock(side_effect=AssertionError("fell back"))
+        
+        queries = [f"q{i}" for i in range(5)]
+        assert await manager.process_batch(queries, str(tmp_path / "out.jsonl"), concurrency=5) == 5
+        assert manager._breaker.state == _CircuitBreaker.CLOSED
+        manager._fallback_to_llm_manager.assert_not_awaited()